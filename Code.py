@@ -1,17 +1,26 @@
 import os
-import json
-import base64
+import sys
+
+from scaffold import Collector, DryRunEmitter, Emitter, make_backend, select_paths
+import templatepack
+from templating import Compiler, template_defaults
+
+# Emitter used by create_file while collect_templates() runs
+_emitter = None
 
 def create_file(path, content):
     """Create a file with the given content."""
+    if _emitter is not None:
+        _emitter.emit(path, content)
+        return
     dir_name = os.path.dirname(path)
     if dir_name:
         os.makedirs(dir_name, exist_ok=True)
     with open(path, 'w', encoding='utf-8') as f:
         f.write(content)
 
-def create_project():
-    """Create the complete React academy project structure."""
+def write_templates():
+    """Emit every project template through create_file."""
     
     # Package.json
     create_file('package.json', '''{
@@ -223,7 +232,15 @@ npm run dev
 
 ### Supabase Setup
 
-Run the SQL script provided in `supabase-setup.sql` in your Supabase SQL editor to create all necessary tables and policies.
+The database schema lives in numbered migrations under `supabase/migrations/`. Apply them in order with `supabase db push`, or run each file in your Supabase SQL editor, to create all necessary tables and policies.
+
+The admin dashboard reads its statistics from the `admin_daily_stats` materialized view, which `pg_cron` refreshes every 10 minutes. Enable the pg_cron extension (Database > Extensions) before applying `0010_dashboard_stats.sql`.
+
+To upgrade a database created from an older version of the templates, generate only the statements that changed (indexes are built with `CREATE INDEX CONCURRENTLY`, so hot tables stay writable) and run the result with psql:
+```bash
+python schema.py diff old-workspace . -o upgrade.sql
+psql "$DATABASE_URL" -f upgrade.sql
+```
 
 ### Deployment to Vercel
 
@@ -940,6 +957,25 @@ export interface AdminLog {
   details?: any
   created_at: string
   admin?: User
+}
+
+export interface DashboardStatsDay {
+  day: string
+  users: number
+  books: number
+  courses: number
+  transactions: number
+  revenue: number
+}
+
+export interface DashboardStats {
+  users: number
+  books: number
+  courses: number
+  transactions: number
+  revenue: number
+  refreshed_at: string | null
+  series: DashboardStatsDay[]
 }''')
 
     # Create styles
@@ -1206,19 +1242,80 @@ export const deleteFile = async (bucket: string, path: string) => {
 }''')
 
     # API services
+    create_file('src/services/api/pagination.ts', '''// Keyset pagination: every list is ordered newest first by (column, id) and
+// each page starts strictly after the last row of the previous one, so
+// Postgres reads one page from a composite index instead of the whole table.
+
+export const PAGE_SIZE = 20
+
+// Position of the last row on a page
+export interface Cursor {
+  value: string
+  id: string
+}
+
+export interface Page<T> {
+  items: T[]
+  nextCursor: Cursor | null
+}
+
+// PostgREST filter for rows after cursor in descending (column, id) order
+export const afterCursor = (cursor: Cursor, column = 'created_at') =>
+  `${column}.lt."${cursor.value}",and(${column}.eq."${cursor.value}",id.lt.${cursor.id})`
+
+// Orders query newest first, skips to cursor and fetches one extra row to
+// find out whether another page follows
+export const seek = (
+  query: any,
+  cursor: Cursor | null,
+  limit: number,
+  column = 'created_at'
+) => {
+  const after = cursor ? query.or(afterCursor(cursor, column)) : query
+  return after
+    .order(column, { ascending: false })
+    .order('id', { ascending: false })
+    .limit(limit + 1)
+}
+
+// Drops the extra row fetched by seek and points nextCursor at the last item
+export const toPage = <T extends { id: string }>(
+  rows: T[],
+  limit: number,
+  column = 'created_at'
+): Page<T> => {
+  const items = rows.slice(0, limit)
+  const last = items[items.length - 1]
+  return {
+    items,
+    nextCursor: rows.length > limit && last
+      ? { value: (last as any)[column], id: last.id }
+      : null
+  }
+}
+
+// Same order as seek, for merging pages fetched by separate queries.
+// PostgREST renders timestamps in UTC, so they compare correctly as strings.
+export const newestFirst = (column = 'created_at') => (a: any, b: any) => {
+  if (a[column] !== b[column]) return a[column] < b[column] ? 1 : -1
+  return a.id < b.id ? 1 : a.id > b.id ? -1 : 0
+}''')
+
     create_file('src/services/api/books.ts', '''import { supabase } from '../supabase'
 import { Book, BookOwnership } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const booksApi = {
-  // Get all books
-  async getAll() {
-    const { data, error } = await supabase
-      .from('books')
-      .select('*')
-      .order('created_at', { ascending: false })
+  // Get a page of books, newest first
+  async getAll(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('books').select('*'),
+      cursor,
+      limit
+    )
 
     if (error) throw error
-    return data as Book[]
+    return toPage(data as Book[], limit)
   },
 
   // Get single book
@@ -1233,13 +1330,10 @@ export const booksApi = {
     return data as Book
   },
 
-  // Search books
-  async search(query: string) {
+  // Search books, best matches first (search_books RPC, served by the full-text and trigram indexes)
+  async search(query: string, limit = 20) {
     const { data, error } = await supabase
-      .from('books')
-      .select('*')
-      .or(`title.ilike.%${query}%,description.ilike.%${query}%`)
-      .order('created_at', { ascending: false })
+      .rpc('search_books', { query, result_limit: limit })
 
     if (error) throw error
     return data as Book[]
@@ -1351,17 +1445,20 @@ export const booksApi = {
 
     create_file('src/services/api/courses.ts', '''import { supabase } from '../supabase'
 import { Course, CourseEnrollment } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const coursesApi = {
-  // Get all courses
-  async getAll() {
-    const { data, error } = await supabase
-      .from('courses')
-      .select('*')
-      .order('start_date', { ascending: false })
+  // Get a page of courses, latest start date first
+  async getAll(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('courses').select('*'),
+      cursor,
+      limit,
+      'start_date'
+    )
 
     if (error) throw error
-    return data as Course[]
+    return toPage(data as Course[], limit, 'start_date')
   },
 
   // Get single course
@@ -1499,6 +1596,7 @@ export const coursesApi = {
 
     create_file('src/services/api/users.ts', '''import { supabase } from '../supabase'
 import { User, Badge, UserBadge, Certificate, BlockedUser } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const usersApi = {
   // Get user profile
@@ -1654,12 +1752,29 @@ export const usersApi = {
     if (authError) throw authError
   },
 
-  // Admin: Get all users
-  async getAllUsers() {
+  // Admin: Get a page of users, newest first
+  async getAllUsers(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('users').select('*'),
+      cursor,
+      limit
+    )
+
+    if (error) throw error
+    return toPage(data as User[], limit)
+  },
+
+  // Find users whose username or email contains query
+  async searchUsers(query: string, limit = 10) {
+    // Escape LIKE wildcards, then quote the pattern for the PostgREST filter
+    const like = `%${query.replace(/[%_\\\\]/g, '\\\\$&')}%`
+    const pattern = `"${like.replace(/["\\\\]/g, '\\\\$&')}"`
     const { data, error } = await supabase
       .from('users')
       .select('*')
-      .order('created_at', { ascending: false })
+      .or(`username.ilike.${pattern},email.ilike.${pattern}`)
+      .order('username')
+      .limit(limit)
 
     if (error) throw error
     return data as User[]
@@ -1696,14 +1811,13 @@ export const usersApi = {
 import { Review, ReviewReply } from '@/types'
 
 export const reviewsApi = {
-  // Get book reviews
+  // Get book reviews; likes_count is maintained by triggers on review_likes
   async getBookReviews(bookId: string) {
     const { data, error } = await supabase
       .from('reviews')
       .select(`
         *,
-        user:users!reviews_user_id_fkey(id, username, avatar_url, is_banned),
-        likes:review_likes(user_id)
+        user:users!reviews_user_id_fkey(id, username, avatar_url, is_banned)
       `)
       .eq('book_id', bookId)
       .order('created_at', { ascending: false })
@@ -1713,14 +1827,25 @@ export const reviewsApi = {
     // Filter out reviews from banned users
     const filteredData = (data || []).filter(review => !review.user?.is_banned)
     
-    // Add likes count and user_has_liked
+    // Look up which of them the current user liked: at most one row per review
     const currentUser = await supabase.auth.getUser()
     const userId = currentUser.data.user?.id
+    const liked = new Set<string>()
+
+    if (userId && filteredData.length > 0) {
+      const { data: likes, error: likesError } = await supabase
+        .from('review_likes')
+        .select('review_id, review:reviews!inner(book_id)')
+        .eq('user_id', userId)
+        .eq('review.book_id', bookId)
+
+      if (likesError) throw likesError
+      for (const like of likes || []) liked.add(like.review_id)
+    }
 
     return filteredData.map(review => ({
       ...review,
-      likes_count: review.likes?.length || 0,
-      user_has_liked: userId ? review.likes?.some(like => like.user_id === userId) : false
+      user_has_liked: liked.has(review.id)
     })) as Review[]
   },
 
@@ -1822,22 +1947,36 @@ export const reviewsApi = {
 
     create_file('src/services/api/messages.ts', '''import { supabase } from '../supabase'
 import { Message } from '@/types'
+import { Cursor, PAGE_SIZE, newestFirst, seek, toPage } from './pagination'
 
 export const messagesApi = {
-  // Get user's messages
-  async getUserMessages(userId: string) {
-    const { data, error } = await supabase
-      .from('messages')
-      .select(`
-        *,
-        sender:users!messages_sender_id_fkey(id, username, avatar_url),
-        recipient:users!messages_recipient_id_fkey(id, username, avatar_url)
-      `)
-      .or(`sender_id.eq.${userId},recipient_id.eq.${userId}`)
-      .order('created_at', { ascending: false })
+  // Get a page of the user's sent and received messages, newest first
+  async getUserMessages(userId: string, cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const page = (column: string) => seek(
+      supabase
+        .from('messages')
+        .select(`
+          *,
+          sender:users!messages_sender_id_fkey(id, username, avatar_url),
+          recipient:users!messages_recipient_id_fkey(id, username, avatar_url)
+        `)
+        .eq(column, userId),
+      cursor,
+      limit
+    )
 
-    if (error) throw error
-    return data as Message[]
+    // Each side reads its own (user, created_at, id) index; the next page
+    // of the combined list is the head of the two pages merged
+    const [sent, received] = await Promise.all([page('sender_id'), page('recipient_id')])
+    if (sent.error) throw sent.error
+    if (received.error) throw received.error
+
+    // Messages to oneself come back from both sides
+    const rows = new Map<string, Message>()
+    for (const message of [...sent.data, ...received.data] as Message[]) {
+      rows.set(message.id, message)
+    }
+    return toPage([...rows.values()].sort(newestFirst()), limit)
   },
 
   // Get conversation
@@ -2067,7 +2206,8 @@ export const notificationsApi = {
 }''')
 
     create_file('src/services/api/admin.ts', '''import { supabase } from '../supabase'
-import { AdminLog } from '@/types'
+import { AdminLog, DashboardStats, Transaction } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const adminApi = {
   // Log admin action
@@ -2088,41 +2228,47 @@ export const adminApi = {
     return data as AdminLog
   },
 
-  // Get admin logs
-  async getLogs(limit = 100) {
-    const { data, error } = await supabase
-      .from('admin_logs')
-      .select(`
-        *,
-        admin:users(id, username)
-      `)
-      .order('created_at', { ascending: false })
-      .limit(limit)
+  // Get a page of admin logs, newest first
+  async getLogs(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase
+        .from('admin_logs')
+        .select(`
+          *,
+          admin:users(id, username)
+        `),
+      cursor,
+      limit
+    )
 
     if (error) throw error
-    return data as AdminLog[]
+    return toPage(data as AdminLog[], limit)
   },
 
-  // Get dashboard stats
-  async getDashboardStats() {
-    const [
-      { count: usersCount },
-      { count: booksCount },
-      { count: coursesCount },
-      { count: transactionsCount }
-    ] = await Promise.all([
-      supabase.from('users').select('*', { count: 'exact', head: true }),
-      supabase.from('books').select('*', { count: 'exact', head: true }),
-      supabase.from('courses').select('*', { count: 'exact', head: true }),
-      supabase.from('transactions').select('*', { count: 'exact', head: true })
-    ])
-
-    return {
-      users: usersCount || 0,
-      books: booksCount || 0,
-      courses: coursesCount || 0,
-      transactions: transactionsCount || 0
-    }
+  // Get a page of transactions with their buyers, newest first
+  async getTransactions(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase
+        .from('transactions')
+        .select(`
+          *,
+          user:users(id, username, email)
+        `),
+      cursor,
+      limit
+    )
+
+    if (error) throw error
+    return toPage(data as Transaction[], limit)
+  },
+
+  // Get dashboard totals and a daily series for the last `days` days in one
+  // call, read from the admin_daily_stats view rather than counting tables
+  async getDashboardStats(days = 30) {
+    const { data, error } = await supabase.rpc('get_dashboard_stats', { days })
+
+    if (error) throw error
+    return data as DashboardStats
   },
 
   // Badges management
@@ -3160,7 +3306,7 @@ const Footer: React.FC = () => {
         <Grid container spacing={4}>
           <Grid item xs={12} sm={4}>
             <Typography variant="h6" gutterBottom>
-              React Academy
+              {'React Academy'}
             </Typography>
             <Typography variant="body2" color="text.secondary">
               Your journey to knowledge starts here.
@@ -3203,7 +3349,7 @@ const Footer: React.FC = () => {
         </Grid>
         <Box mt={3}>
           <Typography variant="body2" color="text.secondary" align="center">
-            © {currentYear} React Academy. All rights reserved.
+            © {currentYear} {'React Academy'}. All rights reserved.
           </Typography>
         </Box>
       </Container>
@@ -3515,7 +3661,7 @@ const CourseCard: React.FC<CourseCardProps> = ({ course, enrollment: initialEnro
 
 export default CourseCard''')
 
-    create_file('src/components/GiftModal.tsx', '''import React, { useState, useEffect } from 'react'
+    create_file('src/components/GiftModal.tsx', '''import React, { useState } from 'react'
 import {
   Dialog,
   DialogTitle,
@@ -3523,9 +3669,7 @@ import {
   DialogActions,
   Button,
   TextField,
-  Autocomplete,
   Box,
-  Typography,
   Alert
 } from '@mui/material'
 import { useTranslation } from 'react-i18next'
@@ -3535,6 +3679,7 @@ import { booksApi } from '@/services/api/books'
 import { notificationsApi } from '@/services/api/notifications'
 import { useAuth } from '@/context/AuthContext'
 import { useNotification } from '@/context/NotificationContext'
+import UserSearchField from '@/components/UserSearchField'
 
 interface GiftModalProps {
   open: boolean
@@ -3546,31 +3691,11 @@ const GiftModal: React.FC<GiftModalProps> = ({ open, onClose, book }) => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [users, setUsers] = useState<User[]>([])
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
   const [message, setMessage] = useState('')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
 
-  useEffect(() => {
-    const fetchUsers = async () => {
-      try {
-        const allUsers = await usersApi.getAllUsers()
-        // Filter out current user and banned users
-        const filteredUsers = allUsers.filter(
-          u => u.id !== profile?.id && !u.is_banned
-        )
-        setUsers(filteredUsers)
-      } catch (err) {
-        console.error('Error fetching users:', err)
-      }
-    }
-
-    if (open) {
-      fetchUsers()
-    }
-  }, [open, profile])
-
   const handleSend = async () => {
     if (!selectedUser || !profile) return
 
@@ -3626,24 +3751,12 @@ const GiftModal: React.FC<GiftModalProps> = ({ open, onClose, book }) => {
         )}
 
         <Box sx={{ mt: 2 }}>
-          <Autocomplete
-            options={users}
-            getOptionLabel={(option) => option.username}
+          <UserSearchField
+            label="Select recipient"
             value={selectedUser}
-            onChange={(_, value) => setSelectedUser(value)}
-            renderInput={(params) => (
-              <TextField
-                {...params}
-                label="Select recipient"
-                required
-                fullWidth
-              />
-            )}
-            renderOption={(props, option) => (
-              <Box component="li" {...props}>
-                <Typography>{option.username}</Typography>
-              </Box>
-            )}
+            onChange={setSelectedUser}
+            exclude={u => u.id === profile?.id}
+            required
           />
 
           <TextField
@@ -3673,6 +3786,108 @@ const GiftModal: React.FC<GiftModalProps> = ({ open, onClose, book }) => {
 
 export default GiftModal''')
 
+    create_file('src/components/UserSearchField.tsx', '''import React, { useState, useEffect } from 'react'
+import {
+  Autocomplete,
+  TextField,
+  Box,
+  Typography,
+  CircularProgress,
+  SxProps,
+  Theme
+} from '@mui/material'
+import { User } from '@/types'
+import { usersApi } from '@/services/api/users'
+import { useDebounce } from '@/hooks/useDebounce'
+
+interface UserSearchFieldProps {
+  label: string
+  value: User | null
+  onChange: (user: User | null) => void
+  exclude?: (user: User) => boolean
+  required?: boolean
+  sx?: SxProps<Theme>
+}
+
+// Username picker that asks the server for matches as you type instead of
+// loading every user up front
+const UserSearchField: React.FC<UserSearchFieldProps> = ({
+  label,
+  value,
+  onChange,
+  exclude,
+  required,
+  sx
+}) => {
+  const [input, setInput] = useState('')
+  const [options, setOptions] = useState<User[]>([])
+  const [searching, setSearching] = useState(false)
+  const query = useDebounce(input.trim(), 300)
+
+  useEffect(() => {
+    if (!query) {
+      setOptions([])
+      setSearching(false)
+      return
+    }
+
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    setSearching(true)
+    usersApi.searchUsers(query)
+      .then(data => {
+        if (!cancelled) setOptions(data.filter(u => !u.is_banned))
+      })
+      .catch(error => console.error('Error searching users:', error))
+      .finally(() => {
+        if (!cancelled) setSearching(false)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [query])
+
+  return (
+    <Autocomplete
+      options={exclude ? options.filter(u => !exclude(u)) : options}
+      // The server already matched the options against the input
+      filterOptions={(x) => x}
+      getOptionLabel={(option) => option.username}
+      isOptionEqualToValue={(option, selected) => option.id === selected.id}
+      value={value}
+      onChange={(_, selected) => onChange(selected)}
+      onInputChange={(_, text) => setInput(text)}
+      loading={searching}
+      noOptionsText={query ? 'No users found' : 'Type a username'}
+      renderInput={(params) => (
+        <TextField
+          {...params}
+          label={label}
+          required={required}
+          fullWidth
+          InputProps={{
+            ...params.InputProps,
+            endAdornment: (
+              <>
+                {searching && <CircularProgress size={20} />}
+                {params.InputProps.endAdornment}
+              </>
+            ),
+          }}
+        />
+      )}
+      renderOption={(props, option) => (
+        <Box component="li" {...props}>
+          <Typography>{option.username}</Typography>
+        </Box>
+      )}
+      sx={sx}
+    />
+  )
+}
+
+export default UserSearchField''')
+
     create_file('src/components/ReviewSection.tsx', '''import React, { useState, useEffect } from 'react'
 import {
   Box,
@@ -3800,7 +4015,14 @@ const ReviewSection: React.FC<ReviewSectionProps> = ({ bookId }) => {
           )
         }
       }
-      await fetchReviews()
+
+      // The database trigger has adjusted likes_count; mirror it here
+      // instead of reloading every review
+      const delta = review.user_has_liked ? -1 : 1
+      setReviews(prev => prev.map(r => (r.id === review.id
+        ? { ...r, user_has_liked: !review.user_has_liked, likes_count: r.likes_count + delta }
+        : r
+      )))
     } catch (error) {
       console.error('Error liking review:', error)
     }
@@ -4101,7 +4323,7 @@ const HomePage: React.FC = () => {
             WebkitTextFillColor: 'transparent',
           }}
         >
-          React Academy
+          {'React Academy'}
         </Typography>
 
         <Typography
@@ -4250,43 +4472,48 @@ import { Search } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
 import { Book } from '@/types'
 import { booksApi } from '@/services/api/books'
+import { useDebounce } from '@/hooks/useDebounce'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import BookCard from '@/components/BookCard'
 
 const BooksPage: React.FC = () => {
   const { t } = useTranslation()
-  const [books, setBooks] = useState<Book[]>([])
-  const [filteredBooks, setFilteredBooks] = useState<Book[]>([])
+  const {
+    items: books,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => booksApi.getAll(cursor))
+  const [results, setResults] = useState<Book[] | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [loading, setLoading] = useState(true)
-
-  useEffect(() => {
-    fetchBooks()
-  }, [])
+  const [searching, setSearching] = useState(false)
+  // Only query the server once typing pauses
+  const debouncedQuery = useDebounce(searchQuery.trim(), 300)
 
   useEffect(() => {
-    if (searchQuery) {
-      const filtered = books.filter(
-        book =>
-          book.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          book.description.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-      setFilteredBooks(filtered)
-    } else {
-      setFilteredBooks(books)
+    if (!debouncedQuery) {
+      setResults(null)
+      setSearching(false)
+      return
     }
-  }, [searchQuery, books])
 
-  const fetchBooks = async () => {
-    try {
-      const data = await booksApi.getAll()
-      setBooks(data)
-      setFilteredBooks(data)
-    } catch (error) {
-      console.error('Error fetching books:', error)
-    } finally {
-      setLoading(false)
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    setSearching(true)
+    booksApi.search(debouncedQuery)
+      .then(data => {
+        if (!cancelled) setResults(data)
+      })
+      .catch(error => console.error('Error searching books:', error))
+      .finally(() => {
+        if (!cancelled) setSearching(false)
+      })
+    return () => {
+      cancelled = true
     }
-  }
+  }, [debouncedQuery])
+
+  const shownBooks = results ?? books
 
   if (loading) {
     return (
@@ -4314,22 +4541,34 @@ const BooksPage: React.FC = () => {
                 <Search />
               </InputAdornment>
             ),
+            endAdornment: searching && (
+              <InputAdornment position="end">
+                <CircularProgress size={20} />
+              </InputAdornment>
+            ),
           }}
         />
       </Paper>
 
       <Grid container spacing={3}>
-        {filteredBooks.map((book) => (
+        {shownBooks.map((book) => (
           <Grid item key={book.id} xs={12} sm={6} md={4} lg={3}>
             <BookCard book={book} />
           </Grid>
         ))}
       </Grid>
 
-      {filteredBooks.length === 0 && (
+      {/* More books load as this scrolls into view; search results are a single page */}
+      {results === null && (
+        <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+          {loadingMore && <CircularProgress size={24} />}
+        </Box>
+      )}
+
+      {shownBooks.length === 0 && !searching && (
         <Box textAlign="center" py={8}>
           <Typography variant="h6" color="text.secondary">
-            {searchQuery ? 'No books found matching your search.' : 'No books available.'}
+            {debouncedQuery ? 'No books found matching your search.' : 'No books available.'}
           </Typography>
         </Box>
       )}
@@ -4627,35 +4866,38 @@ import {
   CircularProgress
 } from '@mui/material'
 import { useTranslation } from 'react-i18next'
-import { Course, CourseEnrollment } from '@/types'
+import { CourseEnrollment } from '@/types'
 import { coursesApi } from '@/services/api/courses'
 import { useAuth } from '@/context/AuthContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import CourseCard from '@/components/CourseCard'
 
 const CoursesPage: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
-  const [courses, setCourses] = useState<Course[]>([])
+  const {
+    items: courses,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => coursesApi.getAll(cursor))
   const [enrollments, setEnrollments] = useState<CourseEnrollment[]>([])
-  const [loading, setLoading] = useState(true)
 
   useEffect(() => {
-    fetchCourses()
+    fetchEnrollments()
   }, [profile])
 
-  const fetchCourses = async () => {
-    try {
-      const coursesData = await coursesApi.getAll()
-      setCourses(coursesData)
+  const fetchEnrollments = async () => {
+    if (!profile) {
+      setEnrollments([])
+      return
+    }
 
-      if (profile) {
-        const enrollmentsData = await coursesApi.getUserEnrollments(profile.id)
-        setEnrollments(enrollmentsData)
-      }
+    try {
+      const enrollmentsData = await coursesApi.getUserEnrollments(profile.id)
+      setEnrollments(enrollmentsData)
     } catch (error) {
-      console.error('Error fetching courses:', error)
-    } finally {
-      setLoading(false)
+      console.error('Error fetching enrollments:', error)
     }
   }
 
@@ -4688,6 +4930,10 @@ const CoursesPage: React.FC = () => {
         ))}
       </Grid>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       {courses.length === 0 && (
         <Box textAlign="center" py={8}>
           <Typography variant="h6" color="text.secondary">
@@ -4747,6 +4993,7 @@ import { messagesApi } from '@/services/api/messages'
 import { notificationsApi } from '@/services/api/notifications'
 import { useAuth } from '@/context/AuthContext'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 interface TabPanelProps {
   children?: React.ReactNode
@@ -4779,13 +5026,24 @@ const ProfilePage: React.FC = () => {
   const [courses, setCourses] = useState<CourseEnrollment[]>([])
   const [badges, setBadges] = useState<UserBadge[]>([])
   const [certificates, setCertificates] = useState<Certificate[]>([])
-  const [messages, setMessages] = useState<MessageType[]>([])
   const [giftHistory, setGiftHistory] = useState<BookOwnership[]>([])
   const [isBlocked, setIsBlocked] = useState(false)
 
   const isOwnProfile = !userId || userId === currentUser?.id
   const profileId = userId || currentUser?.id
 
+  // Messages are private, so only the owner's profile pages through them
+  const {
+    items: messages,
+    loadingMore: loadingMoreMessages,
+    sentinelRef: messagesSentinelRef
+  } = useInfiniteList<MessageType>(
+    (cursor) => isOwnProfile && profileId
+      ? messagesApi.getUserMessages(profileId, cursor)
+      : Promise.resolve({ items: [], nextCursor: null }),
+    [profileId, isOwnProfile]
+  )
+
   useEffect(() => {
     if (profileId) {
       fetchProfile()
@@ -4824,9 +5082,6 @@ const ProfilePage: React.FC = () => {
 
       // Fetch additional data for own profile
       if (isOwnProfile) {
-        const messagesData = await messagesApi.getUserMessages(profileId!)
-        setMessages(messagesData)
-        
         // Filter gift history
         const giftsReceived = booksData.filter(b => b.is_gift)
         setGiftHistory(giftsReceived)
@@ -5156,6 +5411,9 @@ const ProfilePage: React.FC = () => {
                 </ListItem>
               ))}
             </List>
+            <Box ref={messagesSentinelRef} display="flex" justifyContent="center" py={2}>
+              {loadingMoreMessages && <CircularProgress size={24} />}
+            </Box>
           </TabPanel>
 
           <TabPanel value={tabValue} index={3}>
@@ -6067,25 +6325,35 @@ import {
   Grid,
   Paper,
   Typography,
-  CircularProgress
+  CircularProgress,
+  Tooltip
 } from '@mui/material'
 import {
   People,
   MenuBook,
   School,
-  AttachMoney
+  AttachMoney,
+  Payments
 } from '@mui/icons-material'
+import { format } from 'date-fns'
 import { useTranslation } from 'react-i18next'
+import { DashboardStats, DashboardStatsDay } from '@/types'
 import { adminApi } from '@/services/api/admin'
 
+const SERIES_DAYS = 30
+
+const formatMoney = (value: number) =>
+  `$${value.toLocaleString(undefined, { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`
+
 interface StatCardProps {
   title: string
   value: number
   icon: React.ReactNode
   color: string
+  formatValue?: (value: number) => string
 }
 
-const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color }) => (
+const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color, formatValue }) => (
   <Paper sx={{ p: 3, height: '100%' }}>
     <Box sx={{ display: 'flex', alignItems: 'center', mb: 2 }}>
       <Box
@@ -6102,19 +6370,59 @@ const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color }) => (
       <Typography variant="h6">{title}</Typography>
     </Box>
     <Typography variant="h3" fontWeight="bold">
-      {value.toLocaleString()}
+      {formatValue ? formatValue(value) : value.toLocaleString()}
     </Typography>
   </Paper>
 )
 
+interface SeriesChartProps {
+  title: string
+  series: DashboardStatsDay[]
+  metric: Exclude<keyof DashboardStatsDay, 'day'>
+  color: string
+  formatValue?: (value: number) => string
+}
+
+// One bar per day, scaled to the busiest day in the series
+const SeriesChart: React.FC<SeriesChartProps> = ({ title, series, metric, color, formatValue }) => {
+  const max = Math.max(1, ...series.map(day => day[metric]))
+  const total = series.reduce((sum, day) => sum + day[metric], 0)
+
+  return (
+    <Paper sx={{ p: 3, height: '100%' }}>
+      <Box sx={{ display: 'flex', justifyContent: 'space-between', mb: 2 }}>
+        <Typography variant="h6">{title}</Typography>
+        <Typography variant="h6" color="text.secondary">
+          {formatValue ? formatValue(total) : total.toLocaleString()}
+        </Typography>
+      </Box>
+      <Box sx={{ display: 'flex', alignItems: 'flex-end', gap: '2px', height: 120 }}>
+        {series.map(day => (
+          <Tooltip
+            key={day.day}
+            title={`${format(new Date(`${day.day}T00:00:00`), 'MMM dd')}: ${
+              formatValue ? formatValue(day[metric]) : day[metric].toLocaleString()
+            }`}
+          >
+            <Box
+              sx={{
+                flex: 1,
+                height: `${(day[metric] / max) * 100}%`,
+                minHeight: 2,
+                bgcolor: `${color}.main`,
+                borderRadius: '2px 2px 0 0'
+              }}
+            />
+          </Tooltip>
+        ))}
+      </Box>
+    </Paper>
+  )
+}
+
 const Dashboard: React.FC = () => {
   const { t } = useTranslation()
-  const [stats, setStats] = useState({
-    users: 0,
-    books: 0,
-    courses: 0,
-    transactions: 0
-  })
+  const [stats, setStats] = useState<DashboardStats | null>(null)
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
@@ -6123,7 +6431,7 @@ const Dashboard: React.FC = () => {
 
   const fetchStats = async () => {
     try {
-      const data = await adminApi.getDashboardStats()
+      const data = await adminApi.getDashboardStats(SERIES_DAYS)
       setStats(data)
     } catch (error) {
       console.error('Error fetching stats:', error)
@@ -6140,11 +6448,24 @@ const Dashboard: React.FC = () => {
     )
   }
 
+  if (!stats) {
+    return (
+      <Typography color="text.secondary">
+        Dashboard statistics are unavailable.
+      </Typography>
+    )
+  }
+
   return (
     <Box>
       <Typography variant="h4" gutterBottom>
         {t('dashboard')}
       </Typography>
+      {stats.refreshed_at && (
+        <Typography variant="body2" color="text.secondary" sx={{ mb: 2 }}>
+          Updated {format(new Date(stats.refreshed_at), 'MMM dd, yyyy HH:mm')}
+        </Typography>
+      )}
 
       <Grid container spacing={3}>
         <Grid item xs={12} sm={6} md={3}>
@@ -6179,16 +6500,49 @@ const Dashboard: React.FC = () => {
             color="error"
           />
         </Grid>
-      </Grid>
 
-      {/* Add more dashboard widgets here */}
+        <Grid item xs={12} md={4}>
+          <StatCard
+            title="Total Revenue"
+            value={stats.revenue}
+            icon={<Payments />}
+            color="success"
+            formatValue={formatMoney}
+          />
+        </Grid>
+        <Grid item xs={12} md={8}>
+          <SeriesChart
+            title={`Revenue, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="revenue"
+            color="success"
+            formatValue={formatMoney}
+          />
+        </Grid>
+        <Grid item xs={12} md={6}>
+          <SeriesChart
+            title={`New users, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="users"
+            color="primary"
+          />
+        </Grid>
+        <Grid item xs={12} md={6}>
+          <SeriesChart
+            title={`Transactions, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="transactions"
+            color="error"
+          />
+        </Grid>
+      </Grid>
     </Box>
   )
 }
 
 export default Dashboard''')
 
-    create_file('src/pages/Admin/BooksManagement.tsx', '''import React, { useState, useEffect } from 'react'
+    create_file('src/pages/Admin/BooksManagement.tsx', '''import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -6206,7 +6560,8 @@ import {
   DialogContent,
   DialogActions,
   TextField,
-  InputAdornment
+  InputAdornment,
+  CircularProgress
 } from '@mui/material'
 import { Edit, Delete, Add, Upload } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
@@ -6216,13 +6571,18 @@ import { supabase } from '@/services/supabase'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const BooksManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [books, setBooks] = useState<Book[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: books,
+    loadingMore,
+    reload: fetchBooks,
+    sentinelRef
+  } = useInfiniteList((cursor) => booksApi.getAll(cursor))
   const [dialogOpen, setDialogOpen] = useState(false)
   const [editingBook, setEditingBook] = useState<Book | null>(null)
   const [formData, setFormData] = useState({
@@ -6235,21 +6595,6 @@ const BooksManagement: React.FC = () => {
   const [coverFile, setCoverFile] = useState<File | null>(null)
   const [bookFile, setBookFile] = useState<File | null>(null)
 
-  useEffect(() => {
-    fetchBooks()
-  }, [])
-
-  const fetchBooks = async () => {
-    try {
-      const data = await booksApi.getAll()
-      setBooks(data)
-    } catch (error) {
-      console.error('Error fetching books:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleOpenDialog = (book?: Book) => {
     if (book) {
       setEditingBook(book)
@@ -6424,6 +6769,10 @@ const BooksManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog open={dialogOpen} onClose={handleCloseDialog} maxWidth="sm" fullWidth>
         <DialogTitle>{editingBook ? 'Edit Book' : 'Add Book'}</DialogTitle>
         <DialogContent>
@@ -6520,7 +6869,7 @@ const BooksManagement: React.FC = () => {
 export default BooksManagement''')
 
     # Continue with remaining admin pages...
-    create_file('src/pages/Admin/CoursesManagement.tsx', '''import React, { useState, useEffect } from 'react'
+    create_file('src/pages/Admin/CoursesManagement.tsx', '''import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -6538,29 +6887,33 @@ import {
   DialogContent,
   DialogActions,
   TextField,
-  Autocomplete,
-  Chip
+  Chip,
+  CircularProgress
 } from '@mui/material'
 import { Edit, Delete, Add, People, Upload } from '@mui/icons-material'
 import { DatePicker } from '@mui/x-date-pickers/DatePicker'
 import { useTranslation } from 'react-i18next'
 import { Course, CourseEnrollment, User } from '@/types'
 import { coursesApi } from '@/services/api/courses'
-import { usersApi } from '@/services/api/users'
 import { supabase } from '@/services/supabase'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
+import UserSearchField from '@/components/UserSearchField'
 
 const CoursesManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [courses, setCourses] = useState<Course[]>([])
-  const [users, setUsers] = useState<User[]>([])
+  const {
+    items: courses,
+    loadingMore,
+    reload: fetchData,
+    sentinelRef
+  } = useInfiniteList((cursor) => coursesApi.getAll(cursor))
   const [selectedCourse, setSelectedCourse] = useState<Course | null>(null)
   const [enrollments, setEnrollments] = useState<CourseEnrollment[]>([])
-  const [loading, setLoading] = useState(true)
   const [dialogOpen, setDialogOpen] = useState(false)
   const [enrollmentDialogOpen, setEnrollmentDialogOpen] = useState(false)
   const [editingCourse, setEditingCourse] = useState<Course | null>(null)
@@ -6575,25 +6928,6 @@ const CoursesManagement: React.FC = () => {
   const [imageFile, setImageFile] = useState<File | null>(null)
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
 
-  useEffect(() => {
-    fetchData()
-  }, [])
-
-  const fetchData = async () => {
-    try {
-      const [coursesData, usersData] = await Promise.all([
-        coursesApi.getAll(),
-        usersApi.getAllUsers()
-      ])
-      setCourses(coursesData)
-      setUsers(usersData.filter(u => !u.is_banned))
-    } catch (error) {
-      console.error('Error fetching data:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleOpenDialog = (course?: Course) => {
     if (course) {
       setEditingCourse(course)
@@ -6847,6 +7181,10 @@ const CoursesManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       {/* Course Dialog */}
       <Dialog open={dialogOpen} onClose={handleCloseDialog} maxWidth="sm" fullWidth>
         <DialogTitle>{editingCourse ? 'Edit Course' : 'Add Course'}</DialogTitle>
@@ -6943,14 +7281,11 @@ const CoursesManagement: React.FC = () => {
         <DialogContent>
           <Box sx={{ mb: 3 }}>
             <Box sx={{ display: 'flex', gap: 2, mb: 2 }}>
-              <Autocomplete
-                options={users.filter(u => !enrollments.some(e => e.user_id === u.id))}
-                getOptionLabel={(option) => option.username}
+              <UserSearchField
+                label="Select user to enroll"
                 value={selectedUser}
-                onChange={(_, value) => setSelectedUser(value)}
-                renderInput={(params) => (
-                  <TextField {...params} label="Select user to enroll" />
-                )}
+                onChange={setSelectedUser}
+                exclude={u => enrollments.some(e => e.user_id === u.id)}
                 sx={{ flex: 1 }}
               />
               <Button
@@ -7046,7 +7381,8 @@ import {
   Menu,
   MenuItem,
   Switch,
-  FormControlLabel
+  FormControlLabel,
+  CircularProgress
 } from '@mui/material'
 import {
   Search,
@@ -7062,47 +7398,53 @@ import { usersApi } from '@/services/api/users'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useDebounce } from '@/hooks/useDebounce'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const UsersManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [users, setUsers] = useState<User[]>([])
-  const [filteredUsers, setFilteredUsers] = useState<User[]>([])
+  const {
+    items: users,
+    loadingMore,
+    reload,
+    sentinelRef
+  } = useInfiniteList((cursor) => usersApi.getAllUsers(cursor))
+  const [results, setResults] = useState<User[] | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [loading, setLoading] = useState(true)
+  const [searchRun, setSearchRun] = useState(0)
   const [anchorEl, setAnchorEl] = useState<null | HTMLElement>(null)
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
+  // Search the whole table on the server, not just the pages loaded so far
+  const debouncedQuery = useDebounce(searchQuery.trim(), 300)
 
   useEffect(() => {
-    fetchUsers()
-  }, [])
-
-  useEffect(() => {
-    if (searchQuery) {
-      const filtered = users.filter(
-        user =>
-          user.username.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          user.email.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-      setFilteredUsers(filtered)
-    } else {
-      setFilteredUsers(users)
+    if (!debouncedQuery) {
+      setResults(null)
+      return
     }
-  }, [searchQuery, users])
 
-  const fetchUsers = async () => {
-    try {
-      const data = await usersApi.getAllUsers()
-      setUsers(data)
-      setFilteredUsers(data)
-    } catch (error) {
-      console.error('Error fetching users:', error)
-    } finally {
-      setLoading(false)
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    usersApi.searchUsers(debouncedQuery, 50)
+      .then(data => {
+        if (!cancelled) setResults(data)
+      })
+      .catch(error => console.error('Error searching users:', error))
+    return () => {
+      cancelled = true
     }
+  }, [debouncedQuery, searchRun])
+
+  // Reloads the list and, while searching, the search results
+  const fetchUsers = () => {
+    reload()
+    setSearchRun(run => run + 1)
   }
 
+  const shownUsers = results ?? users
+
   const handleMenuOpen = (event: React.MouseEvent<HTMLElement>, user: User) => {
     setAnchorEl(event.currentTarget)
     setSelectedUser(user)
@@ -7238,7 +7580,7 @@ const UsersManagement: React.FC = () => {
             </TableRow>
           </TableHead>
           <TableBody>
-            {filteredUsers.map((user) => (
+            {shownUsers.map((user) => (
               <TableRow key={user.id}>
                 <TableCell>
                   <Avatar src={user.avatar_url} sx={{ width: 40, height: 40 }}>
@@ -7284,6 +7626,12 @@ const UsersManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      {results === null && (
+        <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+          {loadingMore && <CircularProgress size={24} />}
+        </Box>
+      )}
+
       <Menu
         anchorEl={anchorEl}
         open={Boolean(anchorEl)}
@@ -7311,7 +7659,7 @@ const UsersManagement: React.FC = () => {
 
 export default UsersManagement''')
 
-    create_file('src/pages/Admin/TransactionsView.tsx', '''import React, { useState, useEffect } from 'react'
+    create_file('src/pages/Admin/TransactionsView.tsx', '''import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -7329,43 +7677,25 @@ import {
   DialogContent,
   List,
   ListItem,
-  ListItemText
+  ListItemText,
+  CircularProgress
 } from '@mui/material'
 import { Visibility } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
 import { Transaction } from '@/types'
-import { supabase } from '@/services/supabase'
+import { adminApi } from '@/services/api/admin'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const TransactionsView: React.FC = () => {
   const { t } = useTranslation()
-  const [transactions, setTransactions] = useState<Transaction[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: transactions,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => adminApi.getTransactions(cursor))
   const [selectedTransaction, setSelectedTransaction] = useState<Transaction | null>(null)
   const [detailsOpen, setDetailsOpen] = useState(false)
 
-  useEffect(() => {
-    fetchTransactions()
-  }, [])
-
-  const fetchTransactions = async () => {
-    try {
-      const { data, error } = await supabase
-        .from('transactions')
-        .select(`
-          *,
-          user:users(id, username, email)
-        `)
-        .order('created_at', { ascending: false })
-
-      if (error) throw error
-      setTransactions(data || [])
-    } catch (error) {
-      console.error('Error fetching transactions:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleViewDetails = (transaction: Transaction) => {
     setSelectedTransaction(transaction)
     setDetailsOpen(true)
@@ -7429,6 +7759,10 @@ const TransactionsView: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog
         open={detailsOpen}
         onClose={() => setDetailsOpen(false)}
@@ -7735,11 +8069,105 @@ export const useBlockUser = () => {
   }
 }''')
 
-    print("React Academy App project structure created successfully!")
-    print("\nSQL script for Supabase setup:")
-    print("=" * 80)
-    print('''
--- Create tables
+    create_file('src/hooks/useDebounce.ts', '''import { useState, useEffect } from 'react'
+
+// Returns value once it has stopped changing for delay milliseconds
+export const useDebounce = <T>(value: T, delay = 300) => {
+  const [debouncedValue, setDebouncedValue] = useState(value)
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedValue(value), delay)
+    return () => clearTimeout(timer)
+  }, [value, delay])
+
+  return debouncedValue
+}''')
+
+    create_file('src/hooks/useInfiniteList.ts', '''import { useState, useEffect, useCallback, useRef, DependencyList } from 'react'
+import { Cursor, Page } from '@/services/api/pagination'
+
+// Loads a keyset-paginated list a page at a time. Attach sentinelRef to an
+// element below the list; the next page is fetched as it scrolls into view.
+// The list starts over from the first page whenever deps change.
+export const useInfiniteList = <T>(
+  fetchPage: (cursor: Cursor | null) => Promise<Page<T>>,
+  deps: DependencyList = []
+) => {
+  const [items, setItems] = useState<T[]>([])
+  const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [hasMore, setHasMore] = useState(false)
+  const [sentinel, setSentinel] = useState<Element | null>(null)
+  const fetchRef = useRef(fetchPage)
+  const cursorRef = useRef<Cursor | null>(null)
+  const busyRef = useRef(false)
+  // Bumped on reload so pages from an earlier run are dropped
+  const runRef = useRef(0)
+
+  fetchRef.current = fetchPage
+
+  const load = useCallback(async (reset: boolean) => {
+    if (busyRef.current && !reset) return
+
+    const run = reset ? ++runRef.current : runRef.current
+    busyRef.current = true
+    if (reset) {
+      cursorRef.current = null
+      setLoading(true)
+    } else {
+      setLoadingMore(true)
+    }
+
+    try {
+      const page = await fetchRef.current(cursorRef.current)
+      if (run !== runRef.current) return
+      cursorRef.current = page.nextCursor
+      setItems(prev => (reset ? page.items : [...prev, ...page.items]))
+      setHasMore(page.nextCursor !== null)
+    } catch (error) {
+      console.error('Error loading page:', error)
+      // Stop loading on scroll rather than retrying a failing request
+      if (run === runRef.current) setHasMore(false)
+    } finally {
+      if (run === runRef.current) {
+        busyRef.current = false
+        setLoading(false)
+        setLoadingMore(false)
+      }
+    }
+  }, [])
+
+  const reload = useCallback(() => load(true), [load])
+
+  useEffect(() => {
+    load(true)
+  }, deps)
+
+  // Re-observing after every page also catches a sentinel that is still
+  // visible because the page did not fill the screen
+  useEffect(() => {
+    if (!sentinel || !hasMore || loading || loadingMore) return
+
+    const observer = new IntersectionObserver(entries => {
+      if (entries.some(entry => entry.isIntersecting)) load(false)
+    }, { rootMargin: '200px' })
+    observer.observe(sentinel)
+    return () => observer.disconnect()
+  }, [sentinel, hasMore, loading, loadingMore, load])
+
+  return {
+    items,
+    setItems,
+    loading,
+    loadingMore,
+    hasMore,
+    reload,
+    sentinelRef: setSentinel
+  }
+}''')
+
+    # Supabase schema, applied in order by 'supabase db push' (see schema.py for upgrades)
+    create_file('supabase/migrations/0001_tables.sql', '''-- Create tables
 
 -- Users table (extends Supabase auth.users)
 CREATE TABLE users (
@@ -7927,8 +8355,9 @@ CREATE TABLE site_settings (
   settings JSONB NOT NULL,
   updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
+''')
 
--- Create indexes for better performance
+    create_file('supabase/migrations/0002_indexes.sql', '''-- Create indexes for better performance
 CREATE INDEX idx_books_created_at ON books(created_at DESC);
 CREATE INDEX idx_courses_start_date ON courses(start_date DESC);
 CREATE INDEX idx_book_ownership_user_id ON book_ownership(user_id);
@@ -7942,8 +8371,9 @@ CREATE INDEX idx_messages_recipient_id ON messages(recipient_id);
 CREATE INDEX idx_notifications_user_id ON notifications(user_id);
 CREATE INDEX idx_transactions_user_id ON transactions(user_id);
 CREATE INDEX idx_admin_logs_admin_id ON admin_logs(admin_id);
+''')
 
--- Create updated_at trigger function
+    create_file('supabase/migrations/0003_updated_at_triggers.sql', '''-- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
@@ -7964,8 +8394,9 @@ CREATE TRIGGER update_courses_updated_at BEFORE UPDATE ON courses
 
 CREATE TRIGGER update_reviews_updated_at BEFORE UPDATE ON reviews
   FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+''')
 
--- Row Level Security (RLS) Policies
+    create_file('supabase/migrations/0004_row_level_security.sql', '''-- Row Level Security (RLS) Policies
 
 -- Enable RLS on all tables
 ALTER TABLE users ENABLE ROW LEVEL SECURITY;
@@ -8162,8 +8593,9 @@ CREATE POLICY "Only admins can manage site settings" ON site_settings
       AND users.is_admin = true
     )
   );
+''')
 
--- Create storage buckets
+    create_file('supabase/migrations/0005_storage.sql', '''-- Create storage buckets
 INSERT INTO storage.buckets (id, name, public)
 VALUES 
   ('avatars', 'avatars', true),
@@ -8219,8 +8651,9 @@ CREATE POLICY "Users can download own certificates" ON storage.objects
       AND c.certificate_url LIKE '%' || name
     )
   );
+''')
 
--- Create initial admin user (update email and username as needed)
+    create_file('supabase/migrations/0006_auth_and_settings.sql', '''-- Create initial admin user (update email and username as needed)
 -- Note: You'll need to create the auth user first through Supabase Auth
 -- Then run this to make them admin:
 -- UPDATE users SET is_admin = true WHERE email = 'admin@example.com';
@@ -8262,16 +8695,306 @@ CREATE TRIGGER on_auth_user_created
 -- Create webhook endpoint for Paymob (optional, if using Supabase Edge Functions)
 -- This would be implemented as a Supabase Edge Function to handle payment webhooks
 ''')
+
+    create_file('supabase/migrations/0007_book_search.sql', '''-- Book search: ranked full-text search plus trigram matching on titles
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- Weighted search document; indexed as an expression so no column is stored
+CREATE OR REPLACE FUNCTION book_search_document(title TEXT, description TEXT)
+RETURNS tsvector AS $$
+  -- 'simple' does not stem, so English and Arabic titles are matched alike
+  SELECT setweight(to_tsvector('simple', title), 'A') ||
+         setweight(to_tsvector('simple', description), 'B');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX idx_books_search_document ON books
+  USING GIN (book_search_document(title, description));
+
+-- Serves substring (ILIKE) and fuzzy (%) title matches while the user is still typing
+CREATE INDEX idx_books_title_trgm ON books USING GIN (title gin_trgm_ops);
+
+-- Ranked search; called by booksApi.search. Supabase installs pg_trgm's
+-- operators in the extensions schema, hence the search_path
+CREATE OR REPLACE FUNCTION search_books(query TEXT, result_limit INTEGER DEFAULT 20)
+RETURNS SETOF books AS $$
+  SELECT b.*
+  FROM books b
+  WHERE book_search_document(b.title, b.description) @@ websearch_to_tsquery('simple', query)
+     -- query is matched literally: LIKE wildcards and the escape character are escaped
+     OR b.title ILIKE '%' || replace(replace(replace(query, '\\', '\\\\'), '%', '\\%'), '_', '\\_') || '%' ESCAPE '\\'
+     OR b.title % query
+  ORDER BY
+    ts_rank(book_search_document(b.title, b.description), websearch_to_tsquery('simple', query)) DESC,
+    similarity(b.title, query) DESC,
+    b.created_at DESC
+  LIMIT result_limit;
+$$ LANGUAGE sql STABLE SET search_path = public, extensions;
+''')
+
+    create_file('supabase/migrations/0008_user_search.sql', '''-- Trigram indexes serving usersApi.searchUsers' substring (ILIKE) matches,
+-- so user pickers and the admin user search never load the whole table
+CREATE INDEX idx_users_username_trgm ON users USING GIN (username gin_trgm_ops);
+CREATE INDEX idx_users_email_trgm ON users USING GIN (email gin_trgm_ops);
+''')
+
+    create_file('supabase/migrations/0009_review_likes_count.sql', '''-- reviews.likes_count follows review_likes, so listing reviews never
+-- needs the likes themselves
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS likes_count INTEGER NOT NULL DEFAULT 0;
+
+-- "Which of these reviews did I like": the UNIQUE (review_id, user_id)
+-- index leads with review_id, so it cannot serve lookups by user
+CREATE INDEX IF NOT EXISTS idx_review_likes_user_id ON review_likes(user_id, review_id);
+
+CREATE OR REPLACE FUNCTION update_review_likes_count()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- Likers usually do not own the review, so this bypasses RLS
+  IF TG_OP = 'INSERT' THEN
+    UPDATE reviews SET likes_count = likes_count + 1 WHERE id = NEW.review_id;
+  ELSE
+    UPDATE reviews SET likes_count = likes_count - 1 WHERE id = OLD.review_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER review_likes_count_change
+  AFTER INSERT OR DELETE ON review_likes
+  FOR EACH ROW EXECUTE FUNCTION update_review_likes_count();
+
+-- A like is not an edit: leave updated_at alone when likes_count changes.
+-- protect_reviews_likes_count fires first (triggers run in name order), so an
+-- author's own update still has an unchanged count here and is timestamped
+CREATE OR REPLACE TRIGGER update_reviews_updated_at
+  BEFORE UPDATE ON reviews
+  FOR EACH ROW
+  WHEN (OLD.likes_count IS NOT DISTINCT FROM NEW.likes_count)
+  EXECUTE FUNCTION update_updated_at_column();
+
+-- Count likes made before the column existed; reviews without likes already
+-- hold the default 0
+UPDATE reviews r
+SET likes_count = l.likes
+FROM (SELECT review_id, COUNT(*) AS likes FROM review_likes GROUP BY review_id) l
+WHERE l.review_id = r.id;
+
+-- Authors may update their own reviews, but only the counting trigger may
+-- change likes_count (it runs one trigger level down)
+CREATE OR REPLACE FUNCTION protect_review_likes_count()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF pg_trigger_depth() = 1 THEN
+    NEW.likes_count := CASE WHEN TG_OP = 'INSERT' THEN 0 ELSE OLD.likes_count END;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER protect_reviews_likes_count
+  BEFORE INSERT OR UPDATE ON reviews
+  FOR EACH ROW EXECUTE FUNCTION protect_review_likes_count();
+''')
+
+    create_file('supabase/migrations/0010_dashboard_stats.sql', '''-- Admin dashboard statistics: one row per day of new rows and revenue, so the
+-- dashboard reads a few hundred small rows instead of counting whole tables
+CREATE MATERIALIZED VIEW admin_daily_stats AS
+WITH events AS (
+  SELECT (created_at AT TIME ZONE 'UTC')::DATE AS day,
+         COUNT(*) AS users, 0 AS books, 0 AS courses, 0 AS transactions, 0 AS revenue
+  FROM users WHERE created_at IS NOT NULL GROUP BY 1
+  UNION ALL
+  SELECT (created_at AT TIME ZONE 'UTC')::DATE, 0, COUNT(*), 0, 0, 0
+  FROM books WHERE created_at IS NOT NULL GROUP BY 1
+  UNION ALL
+  SELECT (created_at AT TIME ZONE 'UTC')::DATE, 0, 0, COUNT(*), 0, 0
+  FROM courses WHERE created_at IS NOT NULL GROUP BY 1
+  UNION ALL
+  SELECT (created_at AT TIME ZONE 'UTC')::DATE, 0, 0, 0, COUNT(*),
+         COALESCE(SUM(amount) FILTER (WHERE status = 'completed'), 0)
+  FROM transactions WHERE created_at IS NOT NULL GROUP BY 1
+)
+SELECT day,
+       SUM(users)::INTEGER AS users,
+       SUM(books)::INTEGER AS books,
+       SUM(courses)::INTEGER AS courses,
+       SUM(transactions)::INTEGER AS transactions,
+       SUM(revenue)::DECIMAL(12, 2) AS revenue,
+       NOW() AS refreshed_at
+FROM events
+GROUP BY day;
+
+-- REFRESH ... CONCURRENTLY needs a unique index
+CREATE UNIQUE INDEX idx_admin_daily_stats_day ON admin_daily_stats(day);
+
+-- Only reachable through get_dashboard_stats
+REVOKE ALL ON admin_daily_stats FROM anon, authenticated;
+
+-- Totals plus a zero-filled daily series for the last `days` days, in one
+-- call; called by adminApi.getDashboardStats
+CREATE OR REPLACE FUNCTION get_dashboard_stats(days INTEGER DEFAULT 30)
+RETURNS JSON AS $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM users
+    WHERE users.id = auth.uid()
+    AND users.is_admin = true
+  ) THEN
+    RAISE EXCEPTION 'Only admins can view dashboard statistics' USING ERRCODE = '42501';
+  END IF;
+
+  RETURN (
+    SELECT json_build_object(
+      'users', COALESCE(SUM(s.users), 0),
+      'books', COALESCE(SUM(s.books), 0),
+      'courses', COALESCE(SUM(s.courses), 0),
+      'transactions', COALESCE(SUM(s.transactions), 0),
+      'revenue', COALESCE(SUM(s.revenue), 0),
+      'refreshed_at', MAX(s.refreshed_at),
+      'series', COALESCE((
+        SELECT json_agg(json_build_object(
+          'day', d.day,
+          'users', COALESCE(ds.users, 0),
+          'books', COALESCE(ds.books, 0),
+          'courses', COALESCE(ds.courses, 0),
+          'transactions', COALESCE(ds.transactions, 0),
+          'revenue', COALESCE(ds.revenue, 0)
+        ) ORDER BY d.day)
+        FROM (
+          SELECT (NOW() AT TIME ZONE 'UTC')::DATE - n AS day
+          FROM generate_series(0, days - 1) AS n
+        ) d
+        LEFT JOIN admin_daily_stats ds ON ds.day = d.day
+      ), '[]'::JSON)
+    )
+    FROM admin_daily_stats s
+  );
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Refresh every 10 minutes with pg_cron (enable it under Database >
+-- Extensions first); counts on the dashboard lag by at most that much
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+SELECT cron.schedule(
+  'refresh-admin-daily-stats',
+  '*/10 * * * *',
+  $$REFRESH MATERIALIZED VIEW CONCURRENTLY public.admin_daily_stats$$
+);
+''')
+
+    create_file('supabase/migrations/0011_keyset_pagination_indexes.sql', '''-- List pages are read newest first in (column, id) keyset order, one index
+-- range per page (see src/services/api/pagination.ts). Each composite index
+-- replaces the single-column one it makes redundant; schema.py diff turns
+-- these into CONCURRENTLY builds and drops for a live database.
+CREATE INDEX IF NOT EXISTS idx_books_created_at_id ON books(created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_books_created_at;
+
+CREATE INDEX IF NOT EXISTS idx_courses_start_date_id ON courses(start_date DESC, id DESC);
+DROP INDEX IF EXISTS idx_courses_start_date;
+
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users(created_at DESC, id DESC);
+
+-- Sent and received messages are paged separately, each from its own index
+CREATE INDEX IF NOT EXISTS idx_messages_sender_created_at ON messages(sender_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_messages_sender_id;
+
+CREATE INDEX IF NOT EXISTS idx_messages_recipient_created_at ON messages(recipient_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_messages_recipient_id;
+
+CREATE INDEX IF NOT EXISTS idx_transactions_created_at_id ON transactions(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_admin_logs_created_at_id ON admin_logs(created_at DESC, id DESC);
+''')
+
+def collect_templates():
+    """Return {path: content} for every template, without touching the disk."""
+    global _emitter
+    _emitter = Collector()
+    try:
+        write_templates()
+    finally:
+        collector, _emitter = _emitter, None
+    return collector.close()
+
+def open_templates(fixes=False):
+    """Return an Overlay of the template pack, topped with filler1.py's fixes if asked."""
+    return templatepack.open_templates(fixes, collect=collect_templates)
+
+def create_project(incremental=False, workers=1, atomic=False, fsync='none', only=(), exclude=(),
+                   fixes=False, layer_report=False, dry_run=False, backend=None, params=None):
+    """Create the complete React academy project structure.
+
+    With incremental=True, files whose content hash matches the manifest from
+    the previous run are not rewritten, and stale files are removed. With
+    workers > 1 the files are written concurrently on a thread pool. With
+    atomic=True each file is replaced via temp file and rename, synced
+    according to the fsync policy ('none', 'file' or 'batch').
+
+    only and exclude are path globs restricting which templates are emitted;
+    a partial run never removes files and skips the setup instructions.
+
+    With fixes=True the filler1.py fixes are layered over the templates in
+    memory, so each file is written once with its final content instead of
+    being rewritten by a second script. layer_report prints which layer each
+    emitted file came from.
+
+    With dry_run=True nothing is written; unified diffs against the existing
+    tree are printed instead, followed by a summary. backend, if given,
+    replaces the one chosen by workers.
+
+    params ({name: value}, see templating.PARAMS) replaces the site name and
+    credentials hard-coded in the templates.
+    """
+    partial = bool(only or exclude)
+    if dry_run:
+        emitter = DryRunEmitter(incremental=incremental, prune=not partial)
+    else:
+        emitter = Emitter(incremental=incremental, prune=not partial,
+                          backend=backend or make_backend(workers), atomic=atomic, fsync=fsync)
+    # Templates are read from the compressed pack; only files that changed are decompressed
+    with open_templates(fixes) as templates:
+        paths = select_paths(templates.paths(), only, exclude)
+        compiler = Compiler(template_defaults(templates)) if params else None
+        values = compiler.values(params) if params else None
+        for path in paths:
+            if compiler:
+                plan = compiler.compile(path, templates.read(path).decode('utf-8'))
+                if plan is not None:
+                    emitter.emit(path, plan.render(values))
+                    continue
+            if not emitter.keep(path, templates.sha256(path), templates.size(path)):
+                emitter.emit(path, templates.read(path), digest=templates.sha256(path))
+        if layer_report:
+            print("\n".join(templates.report(paths)))
+    stats = emitter.close()
+
+    if dry_run:
+        print(f"Dry run: {stats['written']} files would change, {stats['skipped']} unchanged, "
+              f"{stats['removed']} would be removed (+{stats['bytes_added']}/-{stats['bytes_removed']} bytes)")
+        return
+
+    if partial:
+        print(f"Files written: {stats['written']}, skipped: {stats['skipped']}")
+        return
+
+    print("React Academy App project structure created successfully!")
+    print(f"Files written: {stats['written']}, skipped: {stats['skipped']}, removed: {stats['removed']}")
+    print("Supabase schema written to supabase/migrations/")
     
     print("\n" + "=" * 80)
     print("\nTo set up the project:")
     print("1. Run 'npm install' to install dependencies")
-    print("2. Copy the SQL script above and run it in your Supabase SQL editor")
-    print("3. Create storage buckets in Supabase as specified in the SQL")
+    print("2. Apply supabase/migrations/ in order: 'supabase db push', or run each file in the Supabase SQL editor")
+    print("3. The storage buckets are created by supabase/migrations/0005_storage.sql")
     print("4. Configure Paymob webhook to point to your API endpoint")
     print("5. Run 'npm run dev' to start the development server")
     print("6. Deploy to Vercel when ready")
     print("\nNote: The provided Supabase and Paymob credentials are already configured in .env")
 
+def main(argv=None):
+    """Command-line entry point; the options are defined in generate.py."""
+    import generate
+    generate.main(argv, code=sys.modules[__name__])
+
 if __name__ == "__main__":
-    create_project()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark the project generators.
+
+Runs Code.py's create_project() and filler1.py's fixes into fresh temporary
+directories, on tmpfs and on disk, and reports wall time, per-file write
+latency percentiles, write syscalls and bytes (from /proc/self/io) and peak
+RSS. Every measurement runs in its own child process so peak RSS and import
+costs are not shared between runs.
+
+    python bench.py --repeat 5 --json bench.json
+    python bench.py --json new.json --compare bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from stats import percentile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCENARIOS = ('create_project', 'filler1')
+
+
+class TimingBackend:
+    """Backend wrapper recording how long each write job took."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def run(self, func, jobs):
+        def timed(job):
+            start = time.perf_counter()
+            func(job)
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies.append(elapsed)
+        self.inner.run(timed, jobs)
+
+
+def read_proc_io():
+    """Return the counters from /proc/self/io, or {} where unavailable."""
+    try:
+        with open('/proc/self/io') as f:
+            return {key: int(value) for key, value in (line.split(': ') for line in f)}
+    except OSError:
+        return {}
+
+
+def run_scenario(scenario, root, workers):
+    """Run one scenario in this process with root as the working directory."""
+    sys.path.insert(0, HERE)
+    start = time.perf_counter()
+    from scaffold import Emitter, make_backend
+    if scenario == 'create_project':
+        import Code
+    else:
+        import filler1
+    import_s = time.perf_counter() - start
+
+    os.chdir(root)
+    timing = TimingBackend(make_backend(workers))
+    io_before = read_proc_io()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if scenario == 'create_project':
+            Code.create_project(backend=timing)
+        else:
+            filler1.apply_fixes(Emitter(backend=timing))
+    wall_s = time.perf_counter() - start
+    io_after = read_proc_io()
+
+    latencies = timing.latencies
+    return {
+        'import_s': import_s,
+        'wall_s': wall_s,
+        'files': len(latencies),
+        'latency_p50_ms': percentile(latencies, 50) * 1000,
+        'latency_p90_ms': percentile(latencies, 90) * 1000,
+        'latency_p99_ms': percentile(latencies, 99) * 1000,
+        'latency_max_ms': max(latencies, default=0) * 1000,
+        'write_syscalls': io_after.get('syscw', 0) - io_before.get('syscw', 0),
+        'bytes_written': io_after.get('wchar', 0) - io_before.get('wchar', 0),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def spawn(scenario, root, workers):
+    """Run a scenario in a child process and return its measurements."""
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', scenario, root, '--workers', str(workers)],
+        check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+
+def summarize(runs):
+    """Median of every metric across repeated runs."""
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def bench_location(base_dir, repeat, workers):
+    """Benchmark every scenario in fresh directories under base_dir."""
+    results = {scenario: [] for scenario in SCENARIOS}
+    for _ in range(repeat):
+        root = tempfile.mkdtemp(prefix='scaffold-bench-', dir=base_dir)
+        try:
+            # filler1 runs on the tree create_project just produced, as in a real setup
+            results['create_project'].append(spawn('create_project', root, workers))
+            results['filler1'].append(spawn('filler1', root, workers))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    return {scenario: summarize(runs) for scenario, runs in results.items()}
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, check=True,
+                             capture_output=True, text=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report, baseline=None):
+    for location, scenarios in report['results'].items():
+        print(f"\n[{location}] {report['locations'][location]}")
+        for scenario, metrics in scenarios.items():
+            print(f"  {scenario}")
+            for key, value in metrics.items():
+                line = f"    {key:<16} {value:>12.3f}"
+                old = (baseline or {}).get('results', {}).get(location, {}).get(scenario, {}).get(key)
+                if old:
+                    line += f"   ({(value - old) / old * 100:+.1f}% vs {(baseline['commit'] or 'baseline')[:12]})"
+                print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark create_project() and filler1.py.')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per scenario (default: 3)')
+    parser.add_argument('--workers', type=int, default=1, help='writer threads (default: 1)')
+    parser.add_argument('--tmpfs-dir', default='/dev/shm', help='tmpfs location (default: /dev/shm)')
+    parser.add_argument('--disk-dir', default=tempfile.gettempdir(),
+                        help='on-disk location (default: the system temp dir)')
+    parser.add_argument('--json', metavar='FILE', help='also write the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='show changes against an earlier --json file')
+    parser.add_argument('--child', nargs=2, metavar=('SCENARIO', 'ROOT'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        scenario, root = args.child
+        print(json.dumps(run_scenario(scenario, root, args.workers)))
+        return
+
+    # Build the template packs up front so no measured run pays for it
+    sys.path.insert(0, HERE)
+    from templatepack import load_fixes_pack, load_pack
+    load_pack().close()
+    load_fixes_pack().close()
+
+    locations = {'disk': args.disk_dir}
+    if os.path.isdir(args.tmpfs_dir):
+        locations['tmpfs'] = args.tmpfs_dir
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'workers': args.workers,
+        'locations': locations,
+        'results': {name: bench_location(path, args.repeat, args.workers)
+                    for name, path in locations.items()},
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == "__main__":
+    main()
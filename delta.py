@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Delta patches between two versions of the generated tree.
+
+A patch lists, for every file that differs between an old and a new
+version, the hash the file must have before patching, the hash it has
+after, and a line delta: ranges of the old file's lines to copy, and the
+new lines in between. Files are split on b'\\n' as bytes, so binary files
+get the same kind of delta (their inserted chunks are base64-encoded). The
+patch is stored as zlib-compressed JSON; a template edit that touches a
+few lines yields a patch of a few hundred bytes.
+
+Either side can be a generated tree (a directory), a merged_code.txt
+snapshot or bundle, or a template pack; keep a copy of templates.pack
+before editing Code.py to diff two template versions.
+
+    python delta.py diff old.pack templates.pack -o update.delta
+    python delta.py apply update.delta workspaces/acme
+
+apply checks every file's hash before writing anything, rewrites only the
+affected files through the scaffold Emitter, and skips files that already
+have the new content, so applying a patch twice is harmless.
+"""
+
+import argparse
+import base64
+import difflib
+import json
+import os
+import zlib
+
+from merged import MergedSnapshot, tree_paths
+from scaffold import DryRunEmitter, Emitter, content_hash, safe_target
+from templatepack import MAGIC, TemplatePack
+
+FORMAT = 1
+
+
+class TreeSource:
+    """A directory read through the same API as TemplatePack and MergedSnapshot."""
+
+    def __init__(self, root):
+        self.root = root
+        self._paths = tree_paths(root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, path):
+        return os.path.isfile(os.path.join(self.root, path))
+
+    def close(self):
+        pass
+
+    def paths(self):
+        return list(self._paths)
+
+    def read(self, path):
+        with open(os.path.join(self.root, path), 'rb') as f:
+            return f.read()
+
+    def sha256(self, path):
+        return content_hash(self.read(path))
+
+
+def open_source(location):
+    """Open a directory, template pack or merged snapshot for reading."""
+    if os.path.isdir(location):
+        return TreeSource(location)
+    with open(location, 'rb') as f:
+        is_pack = f.read(len(MAGIC)) == MAGIC
+    return TemplatePack(location) if is_pack else MergedSnapshot(location)
+
+
+def line_delta(old, new):
+    """Return (ops, binary) turning bytes old into bytes new.
+
+    ops is a list of ['=', start, end] (copy old lines start:end) and
+    ['+', chunk] (insert chunk). Chunks are text, or base64 when binary.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    try:
+        new.decode('utf-8')
+        binary = False
+    except UnicodeDecodeError:
+        binary = True
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(['=', i1, i2])
+        elif tag in ('replace', 'insert'):
+            chunk = b''.join(new_lines[j1:j2])
+            ops.append(['+', base64.b64encode(chunk).decode('ascii') if binary else chunk.decode('utf-8')])
+    return ops, binary
+
+
+def apply_delta(old, ops, binary):
+    """Rebuild the new bytes from old and a line_delta() result."""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in ops:
+        if op[0] == '=':
+            parts.extend(old_lines[op[1]:op[2]])
+        else:
+            parts.append(base64.b64decode(op[1]) if binary else op[1].encode('utf-8'))
+    return b''.join(parts)
+
+
+def diff(old, new):
+    """Return the patch (a dict) turning source old into source new."""
+    files = []
+    for path in new.paths():
+        digest = new.sha256(path)
+        if path not in old:
+            ops, binary = line_delta(b'', new.read(path))
+            files.append({'path': path, 'base': None, 'sha256': digest, 'binary': binary, 'ops': ops})
+            continue
+        base = old.sha256(path)
+        if base != digest:
+            ops, binary = line_delta(old.read(path), new.read(path))
+            files.append({'path': path, 'base': base, 'sha256': digest, 'binary': binary, 'ops': ops})
+    for path in old.paths():
+        if path not in new:
+            files.append({'path': path, 'base': old.sha256(path), 'sha256': None})
+    return {'format': FORMAT, 'files': files}
+
+
+def save_patch(patch, path):
+    with open(path, 'wb') as f:
+        f.write(zlib.compress(json.dumps(patch, separators=(',', ':')).encode('utf-8'), 9))
+
+
+def load_patch(path):
+    with open(path, 'rb') as f:
+        patch = json.loads(zlib.decompress(f.read()))
+    if patch.get('format') != FORMAT:
+        raise ValueError(f"{path} is not a version {FORMAT} delta patch")
+    return patch
+
+
+def _current_hash(target):
+    try:
+        with open(target, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None, None
+    return content_hash(data), data
+
+
+def apply_patch(patch, emitter, force=False):
+    """Apply patch to the tree under emitter.root.
+
+    Every file is checked first: it must still have the patch's base
+    hash, or already have the new one (then it is left alone). Any other
+    file is a conflict, and nothing is written unless force is set, in
+    which case conflicting files are skipped. Returns (stats, conflicts).
+    A patch with any path outside emitter.root is refused whole, with
+    ValueError, before a single file is read.
+    """
+    targets = [safe_target(emitter.root, entry['path']) for entry in patch['files']]
+    updates = []
+    deletes = []
+    conflicts = []
+    for entry, target in zip(patch['files'], targets):
+        digest, data = _current_hash(target)
+        if digest == entry['sha256']:
+            emitter.stats['skipped'] += 1
+        elif digest != entry['base']:
+            conflicts.append(entry['path'])
+        elif entry['sha256'] is None:
+            deletes.append(target)
+        else:
+            updates.append((entry, data or b''))
+    if conflicts and not force:
+        return dict(emitter.stats), conflicts
+
+    for entry, data in updates:
+        new = apply_delta(data, entry['ops'], entry['binary'])
+        if content_hash(new) != entry['sha256']:
+            raise ValueError(f"patch produced the wrong content for {entry['path']}")
+        emitter.emit(entry['path'], new, digest=entry['sha256'])
+    stats = emitter.close()
+    if isinstance(emitter, DryRunEmitter):
+        for target in deletes:
+            emitter.out.write(f"Would remove {os.path.relpath(target, emitter.root)}\n")
+    else:
+        for target in deletes:
+            os.remove(target)
+    stats['removed'] += len(deletes)
+    return stats, conflicts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute and apply delta patches between scaffold versions.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    diff_parser = commands.add_parser('diff', help='compute the patch from OLD to NEW')
+    diff_parser.add_argument('old', help='directory, template pack or merged snapshot')
+    diff_parser.add_argument('new', help='directory, template pack or merged snapshot')
+    diff_parser.add_argument('-o', '--output', required=True, help='patch file to write')
+
+    apply_parser = commands.add_parser('apply', help='apply a patch to a generated tree in place')
+    apply_parser.add_argument('patch')
+    apply_parser.add_argument('root', nargs='?', default='.', help='tree to update (default: .)')
+    apply_parser.add_argument('--dry-run', action='store_true',
+                              help='print a unified diff of what would change instead of writing')
+    apply_parser.add_argument('--atomic', action='store_true',
+                              help='write each file to a temp file and rename it into place')
+    apply_parser.add_argument('--force', action='store_true',
+                              help='apply what applies cleanly and skip conflicting files')
+
+    show_parser = commands.add_parser('show', help='list the files a patch changes')
+    show_parser.add_argument('patch')
+    args = parser.parse_args(argv)
+
+    if args.command == 'diff':
+        with open_source(args.old) as old, open_source(args.new) as new:
+            patch = diff(old, new)
+        save_patch(patch, args.output)
+        print(f"{len(patch['files'])} files changed, patch is {os.path.getsize(args.output)} bytes")
+    elif args.command == 'apply':
+        patch = load_patch(args.patch)
+        emitter = DryRunEmitter(root=args.root) if args.dry_run else Emitter(root=args.root, atomic=args.atomic)
+        try:
+            stats, conflicts = apply_patch(patch, emitter, args.force)
+        except ValueError as e:
+            parser.exit(1, f"Nothing written: {e}\n")
+        for path in conflicts:
+            print(f"Conflict: {path} does not match the patch's base version")
+        if conflicts and not args.force:
+            parser.exit(1, "Nothing written; use --force to skip conflicting files\n")
+        verb = 'Would update' if args.dry_run else 'Updated'
+        print(f"{verb} {stats['written']}, removed {stats['removed']}, already current {stats['skipped']}")
+    else:
+        for entry in load_patch(args.patch)['files']:
+            status = 'A' if entry['base'] is None else 'D' if entry['sha256'] is None else 'M'
+            print(f"{status}  {entry['path']}")
+
+
+if __name__ == "__main__":
+    main()
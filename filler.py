@@ -1,10 +1,25 @@
 import time
 import random
 import os
+import glob
+import json
+import shlex
+import argparse
+import sys
+import threading
+import subprocess
+from array import array
+
+from stats import percentile
+
+try:
+    import numpy as np
+except ImportError:  # random_lines() falls back to the array module
+    np = None
 
 file_path = "/workspaces/Mohammed-Nasser-Academy/src/pages/x.tsx"
 
-def random_line():
+def random_line(rng=random):
     templates = [
         "const var{n} = {num};",
         "function func{n}() {{ return {num}; }}",
@@ -12,18 +27,496 @@ def random_line():
         "let arr{n} = [{num}, {num2}, {num3}];",
         "export const value{n} = '{str}';",
     ]
-    template = random.choice(templates)
+    template = rng.choice(templates)
     return template.format(
-        n=random.randint(1, 1000),
-        num=random.randint(0, 100),
-        num2=random.randint(0, 100),
-        num3=random.randint(0, 100),
-        str=''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=6))
+        n=rng.randint(1, 1000),
+        num=rng.randint(0, 100),
+        num2=rng.randint(0, 100),
+        num3=rng.randint(0, 100),
+        str=''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=6))
     )
 
-while True:
-    line = random_line()
-    with open(file_path, "a") as f:  # "a" means append
-        f.write(line + "\n")
-    print("Added:", line)
-    time.sleep(1)  # Wait 1 second before writing again
+# random_line()'s templates with positional fields: n, num, num2, num3, str
+BULK_TEMPLATES = [
+    "const var{0} = {1};",
+    "function func{0}() {{ return {1}; }}",
+    "console.log('Debug {0}:', {1});",
+    "let arr{0} = [{1}, {2}, {3}];",
+    "export const value{0} = '{4}';",
+]
+# Lookup tables turning raw random bytes into field values in one C-level pass.
+# Bytes at or above the largest multiple of the range are deleted rather than
+# wrapped, so every value stays equally likely.
+_NUM_TABLE = bytes(b % 101 for b in range(256))
+_NUM_REJECT = bytes(range(256 - 256 % 101, 256))
+_LETTER_TABLE = bytes(ord('a') + b % 26 for b in range(256))
+_LETTER_REJECT = bytes(range(256 - 256 % 26, 256))
+_NUM_STRINGS = [str(i) for i in range(101)]
+_ID_STRINGS = [str(i) for i in range(1001)]
+# random_lines() draws this many lines at a time from its one generator, so
+# output can be streamed without holding it all, whatever the write size
+RANDOM_BLOCK = 1 << 16
+
+def _u16(raw):
+    """Little-endian uint16 values of raw, as a list."""
+    if np is not None:
+        return np.frombuffer(raw, dtype='<u2')
+    values = array('H', raw)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def _draw_bytes(rng, count, table, reject):
+    """count bytes from rng mapped through table, redrawing the ones in reject."""
+    out = b''
+    while len(out) < count:
+        need = count - len(out)
+        out += rng.randbytes(need + need // 3 + 16).translate(table, reject)
+    return out[:count]
+
+def _draw_u16(rng, count, bound):
+    """count uniform values in range(bound) from rng's uint16 draws, by rejection.
+
+    Draws are consumed in the same order with or without NumPy, so both
+    paths return the same values.
+    """
+    limit = 65536 - 65536 % bound
+    values = []
+    while len(values) < count:
+        need = count - len(values)
+        raw = _u16(rng.randbytes(2 * (need + need // 3 + 16)))
+        if np is not None:
+            values.extend((raw[raw < limit] % bound).tolist())
+        else:
+            values.extend(value % bound for value in raw if value < limit)
+    return values[:count]
+
+def _random_block(rng, count):
+    """Draw `count` lines from rng and return them newline-terminated."""
+    kinds = _draw_u16(rng, count, len(BULK_TEMPLATES))
+    ids = _draw_u16(rng, count, 1000)
+    nums = _draw_bytes(rng, 3 * count, _NUM_TABLE, _NUM_REJECT)
+    letters = _draw_bytes(rng, 6 * count, _LETTER_TABLE, _LETTER_REJECT).decode('ascii')
+    fmts = [BULK_TEMPLATES[kind].format for kind in range(len(BULK_TEMPLATES))]
+    strings = _NUM_STRINGS
+    lines = [
+        fmts[kinds[i]](_ID_STRINGS[ids[i] + 1], strings[nums[3 * i]], strings[nums[3 * i + 1]],
+                       strings[nums[3 * i + 2]], letters[6 * i:6 * i + 6])
+        for i in range(count)
+    ]
+    lines.append('')
+    return '\n'.join(lines)
+
+def iter_random_lines(count, seed=0):
+    """Yield random_lines(count, seed) as strings of up to RANDOM_BLOCK lines each."""
+    rng = random.Random(seed)
+    for start in range(0, count, RANDOM_BLOCK):
+        yield _random_block(rng, min(RANDOM_BLOCK, count - start))
+
+def random_lines(count, seed=0):
+    """Return `count` random_line()-style lines as a single newline-terminated string.
+
+    One seeded generator feeds blocks of RANDOM_BLOCK lines. Each block's
+    values are drawn up front as raw bytes, then mapped to fields with
+    vectorised operations (NumPy when available, the array module and
+    bytes.translate otherwise). Draws that would favour the low end of a
+    range are discarded and redrawn, so every value is equally likely. Only
+    the final formatting loop runs per line. The output depends only on
+    count and seed, never on whether NumPy is installed.
+    """
+    return ''.join(iter_random_lines(count, seed))
+
+def write_random_lines(path, count, seed=0, chunk=1_000_000):
+    """Append random_lines(count, seed) to path, one buffered write per `chunk` lines or so.
+
+    chunk only sets the write size (rounded to whole blocks); the content
+    is the same for any chunk.
+    """
+    per_write = max(1, chunk // RANDOM_BLOCK)
+    written = 0
+    batch = []
+    with open(path, 'a', encoding='utf-8') as f:
+        for block in iter_random_lines(count, seed):
+            batch.append(block)
+            if len(batch) == per_write:
+                written += f.write(''.join(batch))
+                batch = []
+        written += f.write(''.join(batch))
+    return written
+
+class TokenBucket:
+    """Allow `rate` units per second on average, with bursts up to `burst`."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
+    def take(self, n):
+        """Block until n units are available, then consume them."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # A batch bigger than the bucket is let through once the bucket is full
+            if self.tokens >= min(n, self.capacity):
+                self.tokens -= n
+                return
+            time.sleep((min(n, self.capacity) - self.tokens) / self.rate)
+
+class AppendEngine:
+    """Append generated lines to one file through a single buffered handle.
+
+    Lines are written in batches of `batch`. Throughput is capped by a token
+    bucket, in lines per second or bytes per second (or unlimited when
+    neither is set). The handle is flushed every `flush_every` batches and
+    fsynced every `fsync_every` batches (0 disables either), which sets how
+    often a file watcher such as Vite's sees the file change.
+    """
+
+    def __init__(self, path, lines_per_sec=None, bytes_per_sec=None, batch=1,
+                 flush_every=1, fsync_every=0, buffer_size=1 << 16, echo=False, line_source=random_line):
+        self.path = path
+        self.lines_bucket = TokenBucket(lines_per_sec, max(batch, lines_per_sec)) if lines_per_sec else None
+        self.bytes_bucket = TokenBucket(bytes_per_sec) if bytes_per_sec else None
+        self.batch = batch
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self.buffer_size = buffer_size
+        self.echo = echo
+        self.line_source = line_source
+        self.stats = {'lines': 0, 'bytes': 0, 'batches': 0, 'flushes': 0, 'fsyncs': 0}
+
+    def run(self, count=None, duration=None):
+        """Append until count lines have been written or duration seconds pass."""
+        deadline = time.monotonic() + duration if duration else None
+        start = time.monotonic()
+        with open(self.path, 'a', buffering=self.buffer_size) as f:
+            while count is None or self.stats['lines'] < count:
+                if deadline and time.monotonic() >= deadline:
+                    break
+                n = self.batch if count is None else min(self.batch, count - self.stats['lines'])
+                lines = [self.line_source() for _ in range(n)]
+                chunk = '\n'.join(lines) + '\n'
+                if self.lines_bucket:
+                    self.lines_bucket.take(n)
+                if self.bytes_bucket:
+                    self.bytes_bucket.take(len(chunk))
+                f.write(chunk)
+                self._after_write(f, lines, len(chunk))
+            f.flush()
+        self.stats['seconds'] = time.monotonic() - start
+        return dict(self.stats)
+
+    def _after_write(self, f, lines, size):
+        self.stats['lines'] += len(lines)
+        self.stats['bytes'] += size
+        self.stats['batches'] += 1
+        batches = self.stats['batches']
+        if self.flush_every and batches % self.flush_every == 0:
+            f.flush()
+            self.stats['flushes'] += 1
+        if self.fsync_every and batches % self.fsync_every == 0:
+            f.flush()
+            os.fsync(f.fileno())
+            self.stats['fsyncs'] += 1
+        if self.echo:
+            for line in lines:
+                print("Added:", line)
+
+# Suffix marking lines added by the churn generator, so edits never touch real code
+CHURN_MARKER = ' // churn'
+
+def plan_churn(paths, writers, ops, edit_ratio=0.3, seed=0):
+    """Build a reproducible workload: one list of operations per writer.
+
+    Files are dealt round-robin to the writers so each file has a single
+    writer and ends up identical for a given seed, however the threads
+    interleave. An operation is (path, kind, line, pick) where kind is
+    'append' or 'edit' and pick chooses which churn line an edit replaces.
+    """
+    writers = max(1, min(writers, len(paths)))
+    plans = []
+    for i in range(writers):
+        rng = random.Random(f"{seed}:{i}")
+        group = paths[i::writers]
+        count = ops // writers + (1 if i < ops % writers else 0)
+        plan = []
+        for _ in range(count):
+            path = rng.choice(group)
+            kind = 'edit' if rng.random() < edit_ratio else 'append'
+            plan.append((path, kind, random_line(rng), rng.random()))
+        plans.append(plan)
+    return plans
+
+def apply_churn_op(path, kind, line, pick):
+    """Apply one churn operation; an edit on a file with no churn lines appends instead."""
+    if kind == 'edit':
+        with open(path, 'r+', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+            marked = [i for i, text in enumerate(lines) if text.endswith(CHURN_MARKER)]
+            if marked:
+                lines[marked[int(pick * len(marked))]] = line + CHURN_MARKER
+                f.seek(0)
+                f.write('\n'.join(lines))
+                f.truncate()
+                return 'edit'
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line + CHURN_MARKER + '\n')
+    return 'append'
+
+class ChurnGenerator:
+    """Run a planned churn workload with one thread per writer.
+
+    `lines_per_sec`, if set, is the total rate shared evenly by the writers.
+    With restore=True every file is put back to its original content at the
+    end.
+    """
+
+    def __init__(self, paths, writers=4, ops=100, edit_ratio=0.3, seed=0,
+                 lines_per_sec=None, restore=False, on_write=None):
+        self.paths = sorted(paths)
+        self.plans = plan_churn(self.paths, writers, ops, edit_ratio, seed)
+        self.lines_per_sec = lines_per_sec
+        self.restore = restore
+        self.on_write = on_write
+        self.stats = {path: {'append': 0, 'edit': 0} for path in self.paths}
+        self._lock = threading.Lock()
+
+    def _writer(self, plan):
+        bucket = TokenBucket(self.lines_per_sec / len(self.plans)) if self.lines_per_sec else None
+        for op in plan:
+            if bucket:
+                bucket.take(1)
+            kind = apply_churn_op(*op)
+            with self._lock:
+                self.stats[op[0]][kind] += 1
+            if self.on_write:
+                self.on_write(op[0], kind)
+
+    def run(self):
+        """Run every writer to completion and return the elapsed seconds."""
+        originals = {}
+        if self.restore:
+            for path in self.paths:
+                with open(path, 'rb') as f:
+                    originals[path] = f.read()
+        start = time.monotonic()
+        threads = [threading.Thread(target=self._writer, args=(plan,)) for plan in self.plans]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            elapsed = time.monotonic() - start
+            for path, data in originals.items():
+                with open(path, 'wb') as f:
+                    f.write(data)
+        return elapsed
+
+def run_churn(args):
+    paths = sorted({path for pattern in args.files for path in glob.glob(pattern, recursive=True)
+                    if os.path.isfile(path)})
+    if not paths:
+        raise SystemExit(f"No files match {' '.join(args.files)}")
+    churn = ChurnGenerator(paths, args.writers, args.count or 100, args.edit_ratio,
+                           args.seed or 0, None if args.unlimited else args.lps, args.restore)
+    elapsed = churn.run()
+    for path, counts in churn.stats.items():
+        print(f"{path}: {counts['append']} appends, {counts['edit']} edits")
+    total = sum(sum(counts.values()) for counts in churn.stats.values())
+    print(f"\n{total} operations on {len(paths)} files by {len(churn.plans)} writers "
+          f"in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.0f} ops/s)")
+
+def output_signature(out_dir):
+    """Return (newest mtime_ns, {path: (size, mtime_ns)}) for the files under out_dir."""
+    files = {}
+    newest = 0
+    for dir_name, _, names in os.walk(out_dir):
+        for name in names:
+            path = os.path.join(dir_name, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files[path] = (st.st_size, st.st_mtime_ns)
+            newest = max(newest, st.st_mtime_ns)
+    return newest, files
+
+class RebuildProbe:
+    """Measure how long a watching build takes to react to appends.
+
+    For each sample a batch of lines is appended to `path` and the write is
+    timestamped. `out_dir` (for example the dist/ of `vite build --watch`)
+    is then polled until its contents change. The latency runs from the
+    write to the newest output mtime, or to when the change was seen if the
+    mtimes are older. After a change the probe waits `settle` seconds so
+    one rebuild isn't counted twice.
+    """
+
+    def __init__(self, path, out_dir, batch=1, poll=0.05, timeout=30.0, settle=0.5, echo=False):
+        self.path = path
+        self.out_dir = out_dir
+        self.batch = batch
+        self.poll = poll
+        self.timeout = timeout
+        self.settle = settle
+        self.echo = echo
+
+    def wait_for_change(self, before, since_ns):
+        """Poll until the output differs from `before`; return the latency in seconds or None."""
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll)
+            newest, files = output_signature(self.out_dir)
+            if files != before[1]:
+                seen_ns = time.time_ns()
+                # Give the bundler a moment to finish writing every chunk
+                time.sleep(self.settle)
+                newest = max(newest, output_signature(self.out_dir)[0])
+                done_ns = newest if newest > since_ns else seen_ns
+                return (done_ns - since_ns) / 1e9
+        return None
+
+    def measure(self, samples):
+        """Return [(file size after the write, latency in seconds or None)] for each sample."""
+        results = []
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for _ in range(samples):
+                before = output_signature(self.out_dir)
+                lines = [random_line() for _ in range(self.batch)]
+                written_ns = time.time_ns()
+                f.write('\n'.join(lines) + '\n')
+                f.flush()
+                size = os.fstat(f.fileno()).st_size
+                latency = self.wait_for_change(before, written_ns)
+                results.append((size, latency))
+                if self.echo:
+                    shown = 'timeout' if latency is None else f"{latency * 1000:.0f} ms"
+                    print(f"{size:>10} bytes  {shown}")
+        return results
+
+def summarize_rebuilds(results, buckets=4):
+    """Overall latency percentiles plus the median per file-size bucket."""
+    latencies = [latency for _, latency in results if latency is not None]
+    summary = {
+        'samples': len(results),
+        'timeouts': len(results) - len(latencies),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'by_size': [],
+    }
+    done = [(size, latency) for size, latency in results if latency is not None]
+    step = max(1, -(-len(done) // buckets))
+    for i in range(0, len(done), step):
+        chunk = done[i:i + step]
+        summary['by_size'].append({
+            'min_bytes': chunk[0][0],
+            'max_bytes': chunk[-1][0],
+            'p50_ms': percentile([latency for _, latency in chunk], 50) * 1000,
+        })
+    return summary
+
+def run_measure(args):
+    watcher = None
+    if args.watch_cmd:
+        before = output_signature(args.measure)
+        watcher = subprocess.Popen(shlex.split(args.watch_cmd))
+        print(f"Waiting for the initial build of {args.measure}...")
+        initial = RebuildProbe(args.path, args.measure, timeout=args.timeout * 10)
+        if initial.wait_for_change(before, time.time_ns()) is None:
+            watcher.terminate()
+            raise SystemExit("The watch command never produced any output")
+    try:
+        probe = RebuildProbe(args.path, args.measure, args.batch, args.poll, args.timeout,
+                             args.settle, echo=not args.quiet)
+        summary = summarize_rebuilds(probe.measure(args.count or 20))
+    finally:
+        if watcher:
+            watcher.terminate()
+            watcher.wait()
+    print(f"\n{summary['samples']} samples, {summary['timeouts']} timeouts: "
+          f"p50 {summary['p50_ms']:.0f} ms, p90 {summary['p90_ms']:.0f} ms, p99 {summary['p99_ms']:.0f} ms")
+    for bucket in summary['by_size']:
+        print(f"  {bucket['min_bytes']:>10}-{bucket['max_bytes']:<10} bytes  p50 {bucket['p50_ms']:.0f} ms")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+            f.write('\n')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Append random TypeScript lines to a file.')
+    parser.add_argument('--path', default=file_path, help=f'file to append to (default: {file_path})')
+    parser.add_argument('--lps', type=float, default=None,
+                        help='target lines per second (default: 1 unless --bps is given)')
+    parser.add_argument('--bps', type=float, default=None, help='target bytes per second')
+    parser.add_argument('--unlimited', action='store_true', help='no rate limit')
+    parser.add_argument('--batch', type=int, default=1, help='lines per write (default: 1)')
+    parser.add_argument('--flush-every', type=int, default=1,
+                        help='flush after this many batches, 0 for never (default: 1)')
+    parser.add_argument('--fsync-every', type=int, default=0,
+                        help='fsync after this many batches, 0 for never (default: 0)')
+    parser.add_argument('--count', type=int, default=None, help='stop after this many lines')
+    parser.add_argument('--duration', type=float, default=None, help='stop after this many seconds')
+    parser.add_argument('--seed', type=int, default=None, help='seed the random generator')
+    parser.add_argument('--quiet', action='store_true', help="don't print each added line")
+    parser.add_argument('--files', action='append', metavar='GLOB',
+                        help="churn mode: spread appends and edits over files matching GLOB "
+                             "(repeatable), e.g. 'src/pages/**/*.tsx'")
+    parser.add_argument('--writers', type=int, default=4, help='churn mode: concurrent writers (default: 4)')
+    parser.add_argument('--edit-ratio', type=float, default=0.3,
+                        help='churn mode: share of operations that edit a line in place (default: 0.3)')
+    parser.add_argument('--restore', action='store_true',
+                        help='churn mode: put every file back as it was when done')
+    parser.add_argument('--measure', metavar='OUT_DIR',
+                        help='measure mode: time how long OUT_DIR takes to change after each append')
+    parser.add_argument('--watch-cmd', help="measure mode: start this watcher first, "
+                                            "e.g. 'npx vite build --watch'")
+    parser.add_argument('--poll', type=float, default=0.05,
+                        help='measure mode: seconds between polls (default: 0.05)')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='measure mode: seconds to wait for a rebuild (default: 30)')
+    parser.add_argument('--settle', type=float, default=0.5,
+                        help='measure mode: seconds to let a rebuild finish (default: 0.5)')
+    parser.add_argument('--json', metavar='FILE', help='measure mode: also write the summary as JSON')
+    parser.add_argument('--bulk', type=int, metavar='N',
+                        help='bulk mode: append N lines at once as fast as possible (seeded by --seed)')
+    args = parser.parse_args(argv)
+
+    if args.bulk:
+        start = time.perf_counter()
+        size = write_random_lines(args.path, args.bulk, args.seed or 0)
+        elapsed = time.perf_counter() - start
+        print(f"Appended {args.bulk} lines ({size} bytes) in {elapsed:.2f}s "
+              f"({args.bulk / elapsed if elapsed else 0:.0f} lines/s)")
+        return
+
+    if args.files:
+        run_churn(args)
+        return
+    if args.measure:
+        if args.seed is not None:
+            random.seed(args.seed)
+        run_measure(args)
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    lps = args.lps
+    if lps is None and args.bps is None and not args.unlimited:
+        lps = 1
+    engine = AppendEngine(args.path, None if args.unlimited else lps,
+                          None if args.unlimited else args.bps, args.batch,
+                          args.flush_every, args.fsync_every, echo=not args.quiet)
+    try:
+        stats = engine.run(args.count, args.duration)
+    except KeyboardInterrupt:
+        stats = dict(engine.stats)
+    print(f"Appended {stats['lines']} lines ({stats['bytes']} bytes) in {stats['batches']} batches, "
+          f"{stats['flushes']} flushes, {stats['fsyncs']} fsyncs")
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,29 @@ This script will fix all the unused variable and type errors
 
 import os
 import sys
+import argparse
+
+from scaffold import FSYNC_POLICIES, Collector, DryRunEmitter, Emitter, make_backend
+
+# Emitter used by write_file while main() or collect_fixes() runs
+_emitter = None
+
+def log_fixed(path):
+    """Report a file that has been written"""
+    print(f"✓ Fixed: {path}")
 
 def write_file(path, content):
     """Write content to file, creating directories if needed"""
+    if _emitter is not None:
+        _emitter.emit(path, content)
+        return
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, 'w', encoding='utf-8') as f:
         f.write(content)
-    print(f"✓ Fixed: {path}")
+    log_fixed(path)
 
-def main():
+def write_fixes():
+    """Write every fixed file through write_file"""
     # Fix src/App.tsx - Remove unused React import
     write_file('src/App.tsx', '''import { Suspense, lazy } from 'react'
 import { BrowserRouter, Routes, Route, Navigate } from 'react-router-dom'
@@ -285,7 +299,7 @@ const Footer: React.FC = () => {
         <Grid container spacing={4}>
           <Grid item xs={12} sm={4}>
             <Typography variant="h6" gutterBottom>
-              React Academy
+              {'React Academy'}
             </Typography>
             <Typography variant="body2" color="text.secondary">
               Your journey to knowledge starts here.
@@ -328,7 +342,7 @@ const Footer: React.FC = () => {
         </Grid>
         <Box mt={3}>
           <Typography variant="body2" color="text.secondary" align="center">
-            © {currentYear} React Academy. All rights reserved.
+            © {currentYear} {'React Academy'}. All rights reserved.
           </Typography>
         </Box>
       </Container>
@@ -546,7 +560,14 @@ const ReviewSection: React.FC<ReviewSectionProps> = ({ bookId }) => {
           )
         }
       }
-      await fetchReviews()
+
+      // The database trigger has adjusted likes_count; mirror it here
+      // instead of reloading every review
+      const delta = review.user_has_liked ? -1 : 1
+      setReviews(prev => prev.map(r => (r.id === review.id
+        ? { ...r, user_has_liked: !review.user_has_liked, likes_count: r.likes_count + delta }
+        : r
+      )))
     } catch (error) {
       console.error('Error liking review:', error)
     }
@@ -928,7 +949,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
 ''')
 
     # Fix src/pages/Admin/BooksManagement.tsx - Remove unused variables
-    write_file('src/pages/Admin/BooksManagement.tsx', '''import React, { useState, useEffect } from 'react'
+    write_file('src/pages/Admin/BooksManagement.tsx', '''import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -957,13 +978,19 @@ import { supabase } from '@/services/supabase'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const BooksManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [books, setBooks] = useState<Book[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: books,
+    loading,
+    loadingMore,
+    reload: fetchBooks,
+    sentinelRef
+  } = useInfiniteList((cursor) => booksApi.getAll(cursor))
   const [dialogOpen, setDialogOpen] = useState(false)
   const [editingBook, setEditingBook] = useState<Book | null>(null)
   const [formData, setFormData] = useState({
@@ -976,21 +1003,6 @@ const BooksManagement: React.FC = () => {
   const [coverFile, setCoverFile] = useState<File | null>(null)
   const [bookFile, setBookFile] = useState<File | null>(null)
 
-  useEffect(() => {
-    fetchBooks()
-  }, [])
-
-  const fetchBooks = async () => {
-    try {
-      const data = await booksApi.getAll()
-      setBooks(data)
-    } catch (error) {
-      console.error('Error fetching books:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleOpenDialog = (book?: Book) => {
     if (book) {
       setEditingBook(book)
@@ -1173,6 +1185,10 @@ const BooksManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog open={dialogOpen} onClose={handleCloseDialog} maxWidth="sm" fullWidth>
         <DialogTitle>{editingBook ? 'Edit Book' : 'Add Book'}</DialogTitle>
         <DialogContent>
@@ -1273,7 +1289,7 @@ export default BooksManagement
     # Part 2 of the script
 
     # Fix src/pages/Admin/TransactionsView.tsx - Add loading indicator
-    write_file('src/pages/Admin/TransactionsView.tsx', '''import React, { useState, useEffect } from 'react'
+    write_file('src/pages/Admin/TransactionsView.tsx', '''import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -1297,38 +1313,20 @@ import {
 import { Visibility } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
 import { Transaction } from '@/types'
-import { supabase } from '@/services/supabase'
+import { adminApi } from '@/services/api/admin'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const TransactionsView: React.FC = () => {
   const { t } = useTranslation()
-  const [transactions, setTransactions] = useState<Transaction[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: transactions,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => adminApi.getTransactions(cursor))
   const [selectedTransaction, setSelectedTransaction] = useState<Transaction | null>(null)
   const [detailsOpen, setDetailsOpen] = useState(false)
 
-  useEffect(() => {
-    fetchTransactions()
-  }, [])
-
-  const fetchTransactions = async () => {
-    try {
-      const { data, error } = await supabase
-        .from('transactions')
-        .select(`
-          *,
-          user:users(id, username, email)
-        `)
-        .order('created_at', { ascending: false })
-
-      if (error) throw error
-      setTransactions(data || [])
-    } catch (error) {
-      console.error('Error fetching transactions:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleViewDetails = (transaction: Transaction) => {
     setSelectedTransaction(transaction)
     setDetailsOpen(true)
@@ -1400,6 +1398,10 @@ const TransactionsView: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog
         open={detailsOpen}
         onClose={() => setDetailsOpen(false)}
@@ -1503,47 +1505,54 @@ import { usersApi } from '@/services/api/users'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useDebounce } from '@/hooks/useDebounce'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const UsersManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [users, setUsers] = useState<User[]>([])
-  const [filteredUsers, setFilteredUsers] = useState<User[]>([])
+  const {
+    items: users,
+    loading,
+    loadingMore,
+    reload,
+    sentinelRef
+  } = useInfiniteList((cursor) => usersApi.getAllUsers(cursor))
+  const [results, setResults] = useState<User[] | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [loading, setLoading] = useState(true)
+  const [searchRun, setSearchRun] = useState(0)
   const [anchorEl, setAnchorEl] = useState<null | HTMLElement>(null)
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
+  // Search the whole table on the server, not just the pages loaded so far
+  const debouncedQuery = useDebounce(searchQuery.trim(), 300)
 
   useEffect(() => {
-    fetchUsers()
-  }, [])
-
-  useEffect(() => {
-    if (searchQuery) {
-      const filtered = users.filter(
-        user =>
-          user.username.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          user.email.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-      setFilteredUsers(filtered)
-    } else {
-      setFilteredUsers(users)
+    if (!debouncedQuery) {
+      setResults(null)
+      return
     }
-  }, [searchQuery, users])
 
-  const fetchUsers = async () => {
-    try {
-      const data = await usersApi.getAllUsers()
-      setUsers(data)
-      setFilteredUsers(data)
-    } catch (error) {
-      console.error('Error fetching users:', error)
-    } finally {
-      setLoading(false)
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    usersApi.searchUsers(debouncedQuery, 50)
+      .then(data => {
+        if (!cancelled) setResults(data)
+      })
+      .catch(error => console.error('Error searching users:', error))
+    return () => {
+      cancelled = true
     }
+  }, [debouncedQuery, searchRun])
+
+  // Reloads the list and, while searching, the search results
+  const fetchUsers = () => {
+    reload()
+    setSearchRun(run => run + 1)
   }
 
+  const shownUsers = results ?? users
+
   const handleMenuOpen = (event: React.MouseEvent<HTMLElement>, user: User) => {
     setAnchorEl(event.currentTarget)
     setSelectedUser(user)
@@ -1687,7 +1696,7 @@ const UsersManagement: React.FC = () => {
             </TableRow>
           </TableHead>
           <TableBody>
-            {filteredUsers.map((user) => (
+            {shownUsers.map((user) => (
               <TableRow key={user.id}>
                 <TableCell>
                   <Avatar src={user.avatar_url} sx={{ width: 40, height: 40 }}>
@@ -1733,6 +1742,12 @@ const UsersManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      {results === null && (
+        <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+          {loadingMore && <CircularProgress size={24} />}
+        </Box>
+      )}
+
       <Menu
         anchorEl={anchorEl}
         open={Boolean(anchorEl)}
@@ -2049,6 +2064,7 @@ import { messagesApi } from '@/services/api/messages'
 import { notificationsApi } from '@/services/api/notifications'
 import { useAuth } from '@/context/AuthContext'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import { getPublicUrl, uploadFile } from '@/services/supabase'
 
 interface TabPanelProps {
@@ -2080,7 +2096,6 @@ const ProfilePage: React.FC = () => {
   const [books, setBooks] = useState<BookOwnership[]>([])
   const [courses, setCourses] = useState<CourseEnrollment[]>([])
   const [badges, setBadges] = useState<UserBadge[]>([])
-  const [messages, setMessages] = useState<MessageType[]>([])
   const [giftHistory, setGiftHistory] = useState<BookOwnership[]>([])
   const [isBlocked, setIsBlocked] = useState(false)
 
@@ -2096,6 +2111,18 @@ const ProfilePage: React.FC = () => {
   const isOwnProfile = !userId || userId === currentUser?.id
   const profileId = userId || currentUser?.id
 
+  // Messages are private, so only the owner's profile pages through them
+  const {
+    items: messages,
+    loadingMore: loadingMoreMessages,
+    sentinelRef: messagesSentinelRef
+  } = useInfiniteList<MessageType>(
+    (cursor) => isOwnProfile && profileId
+      ? messagesApi.getUserMessages(profileId, cursor)
+      : Promise.resolve({ items: [], nextCursor: null }),
+    [profileId, isOwnProfile]
+  )
+
   useEffect(() => {
     if (profileId) {
       fetchProfile()
@@ -2133,9 +2160,6 @@ const ProfilePage: React.FC = () => {
 
       // Fetch additional data for own profile
       if (isOwnProfile) {
-        const messagesData = await messagesApi.getUserMessages(profileId!)
-        setMessages(messagesData)
-
         // Filter gift history
         const giftsReceived = booksData.filter((b: BookOwnership) => b.is_gift)
         setGiftHistory(giftsReceived)
@@ -2643,6 +2667,9 @@ const ProfilePage: React.FC = () => {
                 </ListItem>
               ))}
             </List>
+            <Box ref={messagesSentinelRef} display="flex" justifyContent="center" py={2}>
+              {loadingMoreMessages && <CircularProgress size={24} />}
+            </Box>
           </TabPanel>
 
           <TabPanel value={tabValue} index={3}>
@@ -2722,6 +2749,45 @@ const ProfilePage: React.FC = () => {
 export default ProfilePage
 ''')
 
+def apply_fixes(emitter):
+    """Write every fixed file through emitter and return what its close() returns"""
+    global _emitter
+    _emitter = emitter
+    try:
+        write_fixes()
+    finally:
+        _emitter = None
+    return emitter.close()
+
+def collect_fixes():
+    """Return {path: content} for every fixed file, without touching the disk"""
+    return apply_fixes(Collector())
+
+def main(argv=None):
+    """Write all fixed files, then print a summary"""
+    parser = argparse.ArgumentParser(description='Fix TypeScript errors in the generated app.')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print unified diffs against the existing files instead of writing')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of threads writing files (default: 1)')
+    parser.add_argument('--atomic', action='store_true',
+                        help='write each file to a temp file and rename it into place')
+    parser.add_argument('--fsync', choices=FSYNC_POLICIES, default='none',
+                        help='when to fsync written files (default: none)')
+    args = parser.parse_args(argv)
+
+    if args.dry_run:
+        emitter = DryRunEmitter()
+    else:
+        emitter = Emitter(backend=make_backend(args.workers), log=log_fixed,
+                          atomic=args.atomic, fsync=args.fsync)
+    stats = apply_fixes(emitter)
+
+    if args.dry_run:
+        print(f"\nDry run: {stats['written']} files would change, {stats['skipped']} unchanged "
+              f"(+{stats['bytes_added']}/-{stats['bytes_removed']} bytes)")
+        return
+
     print("\n✅ All TypeScript errors have been fixed!")
     print("Files updated:")
     print("  - src/App.tsx")
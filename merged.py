@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Random access to merged_code.txt snapshots, and bundling trees into them.
+
+A snapshot is a concatenation of files, each introduced by a header:
+
+    \\n\\n// ===== path =====\\n\\n
+
+followed by the file's content, up to the next header or the end of the
+snapshot. MergedSnapshot memory-maps a snapshot and serves any file as a
+slice, using an index of (path, offset, length).
+
+Bundles written by bundle() end with one more section, INDEX_SECTION,
+holding that index as JSON plus a fixed-size footer with its offset, so a
+reader seeks straight to it. For plain snapshots such as merged_code.txt
+the index is built by one scan for the headers and cached next to the
+snapshot as <snapshot>.idx, rebuilt when the snapshot's size or mtime
+changes. Either way, opening one of thousands of snapshots is cheap.
+
+iter_sections() streams (path, content) pairs from any binary file object,
+holding one section at a time, so a bundle can be piped between machines:
+
+    python merged.py bundle . - --fixes | ssh host 'cd app && python merged.py unbundle - .'
+    python merged.py list merged_code.txt
+    python merged.py cat merged_code.txt src/App.tsx
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import tempfile
+
+from scaffold import MANIFEST_NAME, DryRunEmitter, Emitter, content_hash, file_matches, make_backend, \
+    safe_target, select_paths, write_atomic
+
+HEADER = re.compile(rb'\n\n// ===== ([^\n]*?) =====\n\n')
+INDEX_SUFFIX = '.idx'
+INDEX_SECTION = '.merged-index'
+# Last bytes of a bundle: the offset of the JSON index, zero-padded to a fixed width
+FOOTER = b'\n// merged-index %020d\n'
+FOOTER_SIZE = len(FOOTER % 0)
+FOOTER_RE = re.compile(rb'\n// merged-index (\d{20})\n\Z')
+# Directories bundle_tree() never descends into
+SKIP_DIRS = {'.git', 'node_modules', 'dist', '.scaffold-store'}
+# Streamed bytes are rescanned this far back so a header split across reads is found
+_OVERLAP = 4096
+# unbundle() writes out queued files whenever this many bytes are pending
+FLUSH_BYTES = 64 << 20
+
+
+def header(path):
+    if '\n' in path:
+        raise ValueError(f"path {path!r} cannot be stored in a merged snapshot")
+    return b'\n\n// ===== ' + path.encode('utf-8') + b' =====\n\n'
+
+
+def build_index(data):
+    """Return [(path, offset, length)] for the sections of data (bytes or mmap).
+
+    Anything before the first header is not part of a section. If a path
+    appears more than once, each occurrence is listed.
+    """
+    sections = []
+    matches = list(HEADER.finditer(data))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+        path = match.group(1).decode('utf-8')
+        if path != INDEX_SECTION:
+            sections.append((path, match.end(), end - match.end()))
+    return sections
+
+
+def read_trailer(data):
+    """Return the [(path, offset, length, sha256)] stored at the end of a bundle, or None."""
+    match = FOOTER_RE.search(data, max(0, len(data) - FOOTER_SIZE))
+    if not match:
+        return None
+    start = int(match.group(1))
+    if not data[:start].endswith(header(INDEX_SECTION)):
+        return None
+    index = json.loads(data[start:len(data) - FOOTER_SIZE])
+    return [tuple(entry) for entry in index['files']]
+
+
+def index_path(snapshot):
+    return snapshot + INDEX_SUFFIX
+
+
+def load_index(snapshot, data=None):
+    """Return the cached index of snapshot, rebuilding it from data if stale."""
+    st = os.stat(snapshot)
+    try:
+        with open(index_path(snapshot), encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['size'] == st.st_size and cached['mtime_ns'] == st.st_mtime_ns:
+            return [tuple(section) for section in cached['sections']]
+    except (OSError, ValueError, KeyError):
+        pass
+    if data is None:
+        with open(snapshot, 'rb') as f:
+            data = f.read()
+    sections = build_index(data)
+    cached = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sections': sections}
+    try:
+        write_atomic(index_path(snapshot), json.dumps(cached, separators=(',', ':')).encode('utf-8'))
+    except OSError:
+        # A read-only snapshot directory just means rescanning next time
+        pass
+    return sections
+
+
+class MergedSnapshot:
+    """Read-only, memory-mapped view of a merged snapshot or bundle."""
+
+    def __init__(self, snapshot):
+        self.path = snapshot
+        with open(snapshot, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b''
+        trailer = read_trailer(self._map)
+        if trailer is not None:
+            self.sections = [entry[:3] for entry in trailer]
+            self.digests = {entry[0]: entry[3] for entry in trailer}
+        else:
+            self.sections = load_index(snapshot, self._map)
+            self.digests = {}
+        # path -> (offset, length); a repeated path resolves to its last section
+        self.index = {path: (offset, length) for path, offset, length in self.sections}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, path):
+        return path in self.index
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def paths(self):
+        """Return the file paths in snapshot order."""
+        return list(self.index)
+
+    def size(self, path):
+        """Return the size in bytes of path's content."""
+        return self.index[path][1]
+
+    def sha256(self, path):
+        """Return the hex SHA-256 of path's content (from the trailer for bundles)."""
+        digest = self.digests.get(path)
+        return digest if digest is not None else content_hash(self.read(path))
+
+    def read(self, path):
+        """Return the bytes of a single file."""
+        offset, length = self.index[path]
+        return self._map[offset:offset + length]
+
+    def __iter__(self):
+        """Yield (path, bytes) for every section in snapshot order."""
+        for path, offset, length in self.sections:
+            yield path, self._map[offset:offset + length]
+
+
+def iter_sections(f, chunk_size=1 << 16):
+    """Yield (path, bytes) for each section read from binary file object f.
+
+    Only the section being read is kept in memory, so this also works on
+    pipes and compressed streams, where no index can be built. A bundle's
+    index section is not yielded.
+    """
+    parts = []
+    tail = b''
+    path = None
+    while True:
+        chunk = f.read(chunk_size)
+        # Only the unmatched tail of the last read is scanned again, never the whole section
+        window = tail + chunk
+        pos = 0
+        for match in HEADER.finditer(window):
+            if path is not None and path != INDEX_SECTION:
+                parts.append(window[pos:match.start()])
+                yield path, b''.join(parts)
+            parts = []
+            path = match.group(1).decode('utf-8')
+            pos = match.end()
+        if not chunk:
+            break
+        keep = max(pos, len(window) - _OVERLAP)
+        # Before the first header nothing is kept but the tail, enough to find it
+        if path is not None:
+            parts.append(window[pos:keep])
+        tail = window[keep:]
+    if path is not None and path != INDEX_SECTION:
+        parts.append(window[pos:])
+        yield path, b''.join(parts)
+
+
+def bundle(root, paths, out):
+    """Stream the files at paths (relative to root) into binary file object out.
+
+    Files are copied in chunks and hashed on the way, then the index and
+    footer are appended. Returns the index entries.
+    """
+    entries = []
+    offset = 0
+    for path in paths:
+        head = header(path)
+        out.write(head)
+        offset += len(head)
+        h = hashlib.sha256()
+        length = 0
+        with open(os.path.join(root, path), 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                out.write(chunk)
+                h.update(chunk)
+                length += len(chunk)
+        entries.append([path, offset, length, h.hexdigest()])
+        offset += length
+    head = header(INDEX_SECTION)
+    index = json.dumps({'files': entries}, separators=(',', ':')).encode('utf-8')
+    out.write(head + index + FOOTER % (offset + len(head)))
+    return entries
+
+
+def tree_paths(root, skip=()):
+    """Return every file under root as a sorted relative path, minus build output and manifests.
+
+    Directories in skip (any path form) are left out as well.
+    """
+    skip = {os.path.abspath(path) for path in skip}
+    paths = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = [name for name in dir_names if name not in SKIP_DIRS
+                        and os.path.abspath(os.path.join(dir_path, name)) not in skip]
+        for name in file_names:
+            if name != MANIFEST_NAME:
+                paths.append(os.path.relpath(os.path.join(dir_path, name), root).replace(os.sep, '/'))
+    return sorted(paths)
+
+
+def bundle_tree(root, out_path, paths=None):
+    """Bundle root (or just paths under it) into out_path, '-' for stdout."""
+    if paths is None:
+        paths = tree_paths(root)
+    if out_path == '-':
+        entries = bundle(root, paths, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+        return entries
+    # Written beside the target and renamed, so a reader never maps a half-written bundle
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(out_path) or '.',
+                               prefix='.' + os.path.basename(out_path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            entries = bundle(root, paths, f)
+        os.replace(tmp, out_path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return entries
+
+
+def unbundle(sections, emitter, only=(), exclude=()):
+    """Emit (path, bytes) sections through emitter, skipping files already on disk as-is.
+
+    Queued files are written out every FLUSH_BYTES, so memory stays bounded
+    however large the snapshot is. A section whose path would land outside
+    emitter.root raises ValueError. Returns the emitter's stats.
+    """
+    queued = 0
+    for path, data in sections:
+        if not select_paths([path], only, exclude):
+            continue
+        digest = content_hash(data)
+        if file_matches(safe_target(emitter.root, path), data, digest):
+            emitter.stats['skipped'] += 1
+            continue
+        emitter.emit(path, data, digest=digest)
+        queued += len(data)
+        if queued >= FLUSH_BYTES:
+            emitter.flush()
+            queued = 0
+    return emitter.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Read, bundle and unbundle merged_code.txt snapshots.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='list the files in a snapshot')
+    list_parser.add_argument('snapshot')
+
+    cat_parser = commands.add_parser('cat', help='print files from a snapshot')
+    cat_parser.add_argument('snapshot')
+    cat_parser.add_argument('paths', nargs='+')
+
+    bundle_parser = commands.add_parser('bundle', help='bundle a generated tree into a snapshot')
+    bundle_parser.add_argument('root', help='tree to bundle')
+    bundle_parser.add_argument('out', help="snapshot to write, '-' for stdout")
+    bundle_parser.add_argument('--fixes', action='store_true',
+                               help='bundle only the files filler1.py rewrites, as in merged_code.txt')
+    bundle_parser.add_argument('--only', action='append', default=[], metavar='GLOB',
+                               help='bundle only matching paths (repeatable)')
+    bundle_parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                               help='skip matching paths (repeatable)')
+
+    unbundle_parser = commands.add_parser('unbundle', help='write a snapshot back out as files')
+    unbundle_parser.add_argument('snapshot', help="snapshot to read, '-' for stdin")
+    unbundle_parser.add_argument('root', help='directory to write into')
+    unbundle_parser.add_argument('--only', action='append', default=[], metavar='GLOB',
+                                 help='write only matching paths (repeatable)')
+    unbundle_parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                                 help='skip matching paths (repeatable)')
+    unbundle_parser.add_argument('--dry-run', action='store_true',
+                                 help='print a unified diff of what would change instead of writing')
+    unbundle_parser.add_argument('--workers', type=int, default=1, help='threads writing files (default: 1)')
+    unbundle_parser.add_argument('--atomic', action='store_true',
+                                 help='write each file to a temp file and rename it into place')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        with MergedSnapshot(args.snapshot) as snapshot:
+            for path in snapshot.paths():
+                print(f"{snapshot.size(path):>8}  {path}")
+    elif args.command == 'cat':
+        with MergedSnapshot(args.snapshot) as snapshot:
+            for path in args.paths:
+                if path not in snapshot:
+                    sys.exit(f"{path} not found in {args.snapshot}")
+                sys.stdout.buffer.write(snapshot.read(path))
+        sys.stdout.flush()
+    elif args.command == 'bundle':
+        if args.fixes:
+            from templatepack import load_fixes_pack
+            with load_fixes_pack() as pack:
+                paths = pack.paths()
+        else:
+            paths = tree_paths(args.root)
+        entries = bundle_tree(args.root, args.out, select_paths(paths, args.only, args.exclude))
+        if args.out != '-':
+            print(f"Bundled {len(entries)} files ({sum(entry[2] for entry in entries)} bytes) into {args.out}")
+    else:
+        if args.dry_run:
+            emitter = DryRunEmitter(root=args.root)
+        else:
+            emitter = Emitter(root=args.root, backend=make_backend(args.workers), atomic=args.atomic)
+        if args.snapshot == '-':
+            stats = unbundle(iter_sections(sys.stdin.buffer), emitter, args.only, args.exclude)
+        else:
+            with MergedSnapshot(args.snapshot) as snapshot:
+                stats = unbundle(snapshot, emitter, args.only, args.exclude)
+        print(f"{'Would write' if args.dry_run else 'Written'} {stats['written']}, "
+              f"unchanged {stats['skipped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Layered view over several template packs.
+
+A full setup runs Code.py and then filler1.py, which rewrites files Code.py
+just wrote. An Overlay resolves the layers in memory instead: for every path
+the highest layer that defines it wins, only that layer's copy is ever
+decompressed, and each path is written exactly once.
+
+An Overlay offers the same read interface as TemplatePack (paths, size,
+sha256, read), so it can be emitted the same way.
+"""
+
+
+class Overlay:
+    """Resolve (name, pack) layers, lowest priority first."""
+
+    def __init__(self, layers):
+        self.layers = list(layers)
+        # path -> (layer name, pack); paths keep the order they first appeared in
+        self.winners = {}
+        # path -> names of the lower layers it overrides
+        self.shadowed = {}
+        for name, pack in self.layers:
+            for path in pack.paths():
+                if path in self.winners:
+                    self.shadowed.setdefault(path, []).append(self.winners[path][0])
+                self.winners[path] = (name, pack)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, path):
+        return path in self.winners
+
+    def close(self):
+        for _, pack in self.layers:
+            pack.close()
+
+    def paths(self):
+        """Return every resolved path."""
+        return list(self.winners)
+
+    def winner(self, path):
+        """Return the name of the layer path is taken from."""
+        return self.winners[path][0]
+
+    def size(self, path):
+        return self.winners[path][1].size(path)
+
+    def sha256(self, path):
+        return self.winners[path][1].sha256(path)
+
+    def read(self, path):
+        return self.winners[path][1].read(path)
+
+    def report(self, paths=None):
+        """Return one line per path naming the winning layer and what it overrides."""
+        lines = []
+        for path in self.paths() if paths is None else paths:
+            line = f"{self.winner(path):<8} {path}"
+            if path in self.shadowed:
+                line += f"  (overrides {', '.join(self.shadowed[path])})"
+            lines.append(line)
+        return lines
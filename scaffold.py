@@ -0,0 +1,458 @@
+"""
+Shared write path for the project generators.
+
+Code.py and filler1.py hand every generated file to an Emitter instead of
+writing it directly, so features such as incremental regeneration apply to
+both scripts the same way.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+# difflib, tempfile and concurrent.futures are imported where they are used:
+# together they make up most of this module's import time, and a plain
+# serial, non-atomic run needs none of them.
+
+MANIFEST_NAME = '.scaffold-manifest.json'
+
+# fsync policies: never, after each file, or once for every file at the end
+FSYNC_POLICIES = ('none', 'file', 'batch')
+
+# Follows a diff line that ends without a newline in the file itself
+NO_NEWLINE = '\\ No newline at end of file\n'
+
+
+def _current_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import; os.umask() is process-wide and not safe to call from threads
+_UMASK = _current_umask()
+
+
+def content_hash(data):
+    """Return the hex SHA-256 of the given bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(root):
+    """Load the manifest stored under root, or an empty one.
+
+    It maps each emitted path to {"sha256", "size", "mtime_ns"} as recorded
+    right after the file was last written.
+    """
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(root, manifest, fsync=False):
+    """Write the manifest under root, sorted so it diffs cleanly.
+
+    With fsync the file and then root are synced, so the rename is durable.
+    """
+    data = (json.dumps(manifest, indent=2, sort_keys=True) + '\n').encode('utf-8')
+    write_atomic(os.path.join(root, MANIFEST_NAME), data, fsync=fsync)
+    if fsync:
+        fsync_path(root)
+
+
+def glob_to_regex(pattern):
+    """Compile a path glob: * and ? stay within one directory, ** spans any depth.
+
+    A pattern also matches everything below it, so 'src/pages/Admin' selects
+    the whole directory.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(parts) + '(?:/.*)?')
+
+
+def select_paths(paths, only=(), exclude=()):
+    """Return the paths matching any `only` glob (all if none) and no `exclude` glob."""
+    only = [glob_to_regex(p.strip('/')) for p in only]
+    exclude = [glob_to_regex(p.strip('/')) for p in exclude]
+    return [path for path in paths
+            if (not only or any(r.fullmatch(path) for r in only))
+            and not any(r.fullmatch(path) for r in exclude)]
+
+
+def check_path(path):
+    """Raise ValueError unless path is relative and has no '..' component.
+
+    Paths read from manifests, snapshots and patches go through here (or
+    safe_target()) before anything is written or removed under a root.
+    """
+    if (not path or path.startswith(('/', '\\')) or os.path.isabs(path) or os.path.splitdrive(path)[0]
+            or '..' in re.split(r'[/\\]', path)):
+        raise ValueError(f"unsafe path {path!r}: must be relative and stay inside the tree")
+
+
+def safe_target(root, path):
+    """Return path joined onto root, raising ValueError if it would land outside root.
+
+    Besides check_path()'s rules, a symlink under root that leads out of it
+    is refused too.
+    """
+    check_path(path)
+    target = os.path.join(root, path)
+    real_root = os.path.realpath(root)
+    if os.path.commonpath([real_root, os.path.realpath(target)]) != real_root:
+        raise ValueError(f"unsafe path {path!r}: resolves outside {root}")
+    return target
+
+
+def write_atomic(target, data, fsync=False):
+    """Write data to target via a temp file in the same directory and a rename.
+
+    Readers (and a crash) only ever see the old file or the complete new one,
+    never a truncated one. The temp file gets the permissions a plain open()
+    would have produced.
+    """
+    tmp = write_temp(target, data, fsync=fsync)
+    try:
+        os.replace(tmp, target)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+
+
+def write_temp(target, data, fsync=False):
+    """Write data to a new temp file beside target and return its path.
+
+    The caller renames it into place (or removes it); write_atomic() does both
+    steps for a single file.
+    """
+    import tempfile
+    dir_name = os.path.dirname(target) or '.'
+    fd, tmp = tempfile.mkstemp(dir=dir_name, prefix='.' + os.path.basename(target) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, 0o666 & ~_UMASK)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+    return tmp
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def file_matches(target, data, digest=None):
+    """True if the file at target holds exactly data.
+
+    Sizes are compared first and the file is then hashed in chunks, so an
+    unchanged file is never loaded whole and a resized one is never read.
+    """
+    try:
+        if os.path.getsize(target) != len(data):
+            return False
+    except OSError:
+        return False
+    h = hashlib.sha256()
+    with open(target, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest() == (digest or content_hash(data))
+
+
+def iter_diff(path, target, data):
+    """Yield the lines of a unified diff from the file at target to data.
+
+    A line missing its final newline is yielded with one added, followed by
+    NO_NEWLINE as a line of its own.
+    """
+    import difflib
+    try:
+        with open(target, 'rb') as f:
+            old = f.read()
+        fromfile = 'a/' + path
+    except FileNotFoundError:
+        old = b''
+        fromfile = '/dev/null'
+    old_lines = old.decode('utf-8', 'replace').splitlines(keepends=True)
+    new_lines = data.decode('utf-8', 'replace').splitlines(keepends=True)
+    for line in difflib.unified_diff(old_lines, new_lines, fromfile, 'b/' + path):
+        if line.endswith('\n'):
+            yield line
+        else:
+            yield line + '\n'
+            yield NO_NEWLINE
+
+
+def fsync_path(path):
+    """fsync a file or directory by path."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SerialBackend:
+    """Run write jobs one after another in the calling thread."""
+
+    def run(self, func, jobs):
+        for job in jobs:
+            func(job)
+
+
+class ThreadPoolBackend:
+    """Run write jobs concurrently on a pool of worker threads.
+
+    File writes release the GIL, so on network or otherwise slow filesystems
+    the run is bounded by throughput rather than per-file latency.
+    """
+
+    def __init__(self, workers=8):
+        self.workers = workers
+
+    def run(self, func, jobs):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # list() re-raises the first failure from a worker
+            list(pool.map(func, jobs))
+
+
+class Collector:
+    """Emitter stand-in that keeps emitted files in memory instead of writing them."""
+
+    def __init__(self):
+        self.files = {}
+
+    def emit(self, path, content, digest=None):
+        check_path(path)
+        self.files[path] = content
+
+    def close(self):
+        return self.files
+
+
+def make_backend(workers=1):
+    """Return the serial backend for workers <= 1, otherwise a thread pool."""
+    if workers and workers > 1:
+        return ThreadPoolBackend(workers)
+    return SerialBackend()
+
+
+class Emitter:
+    """Write generated files under a root directory.
+
+    With incremental=True a manifest of content hashes is kept next to the
+    generated tree. Files whose bytes match the manifest (and whose size and
+    mtime on disk still agree, so hand edits are noticed) are left untouched
+    so their mtimes don't change, and files that were emitted last time but
+    not this time are removed when prune is set.
+
+    With atomic=True every file is written to a temp file and renamed into
+    place, so an interrupted run never leaves a truncated file behind. fsync
+    is one of FSYNC_POLICIES: 'file' syncs each file as it is written,
+    'batch' syncs all written files once at the end of the flush (atomic
+    batches are renamed into place only after that sync). Either way the
+    touched directories, and the manifest, are synced so renames are durable.
+    """
+
+    def __init__(self, root='.', incremental=False, prune=True, backend=None, log=None,
+                 atomic=False, fsync='none'):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, not {fsync!r}")
+        self.root = root
+        self.incremental = incremental
+        self.prune = prune
+        self.atomic = atomic
+        self.fsync = fsync
+        self.backend = backend or SerialBackend()
+        self.log = log
+        self.previous = load_manifest(root) if incremental else {}
+        self.manifest = {}
+        self.pending = {}
+        self.stats = {'written': 0, 'skipped': 0, 'removed': 0}
+
+    def emit(self, path, content, digest=None):
+        """Queue content for path unless it is unchanged since the last run.
+
+        Raises ValueError for a path that would land outside root.
+        """
+        target = safe_target(self.root, path)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        if self.keep(path, digest or content_hash(data), len(data)):
+            return
+        # Keyed by path so a file emitted twice is only written once, last content wins
+        self.pending[path] = (target, data)
+
+    def keep(self, path, digest, size):
+        """Record path as emitted with the given hash and size.
+
+        Returns True (and counts the file as skipped) when an incremental run
+        finds the file on disk already current, so callers holding only the
+        hash can avoid producing the content at all.
+        """
+        record = self.previous.get(path)
+        if (self.incremental and record and record['sha256'] == digest
+                and self._unchanged_on_disk(path, record)):
+            self.manifest[path] = record
+            self.stats['skipped'] += 1
+            return True
+        self.manifest[path] = {'sha256': digest, 'size': size, 'mtime_ns': None}
+        return False
+
+    def flush(self):
+        """Write every queued file.
+
+        Each distinct directory is created once up front, then the files are
+        handed to the backend. Log lines are emitted afterwards in the order
+        the files were queued, whatever order the backend finished them in.
+        """
+        pending, self.pending = self.pending, {}
+        dirs = sorted({os.path.dirname(target) for target, _ in pending.values()} - {''})
+        for dir_name in dirs:
+            os.makedirs(dir_name, exist_ok=True)
+        if self.atomic and self.fsync == 'batch':
+            self._write_batch(list(pending.values()))
+        else:
+            self.backend.run(self._write, list(pending.values()))
+            if self.fsync == 'batch':
+                self.backend.run(fsync_path, [target for target, _ in pending.values()])
+        if self.fsync != 'none':
+            for dir_name in dirs:
+                fsync_path(dir_name)
+        self.stats['written'] += len(pending)
+        if self.incremental:
+            for path, (target, _) in pending.items():
+                self.manifest[path]['mtime_ns'] = os.stat(target).st_mtime_ns
+        if self.log:
+            for path in pending:
+                self.log(path)
+
+    def close(self):
+        """Finish the run: write queued files, prune stale ones, save the manifest, return stats."""
+        self.flush()
+        if self.incremental:
+            if self.prune:
+                for path in sorted(set(self.previous) - set(self.manifest)):
+                    try:
+                        os.remove(safe_target(self.root, path))
+                    except FileNotFoundError:
+                        continue
+                    self.stats['removed'] += 1
+            else:
+                self.manifest = dict(self.previous, **self.manifest)
+            save_manifest(self.root, self.manifest, fsync=self.fsync != 'none')
+        return dict(self.stats)
+
+    def _write_batch(self, jobs):
+        # Every temp file is written and synced before any is renamed, so a crash
+        # can never leave a renamed file whose data has not reached the disk
+        temps = {}
+
+        def write(job):
+            target, data = job
+            temps[target] = write_temp(target, data)
+
+        try:
+            self.backend.run(write, jobs)
+            self.backend.run(fsync_path, list(temps.values()))
+            for target, _ in jobs:
+                os.replace(temps[target], target)
+                del temps[target]
+        except BaseException:
+            for tmp in temps.values():
+                _remove_quietly(tmp)
+            raise
+
+    def _write(self, job):
+        target, data = job
+        if self.atomic:
+            write_atomic(target, data, fsync=self.fsync == 'file')
+            return
+        with open(target, 'wb') as f:
+            f.write(data)
+            if self.fsync == 'file':
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _unchanged_on_disk(self, path, record):
+        try:
+            st = os.stat(os.path.join(self.root, path))
+        except OSError:
+            return False
+        return st.st_size == record['size'] and st.st_mtime_ns == record['mtime_ns']
+
+
+class DryRunEmitter(Emitter):
+    """Emitter that reports what a run would change without touching the disk.
+
+    Unified diffs are streamed to out one file at a time. Files whose size
+    and hash already match are skipped without being diffed. The stats gain
+    bytes_added and bytes_removed, counted over the changed diff lines.
+    """
+
+    def __init__(self, root='.', incremental=False, prune=True, out=None, **kwargs):
+        super().__init__(root, incremental=incremental, prune=prune, **kwargs)
+        self.out = out or sys.stdout
+        self.stats.update(bytes_added=0, bytes_removed=0)
+
+    def flush(self):
+        pending, self.pending = self.pending, {}
+        for path, (target, data) in pending.items():
+            if file_matches(target, data, self.manifest[path]['sha256']):
+                self.stats['skipped'] += 1
+                continue
+            counted = None
+            for line in iter_diff(path, target, data):
+                self.out.write(line)
+                if line == NO_NEWLINE:
+                    # The line before it was given a newline the file does not have
+                    if counted:
+                        self.stats[counted] -= 1
+                    continue
+                counted = None
+                if line.startswith('+') and not line.startswith('+++'):
+                    counted = 'bytes_added'
+                elif line.startswith('-') and not line.startswith('---'):
+                    counted = 'bytes_removed'
+                if counted:
+                    # The leading +/- is diff syntax, not file content
+                    self.stats[counted] += len(line.encode('utf-8')) - 1
+            self.stats['written'] += 1
+
+    def close(self):
+        """Report the diffs and the files a real run would remove, return stats."""
+        self.flush()
+        if self.incremental and self.prune:
+            for path in sorted(set(self.previous) - set(self.manifest)):
+                if os.path.exists(os.path.join(self.root, path)):
+                    self.out.write(f"Would remove {path}\n")
+                    self.stats['removed'] += 1
+        return dict(self.stats)
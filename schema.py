@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Schema diff between two versions of the Supabase migrations.
+
+Code.py emits the schema as numbered migrations under supabase/migrations/,
+which create everything from scratch. A database set up from an older
+version needs only what changed, and must not lock hot tables such as
+messages and notifications while it is upgraded. diff parses both
+versions' migrations into named objects (tables and their columns,
+indexes, functions, triggers, policies, views, extensions) and writes an
+upgrade script containing only the statements for objects that changed:
+
+- new or dropped columns become ALTER TABLE ... ADD/DROP COLUMN
+- indexes are built and dropped CONCURRENTLY, after the transaction, so
+  writes to the table continue while they build
+- changed policies, triggers and views are dropped and recreated
+- lock_timeout is set, so an ALTER waiting behind a long transaction
+  fails instead of queueing every other query on the table behind it
+
+Changes that cannot be applied safely without knowing the data (a
+column's type, a removed table) are listed as comments for a human.
+
+    python schema.py diff old-workspace . -o upgrade.sql
+    psql "$DATABASE_URL" -f upgrade.sql
+
+Either version can be a generated tree, a template pack or a merged
+snapshot, as for delta.py.
+"""
+
+import argparse
+import re
+import sys
+
+from scaffold import select_paths
+
+MIGRATIONS = 'supabase/migrations/*.sql'
+LOCK_TIMEOUT = '5s'
+
+_NAME = r'("[^"]+"|[\w.]+)'
+PATTERNS = [
+    ('table', re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _NAME, re.I)),
+    ('index', re.compile(r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?'
+                         + _NAME + r'\s+ON\s+(?:ONLY\s+)?' + _NAME, re.I)),
+    ('function', re.compile(r'CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+' + _NAME + r'\s*(\([^)]*\))', re.I)),
+    ('trigger', re.compile(r'CREATE\s+(?:OR\s+REPLACE\s+)?TRIGGER\s+' + _NAME + r'.*?\bON\s+' + _NAME,
+                           re.I | re.S)),
+    ('policy', re.compile(r'CREATE\s+POLICY\s+' + _NAME + r'\s+ON\s+' + _NAME, re.I)),
+    ('rls', re.compile(r'ALTER\s+TABLE\s+' + _NAME + r'\s+ENABLE\s+ROW\s+LEVEL\s+SECURITY', re.I)),
+    ('materialized view', re.compile(r'CREATE\s+MATERIALIZED\s+VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _NAME,
+                                     re.I)),
+    ('view', re.compile(r'CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+' + _NAME, re.I)),
+    ('extension', re.compile(r'CREATE\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _NAME, re.I)),
+]
+ADD_COLUMN = re.compile(r'ALTER\s+TABLE\s+(?:ONLY\s+)?' + _NAME
+                        + r'\s+ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+(.*)$', re.I | re.S)
+DROP_INDEX = re.compile(r'DROP\s+INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?' + _NAME + r'\s*$', re.I)
+CONSTRAINT_WORDS = {'CONSTRAINT', 'UNIQUE', 'PRIMARY', 'CHECK', 'FOREIGN', 'EXCLUDE'}
+DOLLAR_QUOTE = re.compile(r'\$\w*\$')
+
+
+def split_statements(sql):
+    """Split SQL into statements, dropping -- comments.
+
+    Semicolons inside quoted strings, quoted identifiers and dollar-quoted
+    function bodies do not end a statement.
+    """
+    statements = []
+    current = []
+    i = 0
+    while i < len(sql):
+        ch = sql[i]
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = len(sql) if end < 0 else end
+            continue
+        if ch in "'\"":
+            end = i + 1
+            while True:
+                end = sql.find(ch, end)
+                if end < 0:
+                    end = len(sql) - 1
+                    break
+                # A doubled quote is an escaped quote
+                if sql.startswith(ch * 2, end):
+                    end += 2
+                    continue
+                break
+            current.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        dollar = DOLLAR_QUOTE.match(sql, i)
+        if dollar:
+            tag = dollar.group()
+            end = sql.find(tag, i + len(tag))
+            end = len(sql) if end < 0 else end + len(tag)
+            current.append(sql[i:end])
+            i = end
+            continue
+        if ch == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def normalize(statement):
+    """Collapse whitespace so formatting changes don't count as schema changes."""
+    return ' '.join(statement.split())
+
+
+def split_top_level(body):
+    """Split a parenthesized list on the commas that are not nested in parentheses."""
+    items = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(body):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            items.append(body[start:i])
+            start = i + 1
+    items.append(body[start:])
+    return [normalize(item) for item in items if item.strip()]
+
+
+class Table:
+    """Columns ({name: definition}) and table constraints of a CREATE TABLE."""
+
+    def __init__(self, statement):
+        body = statement[statement.index('(') + 1:statement.rindex(')')]
+        self.columns = {}
+        self.constraints = []
+        for item in split_top_level(body):
+            first = item.split(None, 1)[0]
+            if first.upper() in CONSTRAINT_WORDS:
+                self.constraints.append(item)
+            else:
+                self.columns[first] = item[len(first):].strip()
+
+
+def parse_schema(sql):
+    """Return {key: statement} for every statement, in order.
+
+    Keys are (kind, name...) for the objects in PATTERNS, so the same
+    object can be matched across versions; other statements are keyed by
+    their normalized text. An object defined again by a later migration takes
+    the later position. A later ADD COLUMN is folded into its CREATE TABLE,
+    and a later DROP INDEX removes the index it names.
+    """
+    schema = {}
+    for statement in split_statements(sql):
+        added = ADD_COLUMN.match(statement)
+        table = added and ('table', added.group(1) if added.group(1).startswith('"') else added.group(1).lower())
+        if table in schema:
+            create = schema[table]
+            end = create.rindex(')')
+            schema[table] = f"{create[:end].rstrip()},\n  {added.group(2)} {added.group(3).strip()}\n{create[end:]}"
+            continue
+        dropped = DROP_INDEX.match(statement)
+        if dropped:
+            name = dropped.group(1) if dropped.group(1).startswith('"') else dropped.group(1).lower()
+            for key in [key for key in schema if key[0] == 'index' and key[1] == name]:
+                del schema[key]
+            continue
+        for kind, pattern in PATTERNS:
+            match = pattern.match(statement)
+            if match:
+                key = (kind,) + tuple(group.lower() if not group.startswith('"') else group
+                                      for group in match.groups())
+                break
+        else:
+            key = ('other', normalize(statement))
+        schema.pop(key, None)
+        schema[key] = statement
+    return schema
+
+
+def read_migrations(source):
+    """Concatenate source's migrations, in filename order."""
+    paths = sorted(select_paths(source.paths(), [MIGRATIONS]))
+    return '\n'.join(source.read(path).decode('utf-8') for path in paths)
+
+
+def _concurrently(statement):
+    return re.sub(r'^CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?',
+                  lambda m: f"CREATE {m.group(1) or ''}INDEX CONCURRENTLY IF NOT EXISTS ",
+                  statement, flags=re.I)
+
+
+def _diff_table(name, old, new, steps, notes):
+    old_table, new_table = Table(old), Table(new)
+    for column, definition in new_table.columns.items():
+        if column not in old_table.columns:
+            steps.append(f"ALTER TABLE {name} ADD COLUMN IF NOT EXISTS {column} {definition}")
+        elif normalize(old_table.columns[column]) != normalize(definition):
+            notes.append(f"column {name}.{column} changed from '{old_table.columns[column]}' "
+                         f"to '{definition}'")
+    for column in old_table.columns:
+        if column not in new_table.columns:
+            steps.append(f"ALTER TABLE {name} DROP COLUMN IF EXISTS {column}")
+    for constraint in new_table.constraints:
+        if constraint not in old_table.constraints:
+            steps.append(f"ALTER TABLE {name} ADD {constraint}")
+    for constraint in old_table.constraints:
+        if constraint not in new_table.constraints:
+            notes.append(f"constraint on {name} removed: {constraint}")
+
+
+def diff(old_sql, new_sql):
+    """Return (steps, concurrent, notes) upgrading schema old_sql to new_sql.
+
+    steps run in one transaction, concurrent are the index builds and drops
+    that must run outside one, and notes describe changes left to a human.
+    """
+    old = parse_schema(old_sql)
+    new = parse_schema(new_sql)
+    steps = []
+    concurrent = []
+    notes = []
+    views = ('view', 'materialized view')
+    # Relations created (or recreated) by this upgrade: their indexes are built
+    # inside the transaction, since nothing else can be using them yet
+    fresh = {key[1] for key, statement in new.items()
+             if key[0] in ('table',) + views and normalize(old.get(key, '')) != normalize(statement)
+             and (key[0] != 'table' or key not in old)}
+
+    for key, statement in new.items():
+        kind = key[0]
+        previous = old.get(key)
+        if previous is not None and normalize(previous) == normalize(statement):
+            if kind == 'index' and key[2] in fresh:
+                steps.append(statement)
+            continue
+        if kind == 'table':
+            if previous is None:
+                steps.append(statement)
+            else:
+                _diff_table(key[1], previous, statement, steps, notes)
+        elif kind == 'index':
+            if key[2] in fresh:
+                steps.append(statement)
+            elif previous is None:
+                concurrent.append(_concurrently(statement))
+            else:
+                # Build the new definition beside the old one, so queries always have an index
+                name, building = key[1], key[1] + '_new'
+                concurrent.append(_concurrently(re.sub(r'\b' + re.escape(name) + r'\b', building, statement,
+                                                       count=1, flags=re.I)))
+                concurrent.append(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                concurrent.append(f"ALTER INDEX {building} RENAME TO {name}")
+        elif kind == 'function':
+            steps.append(re.sub(r'^CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION', 'CREATE OR REPLACE FUNCTION',
+                                statement, flags=re.I))
+        elif kind in ('trigger', 'policy'):
+            if previous is not None:
+                steps.append(f"DROP {kind.upper()} IF EXISTS {key[1]} ON {key[2]}")
+            steps.append(statement)
+        elif kind in views:
+            if previous is not None:
+                steps.append(f"DROP {kind.upper()} IF EXISTS {key[1]}")
+            steps.append(statement)
+        elif kind == 'extension':
+            steps.append(re.sub(r'^CREATE\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?',
+                                'CREATE EXTENSION IF NOT EXISTS ', statement, flags=re.I))
+        elif kind == 'rls':
+            steps.append(statement)
+        else:
+            steps.append('-- Added since the old version; check it is safe to run on existing data\n'
+                         + statement)
+
+    # Removed objects, dependants first
+    removed = [key for key in old if key not in new]
+    for kind in ('trigger', 'policy') + views + ('function',):
+        for key in removed:
+            if key[0] != kind:
+                continue
+            if kind in ('trigger', 'policy'):
+                steps.append(f"DROP {kind.upper()} IF EXISTS {key[1]} ON {key[2]}")
+            elif kind == 'function':
+                steps.append(f"DROP FUNCTION IF EXISTS {key[1]}{key[2]}")
+            else:
+                steps.append(f"DROP {kind.upper()} IF EXISTS {key[1]}")
+    # Dropping or recreating a view drops its indexes too
+    gone = fresh | {key[1] for key in removed if key[0] in views}
+    for key in removed:
+        if key[0] == 'index' and key[2] not in gone:
+            concurrent.append(f"DROP INDEX CONCURRENTLY IF EXISTS {key[1]}")
+        elif key[0] == 'table':
+            notes.append(f"table {key[1]} was removed; drop it by hand once nothing uses it")
+        elif key[0] == 'rls':
+            notes.append(f"row level security is no longer enabled on {key[1]}")
+        elif key[0] in ('extension', 'other'):
+            notes.append(f"no longer in the migrations: {normalize(old[key])[:100]}")
+    return steps, concurrent, notes
+
+
+def render_upgrade(steps, concurrent, notes, old_name='old', new_name='new'):
+    """Return the upgrade script, meant to be run with psql -f."""
+    lines = [f"-- Schema upgrade from {old_name} to {new_name}, generated by schema.py",
+             "-- Run with psql -f: the CONCURRENTLY statements at the end cannot run in a transaction."]
+    if not (steps or concurrent or notes):
+        return '\n'.join(lines + ['-- No schema changes.']) + '\n'
+    for note in notes:
+        lines.append(f"-- NOTE: {note}")
+    lines.append(f"\nSET lock_timeout = '{LOCK_TIMEOUT}';")
+    if steps:
+        lines.append('\nBEGIN;\n')
+        lines.extend(step + ';\n' for step in steps)
+        lines.append('COMMIT;')
+    if concurrent:
+        lines.append('\n-- Indexes are built without blocking writes. If a build fails, drop the INVALID')
+        lines.append('-- index it leaves behind and run the statement again.\n')
+        lines.extend(statement + ';' for statement in concurrent)
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Diff the Supabase migrations of two scaffold versions.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    diff_parser = commands.add_parser('diff', help='write the upgrade script from OLD to NEW')
+    diff_parser.add_argument('old', help='directory, template pack or merged snapshot')
+    diff_parser.add_argument('new', help='directory, template pack or merged snapshot')
+    diff_parser.add_argument('-o', '--output', help='file to write (default: stdout)')
+    args = parser.parse_args(argv)
+
+    from delta import open_source
+    with open_source(args.old) as old, open_source(args.new) as new:
+        old_sql, new_sql = read_migrations(old), read_migrations(new)
+    script = render_upgrade(*diff(old_sql, new_sql), old_name=args.old, new_name=args.new)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(script)
+    else:
+        sys.stdout.write(script)
+
+
+if __name__ == "__main__":
+    main()
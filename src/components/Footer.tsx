@@ -21,7 +21,7 @@ const Footer: React.FC = () => {
         <Grid container spacing={4}>
           <Grid item xs={12} sm={4}>
             <Typography variant="h6" gutterBottom>
-              React Academy
+              {'React Academy'}
             </Typography>
             <Typography variant="body2" color="text.secondary">
               Your journey to knowledge starts here.
@@ -64,7 +64,7 @@ const Footer: React.FC = () => {
         </Grid>
         <Box mt={3}>
           <Typography variant="body2" color="text.secondary" align="center">
-            © {currentYear} React Academy. All rights reserved.
+            © {currentYear} {'React Academy'}. All rights reserved.
           </Typography>
         </Box>
       </Container>
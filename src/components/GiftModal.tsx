@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState } from 'react'
 import {
   Dialog,
   DialogTitle,
@@ -6,9 +6,7 @@ import {
   DialogActions,
   Button,
   TextField,
-  Autocomplete,
   Box,
-  Typography,
   Alert
 } from '@mui/material'
 import { useTranslation } from 'react-i18next'
@@ -18,6 +16,7 @@ import { booksApi } from '@/services/api/books'
 import { notificationsApi } from '@/services/api/notifications'
 import { useAuth } from '@/context/AuthContext'
 import { useNotification } from '@/context/NotificationContext'
+import UserSearchField from '@/components/UserSearchField'
 
 interface GiftModalProps {
   open: boolean
@@ -29,31 +28,11 @@ const GiftModal: React.FC<GiftModalProps> = ({ open, onClose, book }) => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [users, setUsers] = useState<User[]>([])
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
   const [message, setMessage] = useState('')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
 
-  useEffect(() => {
-    const fetchUsers = async () => {
-      try {
-        const allUsers = await usersApi.getAllUsers()
-        // Filter out current user and banned users
-        const filteredUsers = allUsers.filter(
-          u => u.id !== profile?.id && !u.is_banned
-        )
-        setUsers(filteredUsers)
-      } catch (err) {
-        console.error('Error fetching users:', err)
-      }
-    }
-
-    if (open) {
-      fetchUsers()
-    }
-  }, [open, profile])
-
   const handleSend = async () => {
     if (!selectedUser || !profile) return
 
@@ -109,24 +88,12 @@ const GiftModal: React.FC<GiftModalProps> = ({ open, onClose, book }) => {
         )}
 
         <Box sx={{ mt: 2 }}>
-          <Autocomplete
-            options={users}
-            getOptionLabel={(option) => option.username}
+          <UserSearchField
+            label="Select recipient"
             value={selectedUser}
-            onChange={(_, value) => setSelectedUser(value)}
-            renderInput={(params) => (
-              <TextField
-                {...params}
-                label="Select recipient"
-                required
-                fullWidth
-              />
-            )}
-            renderOption={(props, option) => (
-              <Box component="li" {...props}>
-                <Typography>{option.username}</Typography>
-              </Box>
-            )}
+            onChange={setSelectedUser}
+            exclude={u => u.id === profile?.id}
+            required
           />
 
           <TextField
@@ -125,7 +125,14 @@ const ReviewSection: React.FC<ReviewSectionProps> = ({ bookId }) => {
           )
         }
       }
-      await fetchReviews()
+
+      // The database trigger has adjusted likes_count; mirror it here
+      // instead of reloading every review
+      const delta = review.user_has_liked ? -1 : 1
+      setReviews(prev => prev.map(r => (r.id === review.id
+        ? { ...r, user_has_liked: !review.user_has_liked, likes_count: r.likes_count + delta }
+        : r
+      )))
     } catch (error) {
       console.error('Error liking review:', error)
     }
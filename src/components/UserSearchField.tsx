@@ -0,0 +1,101 @@
+import React, { useState, useEffect } from 'react'
+import {
+  Autocomplete,
+  TextField,
+  Box,
+  Typography,
+  CircularProgress,
+  SxProps,
+  Theme
+} from '@mui/material'
+import { User } from '@/types'
+import { usersApi } from '@/services/api/users'
+import { useDebounce } from '@/hooks/useDebounce'
+
+interface UserSearchFieldProps {
+  label: string
+  value: User | null
+  onChange: (user: User | null) => void
+  exclude?: (user: User) => boolean
+  required?: boolean
+  sx?: SxProps<Theme>
+}
+
+// Username picker that asks the server for matches as you type instead of
+// loading every user up front
+const UserSearchField: React.FC<UserSearchFieldProps> = ({
+  label,
+  value,
+  onChange,
+  exclude,
+  required,
+  sx
+}) => {
+  const [input, setInput] = useState('')
+  const [options, setOptions] = useState<User[]>([])
+  const [searching, setSearching] = useState(false)
+  const query = useDebounce(input.trim(), 300)
+
+  useEffect(() => {
+    if (!query) {
+      setOptions([])
+      setSearching(false)
+      return
+    }
+
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    setSearching(true)
+    usersApi.searchUsers(query)
+      .then(data => {
+        if (!cancelled) setOptions(data.filter(u => !u.is_banned))
+      })
+      .catch(error => console.error('Error searching users:', error))
+      .finally(() => {
+        if (!cancelled) setSearching(false)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [query])
+
+  return (
+    <Autocomplete
+      options={exclude ? options.filter(u => !exclude(u)) : options}
+      // The server already matched the options against the input
+      filterOptions={(x) => x}
+      getOptionLabel={(option) => option.username}
+      isOptionEqualToValue={(option, selected) => option.id === selected.id}
+      value={value}
+      onChange={(_, selected) => onChange(selected)}
+      onInputChange={(_, text) => setInput(text)}
+      loading={searching}
+      noOptionsText={query ? 'No users found' : 'Type a username'}
+      renderInput={(params) => (
+        <TextField
+          {...params}
+          label={label}
+          required={required}
+          fullWidth
+          InputProps={{
+            ...params.InputProps,
+            endAdornment: (
+              <>
+                {searching && <CircularProgress size={20} />}
+                {params.InputProps.endAdornment}
+              </>
+            ),
+          }}
+        />
+      )}
+      renderOption={(props, option) => (
+        <Box component="li" {...props}>
+          <Typography>{option.username}</Typography>
+        </Box>
+      )}
+      sx={sx}
+    />
+  )
+}
+
+export default UserSearchField
\ No newline at end of file
@@ -0,0 +1,13 @@
+import { useState, useEffect } from 'react'
+
+// Returns value once it has stopped changing for delay milliseconds
+export const useDebounce = <T>(value: T, delay = 300) => {
+  const [debouncedValue, setDebouncedValue] = useState(value)
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedValue(value), delay)
+    return () => clearTimeout(timer)
+  }, [value, delay])
+
+  return debouncedValue
+}
\ No newline at end of file
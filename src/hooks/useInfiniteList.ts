@@ -0,0 +1,82 @@
+import { useState, useEffect, useCallback, useRef, DependencyList } from 'react'
+import { Cursor, Page } from '@/services/api/pagination'
+
+// Loads a keyset-paginated list a page at a time. Attach sentinelRef to an
+// element below the list; the next page is fetched as it scrolls into view.
+// The list starts over from the first page whenever deps change.
+export const useInfiniteList = <T>(
+  fetchPage: (cursor: Cursor | null) => Promise<Page<T>>,
+  deps: DependencyList = []
+) => {
+  const [items, setItems] = useState<T[]>([])
+  const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [hasMore, setHasMore] = useState(false)
+  const [sentinel, setSentinel] = useState<Element | null>(null)
+  const fetchRef = useRef(fetchPage)
+  const cursorRef = useRef<Cursor | null>(null)
+  const busyRef = useRef(false)
+  // Bumped on reload so pages from an earlier run are dropped
+  const runRef = useRef(0)
+
+  fetchRef.current = fetchPage
+
+  const load = useCallback(async (reset: boolean) => {
+    if (busyRef.current && !reset) return
+
+    const run = reset ? ++runRef.current : runRef.current
+    busyRef.current = true
+    if (reset) {
+      cursorRef.current = null
+      setLoading(true)
+    } else {
+      setLoadingMore(true)
+    }
+
+    try {
+      const page = await fetchRef.current(cursorRef.current)
+      if (run !== runRef.current) return
+      cursorRef.current = page.nextCursor
+      setItems(prev => (reset ? page.items : [...prev, ...page.items]))
+      setHasMore(page.nextCursor !== null)
+    } catch (error) {
+      console.error('Error loading page:', error)
+      // Stop loading on scroll rather than retrying a failing request
+      if (run === runRef.current) setHasMore(false)
+    } finally {
+      if (run === runRef.current) {
+        busyRef.current = false
+        setLoading(false)
+        setLoadingMore(false)
+      }
+    }
+  }, [])
+
+  const reload = useCallback(() => load(true), [load])
+
+  useEffect(() => {
+    load(true)
+  }, deps)
+
+  // Re-observing after every page also catches a sentinel that is still
+  // visible because the page did not fill the screen
+  useEffect(() => {
+    if (!sentinel || !hasMore || loading || loadingMore) return
+
+    const observer = new IntersectionObserver(entries => {
+      if (entries.some(entry => entry.isIntersecting)) load(false)
+    }, { rootMargin: '200px' })
+    observer.observe(sentinel)
+    return () => observer.disconnect()
+  }, [sentinel, hasMore, loading, loadingMore, load])
+
+  return {
+    items,
+    setItems,
+    loading,
+    loadingMore,
+    hasMore,
+    reload,
+    sentinelRef: setSentinel
+  }
+}
\ No newline at end of file
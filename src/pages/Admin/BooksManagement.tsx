@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -27,13 +27,19 @@ import { supabase } from '@/services/supabase'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const BooksManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [books, setBooks] = useState<Book[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: books,
+    loading,
+    loadingMore,
+    reload: fetchBooks,
+    sentinelRef
+  } = useInfiniteList((cursor) => booksApi.getAll(cursor))
   const [dialogOpen, setDialogOpen] = useState(false)
   const [editingBook, setEditingBook] = useState<Book | null>(null)
   const [formData, setFormData] = useState({
@@ -46,21 +52,6 @@ const BooksManagement: React.FC = () => {
   const [coverFile, setCoverFile] = useState<File | null>(null)
   const [bookFile, setBookFile] = useState<File | null>(null)
 
-  useEffect(() => {
-    fetchBooks()
-  }, [])
-
-  const fetchBooks = async () => {
-    try {
-      const data = await booksApi.getAll()
-      setBooks(data)
-    } catch (error) {
-      console.error('Error fetching books:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleOpenDialog = (book?: Book) => {
     if (book) {
       setEditingBook(book)
@@ -243,6 +234,10 @@ const BooksManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog open={dialogOpen} onClose={handleCloseDialog} maxWidth="sm" fullWidth>
         <DialogTitle>{editingBook ? 'Edit Book' : 'Add Book'}</DialogTitle>
         <DialogContent>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -16,26 +16,31 @@ import {
   DialogContent,
   DialogActions,
   TextField,
-  Autocomplete,
-  Chip
+  Chip,
+  CircularProgress
 } from '@mui/material'
 import { Edit, Delete, Add, People, Upload } from '@mui/icons-material'
 import { DatePicker } from '@mui/x-date-pickers/DatePicker'
 import { useTranslation } from 'react-i18next'
 import { Course, CourseEnrollment, User } from '@/types'
 import { coursesApi } from '@/services/api/courses'
-import { usersApi } from '@/services/api/users'
 import { supabase } from '@/services/supabase'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
+import UserSearchField from '@/components/UserSearchField'
 
 const CoursesManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [courses, setCourses] = useState<Course[]>([])
-  const [users, setUsers] = useState<User[]>([])
+  const {
+    items: courses,
+    loadingMore,
+    reload: fetchData,
+    sentinelRef
+  } = useInfiniteList((cursor) => coursesApi.getAll(cursor))
   const [selectedCourse, setSelectedCourse] = useState<Course | null>(null)
   const [enrollments, setEnrollments] = useState<CourseEnrollment[]>([])
   const [dialogOpen, setDialogOpen] = useState(false)
@@ -52,23 +57,6 @@ const CoursesManagement: React.FC = () => {
   const [imageFile, setImageFile] = useState<File | null>(null)
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
 
-  useEffect(() => {
-    fetchData()
-  }, [])
-
-  const fetchData = async () => {
-    try {
-      const [coursesData, usersData] = await Promise.all([
-        coursesApi.getAll(),
-        usersApi.getAllUsers()
-      ])
-      setCourses(coursesData)
-      setUsers(usersData.filter(u => !u.is_banned))
-    } catch (error) {
-      console.error('Error fetching data:', error)
-    }
-  }
-
   const handleOpenDialog = (course?: Course) => {
     if (course) {
       setEditingCourse(course)
@@ -322,6 +310,10 @@ const CoursesManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       {/* Course Dialog */}
       <Dialog open={dialogOpen} onClose={handleCloseDialog} maxWidth="sm" fullWidth>
         <DialogTitle>{editingCourse ? 'Edit Course' : 'Add Course'}</DialogTitle>
@@ -418,14 +410,11 @@ const CoursesManagement: React.FC = () => {
         <DialogContent>
           <Box sx={{ mb: 3 }}>
             <Box sx={{ display: 'flex', gap: 2, mb: 2 }}>
-              <Autocomplete
-                options={users.filter(u => !enrollments.some(e => e.user_id === u.id))}
-                getOptionLabel={(option) => option.username}
+              <UserSearchField
+                label="Select user to enroll"
                 value={selectedUser}
-                onChange={(_, value) => setSelectedUser(value)}
-                renderInput={(params) => (
-                  <TextField {...params} label="Select user to enroll" />
-                )}
+                onChange={setSelectedUser}
+                exclude={u => enrollments.some(e => e.user_id === u.id)}
                 sx={{ flex: 1 }}
               />
               <Button
@@ -4,25 +4,35 @@ import {
   Grid,
   Paper,
   Typography,
-  CircularProgress
+  CircularProgress,
+  Tooltip
 } from '@mui/material'
 import {
   People,
   MenuBook,
   School,
-  AttachMoney
+  AttachMoney,
+  Payments
 } from '@mui/icons-material'
+import { format } from 'date-fns'
 import { useTranslation } from 'react-i18next'
+import { DashboardStats, DashboardStatsDay } from '@/types'
 import { adminApi } from '@/services/api/admin'
 
+const SERIES_DAYS = 30
+
+const formatMoney = (value: number) =>
+  `$${value.toLocaleString(undefined, { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`
+
 interface StatCardProps {
   title: string
   value: number
   icon: React.ReactNode
   color: string
+  formatValue?: (value: number) => string
 }
 
-const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color }) => (
+const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color, formatValue }) => (
   <Paper sx={{ p: 3, height: '100%' }}>
     <Box sx={{ display: 'flex', alignItems: 'center', mb: 2 }}>
       <Box
@@ -39,19 +49,59 @@ const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color }) => (
       <Typography variant="h6">{title}</Typography>
     </Box>
     <Typography variant="h3" fontWeight="bold">
-      {value.toLocaleString()}
+      {formatValue ? formatValue(value) : value.toLocaleString()}
     </Typography>
   </Paper>
 )
 
+interface SeriesChartProps {
+  title: string
+  series: DashboardStatsDay[]
+  metric: Exclude<keyof DashboardStatsDay, 'day'>
+  color: string
+  formatValue?: (value: number) => string
+}
+
+// One bar per day, scaled to the busiest day in the series
+const SeriesChart: React.FC<SeriesChartProps> = ({ title, series, metric, color, formatValue }) => {
+  const max = Math.max(1, ...series.map(day => day[metric]))
+  const total = series.reduce((sum, day) => sum + day[metric], 0)
+
+  return (
+    <Paper sx={{ p: 3, height: '100%' }}>
+      <Box sx={{ display: 'flex', justifyContent: 'space-between', mb: 2 }}>
+        <Typography variant="h6">{title}</Typography>
+        <Typography variant="h6" color="text.secondary">
+          {formatValue ? formatValue(total) : total.toLocaleString()}
+        </Typography>
+      </Box>
+      <Box sx={{ display: 'flex', alignItems: 'flex-end', gap: '2px', height: 120 }}>
+        {series.map(day => (
+          <Tooltip
+            key={day.day}
+            title={`${format(new Date(`${day.day}T00:00:00`), 'MMM dd')}: ${
+              formatValue ? formatValue(day[metric]) : day[metric].toLocaleString()
+            }`}
+          >
+            <Box
+              sx={{
+                flex: 1,
+                height: `${(day[metric] / max) * 100}%`,
+                minHeight: 2,
+                bgcolor: `${color}.main`,
+                borderRadius: '2px 2px 0 0'
+              }}
+            />
+          </Tooltip>
+        ))}
+      </Box>
+    </Paper>
+  )
+}
+
 const Dashboard: React.FC = () => {
   const { t } = useTranslation()
-  const [stats, setStats] = useState({
-    users: 0,
-    books: 0,
-    courses: 0,
-    transactions: 0
-  })
+  const [stats, setStats] = useState<DashboardStats | null>(null)
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
@@ -60,7 +110,7 @@ const Dashboard: React.FC = () => {
 
   const fetchStats = async () => {
     try {
-      const data = await adminApi.getDashboardStats()
+      const data = await adminApi.getDashboardStats(SERIES_DAYS)
       setStats(data)
     } catch (error) {
       console.error('Error fetching stats:', error)
@@ -77,11 +127,24 @@ const Dashboard: React.FC = () => {
     )
   }
 
+  if (!stats) {
+    return (
+      <Typography color="text.secondary">
+        Dashboard statistics are unavailable.
+      </Typography>
+    )
+  }
+
   return (
     <Box>
       <Typography variant="h4" gutterBottom>
         {t('dashboard')}
       </Typography>
+      {stats.refreshed_at && (
+        <Typography variant="body2" color="text.secondary" sx={{ mb: 2 }}>
+          Updated {format(new Date(stats.refreshed_at), 'MMM dd, yyyy HH:mm')}
+        </Typography>
+      )}
 
       <Grid container spacing={3}>
         <Grid item xs={12} sm={6} md={3}>
@@ -116,9 +179,42 @@ const Dashboard: React.FC = () => {
             color="error"
           />
         </Grid>
-      </Grid>
 
-      {/* Add more dashboard widgets here */}
+        <Grid item xs={12} md={4}>
+          <StatCard
+            title="Total Revenue"
+            value={stats.revenue}
+            icon={<Payments />}
+            color="success"
+            formatValue={formatMoney}
+          />
+        </Grid>
+        <Grid item xs={12} md={8}>
+          <SeriesChart
+            title={`Revenue, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="revenue"
+            color="success"
+            formatValue={formatMoney}
+          />
+        </Grid>
+        <Grid item xs={12} md={6}>
+          <SeriesChart
+            title={`New users, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="users"
+            color="primary"
+          />
+        </Grid>
+        <Grid item xs={12} md={6}>
+          <SeriesChart
+            title={`Transactions, last ${SERIES_DAYS} days`}
+            series={stats.series}
+            metric="transactions"
+            color="error"
+          />
+        </Grid>
+      </Grid>
     </Box>
   )
 }
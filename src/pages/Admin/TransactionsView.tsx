@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState } from 'react'
 import {
   Box,
   Typography,
@@ -22,38 +22,20 @@ import {
 import { Visibility } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
 import { Transaction } from '@/types'
-import { supabase } from '@/services/supabase'
+import { adminApi } from '@/services/api/admin'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const TransactionsView: React.FC = () => {
   const { t } = useTranslation()
-  const [transactions, setTransactions] = useState<Transaction[]>([])
-  const [loading, setLoading] = useState(true)
+  const {
+    items: transactions,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => adminApi.getTransactions(cursor))
   const [selectedTransaction, setSelectedTransaction] = useState<Transaction | null>(null)
   const [detailsOpen, setDetailsOpen] = useState(false)
 
-  useEffect(() => {
-    fetchTransactions()
-  }, [])
-
-  const fetchTransactions = async () => {
-    try {
-      const { data, error } = await supabase
-        .from('transactions')
-        .select(`
-          *,
-          user:users(id, username, email)
-        `)
-        .order('created_at', { ascending: false })
-
-      if (error) throw error
-      setTransactions(data || [])
-    } catch (error) {
-      console.error('Error fetching transactions:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleViewDetails = (transaction: Transaction) => {
     setSelectedTransaction(transaction)
     setDetailsOpen(true)
@@ -125,6 +107,10 @@ const TransactionsView: React.FC = () => {
         </Table>
       </TableContainer>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       <Dialog
         open={detailsOpen}
         onClose={() => setDetailsOpen(false)}
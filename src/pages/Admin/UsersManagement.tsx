@@ -31,47 +31,54 @@ import { usersApi } from '@/services/api/users'
 import { useAuth } from '@/context/AuthContext'
 import { adminApi } from '@/services/api/admin'
 import { useNotification } from '@/context/NotificationContext'
+import { useDebounce } from '@/hooks/useDebounce'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 
 const UsersManagement: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
   const { showNotification } = useNotification()
-  const [users, setUsers] = useState<User[]>([])
-  const [filteredUsers, setFilteredUsers] = useState<User[]>([])
+  const {
+    items: users,
+    loading,
+    loadingMore,
+    reload,
+    sentinelRef
+  } = useInfiniteList((cursor) => usersApi.getAllUsers(cursor))
+  const [results, setResults] = useState<User[] | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [loading, setLoading] = useState(true)
+  const [searchRun, setSearchRun] = useState(0)
   const [anchorEl, setAnchorEl] = useState<null | HTMLElement>(null)
   const [selectedUser, setSelectedUser] = useState<User | null>(null)
+  // Search the whole table on the server, not just the pages loaded so far
+  const debouncedQuery = useDebounce(searchQuery.trim(), 300)
 
   useEffect(() => {
-    fetchUsers()
-  }, [])
-
-  useEffect(() => {
-    if (searchQuery) {
-      const filtered = users.filter(
-        user =>
-          user.username.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          user.email.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-      setFilteredUsers(filtered)
-    } else {
-      setFilteredUsers(users)
+    if (!debouncedQuery) {
+      setResults(null)
+      return
     }
-  }, [searchQuery, users])
 
-  const fetchUsers = async () => {
-    try {
-      const data = await usersApi.getAllUsers()
-      setUsers(data)
-      setFilteredUsers(data)
-    } catch (error) {
-      console.error('Error fetching users:', error)
-    } finally {
-      setLoading(false)
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    usersApi.searchUsers(debouncedQuery, 50)
+      .then(data => {
+        if (!cancelled) setResults(data)
+      })
+      .catch(error => console.error('Error searching users:', error))
+    return () => {
+      cancelled = true
     }
+  }, [debouncedQuery, searchRun])
+
+  // Reloads the list and, while searching, the search results
+  const fetchUsers = () => {
+    reload()
+    setSearchRun(run => run + 1)
   }
 
+  const shownUsers = results ?? users
+
   const handleMenuOpen = (event: React.MouseEvent<HTMLElement>, user: User) => {
     setAnchorEl(event.currentTarget)
     setSelectedUser(user)
@@ -215,7 +222,7 @@ const UsersManagement: React.FC = () => {
             </TableRow>
           </TableHead>
           <TableBody>
-            {filteredUsers.map((user) => (
+            {shownUsers.map((user) => (
               <TableRow key={user.id}>
                 <TableCell>
                   <Avatar src={user.avatar_url} sx={{ width: 40, height: 40 }}>
@@ -261,6 +268,12 @@ const UsersManagement: React.FC = () => {
         </Table>
       </TableContainer>
 
+      {results === null && (
+        <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+          {loadingMore && <CircularProgress size={24} />}
+        </Box>
+      )}
+
       <Menu
         anchorEl={anchorEl}
         open={Boolean(anchorEl)}
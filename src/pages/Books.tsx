@@ -12,43 +12,48 @@ import { Search } from '@mui/icons-material'
 import { useTranslation } from 'react-i18next'
 import { Book } from '@/types'
 import { booksApi } from '@/services/api/books'
+import { useDebounce } from '@/hooks/useDebounce'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import BookCard from '@/components/BookCard'
 
 const BooksPage: React.FC = () => {
   const { t } = useTranslation()
-  const [books, setBooks] = useState<Book[]>([])
-  const [filteredBooks, setFilteredBooks] = useState<Book[]>([])
+  const {
+    items: books,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => booksApi.getAll(cursor))
+  const [results, setResults] = useState<Book[] | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [loading, setLoading] = useState(true)
+  const [searching, setSearching] = useState(false)
+  // Only query the server once typing pauses
+  const debouncedQuery = useDebounce(searchQuery.trim(), 300)
 
   useEffect(() => {
-    fetchBooks()
-  }, [])
-
-  useEffect(() => {
-    if (searchQuery) {
-      const filtered = books.filter(
-        book =>
-          book.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          book.description.toLowerCase().includes(searchQuery.toLowerCase())
-      )
-      setFilteredBooks(filtered)
-    } else {
-      setFilteredBooks(books)
+    if (!debouncedQuery) {
+      setResults(null)
+      setSearching(false)
+      return
     }
-  }, [searchQuery, books])
 
-  const fetchBooks = async () => {
-    try {
-      const data = await booksApi.getAll()
-      setBooks(data)
-      setFilteredBooks(data)
-    } catch (error) {
-      console.error('Error fetching books:', error)
-    } finally {
-      setLoading(false)
+    // Ignore responses that arrive after a newer query was sent
+    let cancelled = false
+    setSearching(true)
+    booksApi.search(debouncedQuery)
+      .then(data => {
+        if (!cancelled) setResults(data)
+      })
+      .catch(error => console.error('Error searching books:', error))
+      .finally(() => {
+        if (!cancelled) setSearching(false)
+      })
+    return () => {
+      cancelled = true
     }
-  }
+  }, [debouncedQuery])
+
+  const shownBooks = results ?? books
 
   if (loading) {
     return (
@@ -76,22 +81,34 @@ const BooksPage: React.FC = () => {
                 <Search />
               </InputAdornment>
             ),
+            endAdornment: searching && (
+              <InputAdornment position="end">
+                <CircularProgress size={20} />
+              </InputAdornment>
+            ),
           }}
         />
       </Paper>
 
       <Grid container spacing={3}>
-        {filteredBooks.map((book) => (
+        {shownBooks.map((book) => (
           <Grid item key={book.id} xs={12} sm={6} md={4} lg={3}>
             <BookCard book={book} />
           </Grid>
         ))}
       </Grid>
 
-      {filteredBooks.length === 0 && (
+      {/* More books load as this scrolls into view; search results are a single page */}
+      {results === null && (
+        <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+          {loadingMore && <CircularProgress size={24} />}
+        </Box>
+      )}
+
+      {shownBooks.length === 0 && !searching && (
         <Box textAlign="center" py={8}>
           <Typography variant="h6" color="text.secondary">
-            {searchQuery ? 'No books found matching your search.' : 'No books available.'}
+            {debouncedQuery ? 'No books found matching your search.' : 'No books available.'}
           </Typography>
         </Box>
       )}
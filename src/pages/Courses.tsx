@@ -6,35 +6,38 @@ import {
   CircularProgress
 } from '@mui/material'
 import { useTranslation } from 'react-i18next'
-import { Course, CourseEnrollment } from '@/types'
+import { CourseEnrollment } from '@/types'
 import { coursesApi } from '@/services/api/courses'
 import { useAuth } from '@/context/AuthContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import CourseCard from '@/components/CourseCard'
 
 const CoursesPage: React.FC = () => {
   const { t } = useTranslation()
   const { profile } = useAuth()
-  const [courses, setCourses] = useState<Course[]>([])
+  const {
+    items: courses,
+    loading,
+    loadingMore,
+    sentinelRef
+  } = useInfiniteList((cursor) => coursesApi.getAll(cursor))
   const [enrollments, setEnrollments] = useState<CourseEnrollment[]>([])
-  const [loading, setLoading] = useState(true)
 
   useEffect(() => {
-    fetchCourses()
+    fetchEnrollments()
   }, [profile])
 
-  const fetchCourses = async () => {
-    try {
-      const coursesData = await coursesApi.getAll()
-      setCourses(coursesData)
+  const fetchEnrollments = async () => {
+    if (!profile) {
+      setEnrollments([])
+      return
+    }
 
-      if (profile) {
-        const enrollmentsData = await coursesApi.getUserEnrollments(profile.id)
-        setEnrollments(enrollmentsData)
-      }
+    try {
+      const enrollmentsData = await coursesApi.getUserEnrollments(profile.id)
+      setEnrollments(enrollmentsData)
     } catch (error) {
-      console.error('Error fetching courses:', error)
-    } finally {
-      setLoading(false)
+      console.error('Error fetching enrollments:', error)
     }
   }
 
@@ -67,6 +70,10 @@ const CoursesPage: React.FC = () => {
         ))}
       </Grid>
 
+      <Box ref={sentinelRef} display="flex" justifyContent="center" py={2}>
+        {loadingMore && <CircularProgress size={24} />}
+      </Box>
+
       {courses.length === 0 && (
         <Box textAlign="center" py={8}>
           <Typography variant="h6" color="text.secondary">
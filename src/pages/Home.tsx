@@ -49,7 +49,7 @@ const HomePage: React.FC = () => {
             WebkitTextFillColor: 'transparent',
           }}
         >
-          React Academy
+          {'React Academy'}
         </Typography>
 
         <Typography
@@ -50,6 +50,7 @@ import { messagesApi } from '@/services/api/messages'
 import { notificationsApi } from '@/services/api/notifications'
 import { useAuth } from '@/context/AuthContext'
 import { useNotification } from '@/context/NotificationContext'
+import { useInfiniteList } from '@/hooks/useInfiniteList'
 import { getPublicUrl, uploadFile } from '@/services/supabase'
 
 interface TabPanelProps {
@@ -81,7 +82,6 @@ const ProfilePage: React.FC = () => {
   const [books, setBooks] = useState<BookOwnership[]>([])
   const [courses, setCourses] = useState<CourseEnrollment[]>([])
   const [badges, setBadges] = useState<UserBadge[]>([])
-  const [messages, setMessages] = useState<MessageType[]>([])
   const [giftHistory, setGiftHistory] = useState<BookOwnership[]>([])
   const [isBlocked, setIsBlocked] = useState(false)
 
@@ -97,6 +97,18 @@ const ProfilePage: React.FC = () => {
   const isOwnProfile = !userId || userId === currentUser?.id
   const profileId = userId || currentUser?.id
 
+  // Messages are private, so only the owner's profile pages through them
+  const {
+    items: messages,
+    loadingMore: loadingMoreMessages,
+    sentinelRef: messagesSentinelRef
+  } = useInfiniteList<MessageType>(
+    (cursor) => isOwnProfile && profileId
+      ? messagesApi.getUserMessages(profileId, cursor)
+      : Promise.resolve({ items: [], nextCursor: null }),
+    [profileId, isOwnProfile]
+  )
+
   useEffect(() => {
     if (profileId) {
       fetchProfile()
@@ -134,9 +146,6 @@ const ProfilePage: React.FC = () => {
 
       // Fetch additional data for own profile
       if (isOwnProfile) {
-        const messagesData = await messagesApi.getUserMessages(profileId!)
-        setMessages(messagesData)
-
         // Filter gift history
         const giftsReceived = booksData.filter((b: BookOwnership) => b.is_gift)
         setGiftHistory(giftsReceived)
@@ -644,6 +653,9 @@ const ProfilePage: React.FC = () => {
                 </ListItem>
               ))}
             </List>
+            <Box ref={messagesSentinelRef} display="flex" justifyContent="center" py={2}>
+              {loadingMoreMessages && <CircularProgress size={24} />}
+            </Box>
           </TabPanel>
 
           <TabPanel value={tabValue} index={3}>
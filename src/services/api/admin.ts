@@ -1,5 +1,6 @@
 import { supabase } from '../supabase'
-import { AdminLog } from '@/types'
+import { AdminLog, DashboardStats, Transaction } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const adminApi = {
   // Log admin action
@@ -20,41 +21,47 @@ export const adminApi = {
     return data as AdminLog
   },
 
-  // Get admin logs
-  async getLogs(limit = 100) {
-    const { data, error } = await supabase
-      .from('admin_logs')
-      .select(`
-        *,
-        admin:users(id, username)
-      `)
-      .order('created_at', { ascending: false })
-      .limit(limit)
+  // Get a page of admin logs, newest first
+  async getLogs(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase
+        .from('admin_logs')
+        .select(`
+          *,
+          admin:users(id, username)
+        `),
+      cursor,
+      limit
+    )
 
     if (error) throw error
-    return data as AdminLog[]
+    return toPage(data as AdminLog[], limit)
   },
 
-  // Get dashboard stats
-  async getDashboardStats() {
-    const [
-      { count: usersCount },
-      { count: booksCount },
-      { count: coursesCount },
-      { count: transactionsCount }
-    ] = await Promise.all([
-      supabase.from('users').select('*', { count: 'exact', head: true }),
-      supabase.from('books').select('*', { count: 'exact', head: true }),
-      supabase.from('courses').select('*', { count: 'exact', head: true }),
-      supabase.from('transactions').select('*', { count: 'exact', head: true })
-    ])
-
-    return {
-      users: usersCount || 0,
-      books: booksCount || 0,
-      courses: coursesCount || 0,
-      transactions: transactionsCount || 0
-    }
+  // Get a page of transactions with their buyers, newest first
+  async getTransactions(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase
+        .from('transactions')
+        .select(`
+          *,
+          user:users(id, username, email)
+        `),
+      cursor,
+      limit
+    )
+
+    if (error) throw error
+    return toPage(data as Transaction[], limit)
+  },
+
+  // Get dashboard totals and a daily series for the last `days` days in one
+  // call, read from the admin_daily_stats view rather than counting tables
+  async getDashboardStats(days = 30) {
+    const { data, error } = await supabase.rpc('get_dashboard_stats', { days })
+
+    if (error) throw error
+    return data as DashboardStats
   },
 
   // Badges management
@@ -1,16 +1,18 @@
 import { supabase } from '../supabase'
 import { Book, BookOwnership } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const booksApi = {
-  // Get all books
-  async getAll() {
-    const { data, error } = await supabase
-      .from('books')
-      .select('*')
-      .order('created_at', { ascending: false })
+  // Get a page of books, newest first
+  async getAll(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('books').select('*'),
+      cursor,
+      limit
+    )
 
     if (error) throw error
-    return data as Book[]
+    return toPage(data as Book[], limit)
   },
 
   // Get book by ID
@@ -25,6 +27,15 @@ export const booksApi = {
     return data as Book
   },
 
+  // Search books, best matches first (search_books RPC, served by the full-text and trigram indexes)
+  async search(query: string, limit = 20) {
+    const { data, error } = await supabase
+      .rpc('search_books', { query, result_limit: limit })
+
+    if (error) throw error
+    return data as Book[]
+  },
+
   // Create book
   async create(book: Omit<Book, 'id' | 'created_at' | 'updated_at'>) {
     const { data, error } = await supabase
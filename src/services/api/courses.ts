@@ -1,16 +1,19 @@
 import { supabase } from '../supabase'
 import { Course, CourseEnrollment } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const coursesApi = {
-  // Get all courses
-  async getAll() {
-    const { data, error } = await supabase
-      .from('courses')
-      .select('*')
-      .order('start_date', { ascending: false })
+  // Get a page of courses, latest start date first
+  async getAll(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('courses').select('*'),
+      cursor,
+      limit,
+      'start_date'
+    )
 
     if (error) throw error
-    return data as Course[]
+    return toPage(data as Course[], limit, 'start_date')
   },
 
   // Get course by ID
@@ -1,21 +1,35 @@
 import { supabase } from '../supabase'
 import { Message } from '@/types'
+import { Cursor, PAGE_SIZE, newestFirst, seek, toPage } from './pagination'
 
 export const messagesApi = {
-  // Get user's messages
-  async getUserMessages(userId: string) {
-    const { data, error } = await supabase
-      .from('messages')
-      .select(`
-        *,
-        sender:users!messages_sender_id_fkey(id, username, avatar_url),
-        recipient:users!messages_recipient_id_fkey(id, username, avatar_url)
-      `)
-      .or(`sender_id.eq.${userId},recipient_id.eq.${userId}`)
-      .order('created_at', { ascending: false })
+  // Get a page of the user's sent and received messages, newest first
+  async getUserMessages(userId: string, cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const page = (column: string) => seek(
+      supabase
+        .from('messages')
+        .select(`
+          *,
+          sender:users!messages_sender_id_fkey(id, username, avatar_url),
+          recipient:users!messages_recipient_id_fkey(id, username, avatar_url)
+        `)
+        .eq(column, userId),
+      cursor,
+      limit
+    )
 
-    if (error) throw error
-    return data as Message[]
+    // Each side reads its own (user, created_at, id) index; the next page
+    // of the combined list is the head of the two pages merged
+    const [sent, received] = await Promise.all([page('sender_id'), page('recipient_id')])
+    if (sent.error) throw sent.error
+    if (received.error) throw received.error
+
+    // Messages to oneself come back from both sides
+    const rows = new Map<string, Message>()
+    for (const message of [...sent.data, ...received.data] as Message[]) {
+      rows.set(message.id, message)
+    }
+    return toPage([...rows.values()].sort(newestFirst()), limit)
   },
 
   // Get conversation
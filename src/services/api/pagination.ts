@@ -0,0 +1,58 @@
+// Keyset pagination: every list is ordered newest first by (column, id) and
+// each page starts strictly after the last row of the previous one, so
+// Postgres reads one page from a composite index instead of the whole table.
+
+export const PAGE_SIZE = 20
+
+// Position of the last row on a page
+export interface Cursor {
+  value: string
+  id: string
+}
+
+export interface Page<T> {
+  items: T[]
+  nextCursor: Cursor | null
+}
+
+// PostgREST filter for rows after cursor in descending (column, id) order
+export const afterCursor = (cursor: Cursor, column = 'created_at') =>
+  `${column}.lt."${cursor.value}",and(${column}.eq."${cursor.value}",id.lt.${cursor.id})`
+
+// Orders query newest first, skips to cursor and fetches one extra row to
+// find out whether another page follows
+export const seek = (
+  query: any,
+  cursor: Cursor | null,
+  limit: number,
+  column = 'created_at'
+) => {
+  const after = cursor ? query.or(afterCursor(cursor, column)) : query
+  return after
+    .order(column, { ascending: false })
+    .order('id', { ascending: false })
+    .limit(limit + 1)
+}
+
+// Drops the extra row fetched by seek and points nextCursor at the last item
+export const toPage = <T extends { id: string }>(
+  rows: T[],
+  limit: number,
+  column = 'created_at'
+): Page<T> => {
+  const items = rows.slice(0, limit)
+  const last = items[items.length - 1]
+  return {
+    items,
+    nextCursor: rows.length > limit && last
+      ? { value: (last as any)[column], id: last.id }
+      : null
+  }
+}
+
+// Same order as seek, for merging pages fetched by separate queries.
+// PostgREST renders timestamps in UTC, so they compare correctly as strings.
+export const newestFirst = (column = 'created_at') => (a: any, b: any) => {
+  if (a[column] !== b[column]) return a[column] < b[column] ? 1 : -1
+  return a.id < b.id ? 1 : a.id > b.id ? -1 : 0
+}
\ No newline at end of file
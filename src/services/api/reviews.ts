@@ -2,14 +2,13 @@ import { supabase } from '../supabase'
 import { Review, ReviewReply } from '@/types'
 
 export const reviewsApi = {
-  // Get book reviews
+  // Get book reviews; likes_count is maintained by triggers on review_likes
   async getBookReviews(bookId: string) {
     const { data, error } = await supabase
       .from('reviews')
       .select(`
         *,
-        user:users!reviews_user_id_fkey(id, username, avatar_url, is_banned),
-        likes:review_likes(user_id)
+        user:users!reviews_user_id_fkey(id, username, avatar_url, is_banned)
       `)
       .eq('book_id', bookId)
       .order('created_at', { ascending: false })
@@ -19,14 +18,25 @@ export const reviewsApi = {
     // Filter out reviews from banned users
     const filteredData = (data || []).filter(review => !review.user?.is_banned)
     
-    // Add likes count and user_has_liked
+    // Look up which of them the current user liked: at most one row per review
     const currentUser = await supabase.auth.getUser()
     const userId = currentUser.data.user?.id
+    const liked = new Set<string>()
+
+    if (userId && filteredData.length > 0) {
+      const { data: likes, error: likesError } = await supabase
+        .from('review_likes')
+        .select('review_id, review:reviews!inner(book_id)')
+        .eq('user_id', userId)
+        .eq('review.book_id', bookId)
+
+      if (likesError) throw likesError
+      for (const like of likes || []) liked.add(like.review_id)
+    }
 
     return filteredData.map(review => ({
       ...review,
-      likes_count: review.likes?.length || 0,
-      user_has_liked: userId ? review.likes?.some((like: any) => like.user_id === userId) : false
+      user_has_liked: liked.has(review.id)
     })) as Review[]
   },
 
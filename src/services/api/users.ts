@@ -1,5 +1,6 @@
 import { supabase } from '../supabase'
 import { User, UserBadge, Certificate, BlockedUser } from '@/types'
+import { Cursor, PAGE_SIZE, seek, toPage } from './pagination'
 
 export const usersApi = {
   // Get user profile
@@ -155,12 +156,29 @@ export const usersApi = {
     if (authError) throw authError
   },
 
-  // Admin: Get all users
-  async getAllUsers() {
+  // Admin: Get a page of users, newest first
+  async getAllUsers(cursor: Cursor | null = null, limit = PAGE_SIZE) {
+    const { data, error } = await seek(
+      supabase.from('users').select('*'),
+      cursor,
+      limit
+    )
+
+    if (error) throw error
+    return toPage(data as User[], limit)
+  },
+
+  // Find users whose username or email contains query
+  async searchUsers(query: string, limit = 10) {
+    // Escape LIKE wildcards, then quote the pattern for the PostgREST filter
+    const like = `%${query.replace(/[%_\\]/g, '\\$&')}%`
+    const pattern = `"${like.replace(/["\\]/g, '\\$&')}"`
     const { data, error } = await supabase
       .from('users')
       .select('*')
-      .order('created_at', { ascending: false })
+      .or(`username.ilike.${pattern},email.ilike.${pattern}`)
+      .order('username')
+      .limit(limit)
 
     if (error) throw error
     return data as User[]
@@ -183,4 +183,23 @@ export interface AdminLog {
   details?: any
   created_at: string
   admin?: User
+}
+
+export interface DashboardStatsDay {
+  day: string
+  users: number
+  books: number
+  courses: number
+  transactions: number
+  revenue: number
+}
+
+export interface DashboardStats {
+  users: number
+  books: number
+  courses: number
+  transactions: number
+  revenue: number
+  refreshed_at: string | null
+  series: DashboardStatsDay[]
 }
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+Statistics helpers shared by bench.py and filler.py.
+
+Kept free of platform-specific imports, so the load generator in filler.py
+runs wherever Python does.
+"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
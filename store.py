@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for archived snapshots of generated trees.
+
+Runs of create_project() and filler1.py produce nearly identical trees, and
+so do tenants generated by tenants.py. The store keeps every distinct file
+once, zlib-compressed under objects/ and named by the SHA-256 of its
+content. A snapshot is only a manifest in snapshots/<name>.json mapping
+each path to its hash and size, so archiving another run costs the files
+that changed plus one small JSON file.
+
+    python store.py save . --name v1
+    python store.py restore v1 /tmp/restored --workers 8
+    python store.py list
+    python store.py du
+
+save() and gc() hold a lock file in the store while they run, so gc()
+never deletes objects a save() has written but not yet listed in its
+snapshot. A second save() or gc() fails instead of waiting.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from merged import tree_paths
+from scaffold import Emitter, content_hash, make_backend, safe_target, select_paths, write_atomic
+
+DEFAULT_STORE = '.scaffold-store'
+LOCK_NAME = 'lock'
+SNAPSHOT_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+
+
+class Store:
+    """Snapshots of generated trees, deduplicated by file content."""
+
+    def __init__(self, root=DEFAULT_STORE, level=6):
+        self.root = root
+        self.level = level
+        self.objects_dir = os.path.join(root, 'objects')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def snapshot_path(self, name):
+        if not SNAPSHOT_NAME.match(name):
+            raise ValueError(f"invalid snapshot name {name!r}")
+        return os.path.join(self.snapshots_dir, name + '.json')
+
+    @contextmanager
+    def lock(self):
+        """Hold the store's lock file; raise FileExistsError if another run holds it.
+
+        A lock left behind by a crashed run has to be deleted by hand.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, LOCK_NAME)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            raise FileExistsError(f"{path} exists: another save or gc is running "
+                                  f"(delete it if that run crashed)") from None
+        try:
+            os.write(fd, f"{os.getpid()}\n".encode('ascii'))
+            os.close(fd)
+            yield
+        finally:
+            os.remove(path)
+
+    def put(self, data):
+        """Store data unless an identical object exists; return its hash and whether it was new."""
+        digest = content_hash(data)
+        target = self.object_path(digest)
+        if os.path.exists(target):
+            return digest, False
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Atomic, so concurrent savers of the same content never see a partial object
+        write_atomic(target, zlib.compress(data, self.level))
+        return digest, True
+
+    def get(self, digest):
+        """Return the bytes of one object, verified against its hash."""
+        with open(self.object_path(digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if content_hash(data) != digest:
+            raise ValueError(f"corrupt object {digest} in {self.root}")
+        return data
+
+    def save(self, tree, name=None, paths=None, workers=8):
+        """Archive the files of tree (all of them, or just paths) as snapshot name.
+
+        Files are hashed and stored on a thread pool, under the store's lock.
+        Returns (name, stats) where stats counts the files and the distinct
+        objects this save added to the store.
+        """
+        name = name or time.strftime('%Y%m%dT%H%M%S')
+        target = self.snapshot_path(name)
+        if os.path.exists(target):
+            raise ValueError(f"snapshot {name!r} already exists in {self.root}")
+        if paths is None:
+            # The store may live inside the tree it archives; never archive the store itself
+            paths = tree_paths(tree, skip=[self.root])
+
+        def store_file(path):
+            with open(os.path.join(tree, path), 'rb') as f:
+                data = f.read()
+            digest, new = self.put(data)
+            return {'sha256': digest, 'size': len(data)}, new
+
+        with self.lock():
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(store_file, paths))
+            files = {path: entry for path, (entry, _) in zip(paths, results)}
+            manifest = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'files': files}
+            os.makedirs(self.snapshots_dir, exist_ok=True)
+            write_atomic(target, (json.dumps(manifest, indent=2) + '\n').encode('utf-8'))
+        # Two threads storing the same new content both report it as new; count it once
+        new_objects = len({entry['sha256'] for entry, new in results if new})
+        return name, {'files': len(files), 'new_objects': new_objects}
+
+    def manifest(self, name):
+        with open(self.snapshot_path(name), encoding='utf-8') as f:
+            return json.load(f)
+
+    def snapshots(self):
+        """Return the snapshot names, oldest first."""
+        try:
+            names = [name[:-5] for name in os.listdir(self.snapshots_dir) if name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+        return sorted(names, key=lambda name: self.manifest(name)['created'])
+
+    def restore(self, name, emitter, only=(), exclude=(), workers=8):
+        """Emit snapshot name through emitter; return the emitter's stats.
+
+        Files an incremental emitter already has are skipped by hash without
+        touching the store. The rest are read and decompressed on a thread
+        pool, and handed to the emitter in snapshot order. A snapshot with any
+        path outside emitter.root is refused whole, with ValueError.
+        """
+        files = self.manifest(name)['files']
+        for path in files:
+            safe_target(emitter.root, path)
+        wanted = [path for path in select_paths(files, only, exclude)
+                  if not emitter.keep(path, files[path]['sha256'], files[path]['size'])]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for path, data in zip(wanted, pool.map(self.get, [files[path]['sha256'] for path in wanted])):
+                emitter.emit(path, data, digest=files[path]['sha256'])
+        return emitter.close()
+
+    def delete(self, name):
+        """Remove a snapshot's manifest; its objects go at the next gc()."""
+        os.remove(self.snapshot_path(name))
+
+    def gc(self):
+        """Delete objects no snapshot refers to; return (objects, bytes) freed.
+
+        Runs under the store's lock, so never alongside a save().
+        """
+        removed = freed = 0
+        with self.lock():
+            live = {entry['sha256'] for name in self.snapshots()
+                    for entry in self.manifest(name)['files'].values()}
+            for digest, path in self._objects():
+                if digest not in live:
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+                    removed += 1
+        return removed, freed
+
+    def usage(self):
+        """Return the logical size of every snapshot combined and what the store takes on disk."""
+        logical = sum(entry['size'] for name in self.snapshots()
+                      for entry in self.manifest(name)['files'].values())
+        objects = list(self._objects())
+        stored = sum(os.path.getsize(path) for _, path in objects)
+        return {'snapshots': len(self.snapshots()), 'objects': len(objects),
+                'logical_bytes': logical, 'stored_bytes': stored}
+
+    def _objects(self):
+        try:
+            prefixes = os.listdir(self.objects_dir)
+        except FileNotFoundError:
+            return
+        for prefix in prefixes:
+            for rest in os.listdir(os.path.join(self.objects_dir, prefix)):
+                if not rest.endswith('.tmp'):
+                    yield prefix + rest, os.path.join(self.objects_dir, prefix, rest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Archive generated trees in a deduplicating store.')
+    parser.add_argument('--store', default=DEFAULT_STORE, help=f'store directory (default: {DEFAULT_STORE})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    save_parser = commands.add_parser('save', help='archive a generated tree')
+    save_parser.add_argument('tree', help='tree to archive')
+    save_parser.add_argument('--name', help='snapshot name (default: the current time)')
+    save_parser.add_argument('--workers', type=int, default=8, help='threads storing files (default: 8)')
+
+    restore_parser = commands.add_parser('restore', help='write a snapshot out as a tree')
+    restore_parser.add_argument('name')
+    restore_parser.add_argument('dest', help='directory to write into')
+    restore_parser.add_argument('--only', action='append', default=[], metavar='GLOB',
+                                help='restore only matching paths (repeatable)')
+    restore_parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                                help='skip matching paths (repeatable)')
+    restore_parser.add_argument('--incremental', action='store_true',
+                                help='skip files whose content hash is unchanged since the last restore')
+    restore_parser.add_argument('--workers', type=int, default=8,
+                                help='threads reading and writing files (default: 8)')
+
+    commands.add_parser('list', help='list snapshots')
+    rm_parser = commands.add_parser('rm', help='delete snapshots (run gc to free their files)')
+    rm_parser.add_argument('names', nargs='+')
+    commands.add_parser('gc', help='delete files no snapshot refers to')
+    commands.add_parser('du', help='show how much deduplication saves')
+    args = parser.parse_args(argv)
+
+    store = Store(args.store)
+    if args.command == 'save':
+        name, stats = store.save(args.tree, args.name, workers=args.workers)
+        print(f"Saved {name}: {stats['files']} files, {stats['new_objects']} new")
+    elif args.command == 'restore':
+        emitter = Emitter(root=args.dest, incremental=args.incremental, backend=make_backend(args.workers))
+        stats = store.restore(args.name, emitter, args.only, args.exclude, args.workers)
+        print(f"Restored {args.name}: written {stats['written']}, skipped {stats['skipped']}, "
+              f"removed {stats['removed']}")
+    elif args.command == 'list':
+        for name in store.snapshots():
+            manifest = store.manifest(name)
+            size = sum(entry['size'] for entry in manifest['files'].values())
+            print(f"{manifest['created']}  {len(manifest['files']):>5} files  {size:>10} bytes  {name}")
+    elif args.command == 'rm':
+        for name in args.names:
+            store.delete(name)
+    elif args.command == 'gc':
+        removed, freed = store.gc()
+        print(f"Removed {removed} objects ({freed} bytes)")
+    else:
+        usage = store.usage()
+        ratio = usage['stored_bytes'] / usage['logical_bytes'] if usage['logical_bytes'] else 0
+        print(f"{usage['snapshots']} snapshots, {usage['logical_bytes']} bytes of files "
+              f"stored as {usage['objects']} objects in {usage['stored_bytes']} bytes ({ratio:.1%})")
+
+
+if __name__ == "__main__":
+    main()
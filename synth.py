@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Synthesize a large codebase for bundle and typecheck scaling tests.
+
+Generates TSX modules shaped like the ones Code.py emits into
+src/synthetic/ of a generated project: API service objects over the
+Supabase client, React contexts wrapping them, and MUI pages consuming the
+contexts. Every module type-checks under the project's strict tsconfig
+(no unused locals, react-jsx), so `npm run build` (tsc && vite build) can
+be timed at 100, 1k or 10k modules:
+
+    python synth.py --modules 1000 --wire && time npm run build
+
+Modules come in (service, context, page) triples for one entity each, and
+a given --seed always produces the same code.
+"""
+
+import argparse
+import os
+import random
+
+from scaffold import Emitter, make_backend
+
+SYNTH_DIR = os.path.join('src', 'synthetic')
+FIELD_TYPES = ['string', 'number', 'boolean']
+# Import order for the MUI components a page uses
+MUI_COMPONENTS = ['Box', 'Grid', 'Typography', 'Card', 'CardContent', 'Button', 'CircularProgress']
+
+
+def entity_fields(rng):
+    """Pick 3-10 typed fields for an entity."""
+    return [(f"field_{i}", rng.choice(FIELD_TYPES)) for i in range(rng.randint(3, 10))]
+
+
+def service_module(name, table, fields):
+    interface = '\n'.join(f"  {field}: {ts_type}" for field, ts_type in fields)
+    return f'''import {{ supabase }} from '@/services/supabase'
+
+export interface {name} {{
+  id: string
+  created_at: string
+{interface}
+}}
+
+export const {table}Api = {{
+  // Get all rows
+  async getAll() {{
+    const {{ data, error }} = await supabase
+      .from('{table}')
+      .select('*')
+      .order('created_at', {{ ascending: false }})
+
+    if (error) throw error
+    return data as {name}[]
+  }},
+
+  // Get a single row
+  async getById(id: string) {{
+    const {{ data, error }} = await supabase
+      .from('{table}')
+      .select('*')
+      .eq('id', id)
+      .single()
+
+    if (error) throw error
+    return data as {name}
+  }},
+
+  // Create a row
+  async create(row: Omit<{name}, 'id' | 'created_at'>) {{
+    const {{ data, error }} = await supabase
+      .from('{table}')
+      .insert(row)
+      .select()
+      .single()
+
+    if (error) throw error
+    return data as {name}
+  }}
+}}
+'''
+
+
+def context_module(name, table):
+    return f'''import {{ createContext, useContext, useState, useEffect }} from 'react'
+import type {{ FC, ReactNode }} from 'react'
+import {{ {name}, {table}Api }} from '../services/{name}'
+
+interface {name}ContextType {{
+  items: {name}[]
+  loading: boolean
+  refresh: () => Promise<void>
+}}
+
+const {name}Context = createContext<{name}ContextType | undefined>(undefined)
+
+export const use{name} = () => {{
+  const context = useContext({name}Context)
+  if (!context) {{
+    throw new Error('use{name} must be used within a {name}Provider')
+  }}
+  return context
+}}
+
+export const {name}Provider: FC<{{ children: ReactNode }}> = ({{ children }}) => {{
+  const [items, setItems] = useState<{name}[]>([])
+  const [loading, setLoading] = useState(true)
+
+  const refresh = async () => {{
+    setLoading(true)
+    try {{
+      setItems(await {table}Api.getAll())
+    }} finally {{
+      setLoading(false)
+    }}
+  }}
+
+  useEffect(() => {{
+    refresh()
+  }}, [])
+
+  return (
+    <{name}Context.Provider value={{{{ items, loading, refresh }}}}>
+      {{children}}
+    </{name}Context.Provider>
+  )
+}}
+'''
+
+
+def page_module(name, fields, rng):
+    extras = rng.sample(['Grid', 'Card', 'Button'], 2)
+    components = [c for c in MUI_COMPONENTS
+                  if c in ['Box', 'Typography', 'CircularProgress'] + extras
+                  or (c == 'CardContent' and 'Card' in extras)]
+    shown = [field for field, _ in fields[:rng.randint(1, len(fields))]]
+    indent = ' ' * (18 if 'Card' in components else 14)
+    cells = '\n'.join(f"{indent}<Typography variant=\"body2\">{{String(item.{field})}}</Typography>"
+                      for field in shown)
+    if 'Card' in components:
+        item = f"""            <Card sx={{{{ mb: 2 }}}}>
+              <CardContent>
+{cells}
+              </CardContent>
+            </Card>"""
+    else:
+        item = f"""            <Box sx={{{{ mb: 2 }}}}>
+{cells}
+            </Box>"""
+    outer = 'Grid' if 'Grid' in components else 'Box'
+    cell_props = ' item xs={12} md={6}' if outer == 'Grid' else ''
+    list_props = ' container spacing={2}' if outer == 'Grid' else ''
+    items = f"""      <{outer}{list_props}>
+        {{items.map(item => (
+          <{outer}{cell_props} key={{item.id}}>
+{item}
+          </{outer}>
+        ))}}
+      </{outer}>"""
+    refresh = ''
+    if 'Button' in components:
+        refresh = """
+      <Button variant="outlined" onClick={refresh} sx={{ mb: 2 }}>
+        {t('refresh')}
+      </Button>"""
+    hook_values = 'items, loading, refresh' if refresh else 'items, loading'
+    imports = ',\n'.join(f"  {c}" for c in components)
+    return f'''import {{
+{imports}
+}} from '@mui/material'
+import {{ useTranslation }} from 'react-i18next'
+import {{ use{name} }} from '../contexts/{name}Context'
+
+const {name}Page = () => {{
+  const {{ t }} = useTranslation()
+  const {{ {hook_values} }} = use{name}()
+
+  if (loading) {{
+    return (
+      <Box display="flex" justifyContent="center" p={{4}}>
+        <CircularProgress />
+      </Box>
+    )
+  }}
+
+  return (
+    <Box>
+      <Typography variant="h4" gutterBottom>
+        {{t('{name}')}}
+      </Typography>{refresh}
+{items}
+    </Box>
+  )
+}}
+
+export default {name}Page
+'''
+
+
+def synthesize(modules, seed=0):
+    """Return {path relative to src/synthetic: source} for `modules` modules."""
+    rng = random.Random(seed)
+    files = {}
+    lazy = []
+    for index in range(modules):
+        entity, kind = divmod(index, 3)
+        name = f"Entity{entity:05d}"
+        table = f"entity{entity:05d}"
+        if kind == 0:
+            fields = entity_fields(rng)
+            files[f"services/{name}.ts"] = service_module(name, table, fields)
+        elif kind == 1:
+            files[f"contexts/{name}Context.tsx"] = context_module(name, table)
+        else:
+            files[f"pages/{name}Page.tsx"] = page_module(name, fields, rng)
+            lazy.append(f"  () => import('./pages/{name}Page'),")
+    # The registry has a side effect so bundlers keep every page chunk
+    files['index.ts'] = ('export const syntheticPages = [\n' + '\n'.join(lazy) + '\n]\n\n'
+                         ';(globalThis as any).__syntheticPages = syntheticPages\n')
+    return files
+
+
+def wire(root):
+    """Import the synthetic registry from src/main.tsx once, so vite bundles it."""
+    main = os.path.join(root, 'src', 'main.tsx')
+    line = "import './synthetic'\n"
+    with open(main, encoding='utf-8') as f:
+        content = f.read()
+    if line not in content:
+        with open(main, 'w', encoding='utf-8') as f:
+            f.write(line + content)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate synthetic TSX modules for scaling tests.')
+    parser.add_argument('--modules', type=int, default=100, help='number of modules (default: 100)')
+    parser.add_argument('--root', default='.', help='generated project to write into (default: .)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--workers', type=int, default=8, help='threads writing files (default: 8)')
+    parser.add_argument('--wire', action='store_true',
+                        help="import the modules from src/main.tsx so 'vite build' bundles them")
+    args = parser.parse_args(argv)
+
+    # A manifest inside src/synthetic lets a smaller run remove the extra modules of a larger one
+    emitter = Emitter(root=os.path.join(args.root, SYNTH_DIR), incremental=True,
+                      backend=make_backend(args.workers))
+    files = synthesize(args.modules, args.seed)
+    for path, content in files.items():
+        emitter.emit(path, content)
+    stats = emitter.close()
+    if args.wire:
+        wire(args.root)
+    size = sum(len(content) for content in files.values())
+    print(f"{args.modules} modules ({size} bytes) in {SYNTH_DIR}: written {stats['written']}, "
+          f"skipped {stats['skipped']}, removed {stats['removed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Compressed, indexed pack of the project templates.
+
+Code.py stays the place where templates are written, but importing it
+compiles every template literal. The pack stores the same files as
+individually zlib-compressed blobs behind a small JSON index
+(path -> offset, length, size, sha256). Readers memory-map the pack and only
+decompress the files they actually emit.
+
+Layout:
+    MAGIC
+    4-byte big-endian index length
+    JSON index: {"sources": {file: sha256}, "files": [[path, offset, length, size, sha256], ...]}
+    compressed blobs, offsets relative to the end of the index
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+from overlay import Overlay
+from scaffold import content_hash, write_atomic
+
+MAGIC = b'SCAFFOLDPACK1\n'
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK = os.path.join(HERE, 'templates.pack')
+FIXES_PACK = os.path.join(HERE, 'fixes.pack')
+# Files whose content a pack is built from; a change to any of them makes it stale
+SOURCES = ('Code.py',)
+FIXES_SOURCES = ('filler1.py',)
+
+
+def source_hashes(sources=SOURCES):
+    """Return {name: sha256} for the pack's source files."""
+    hashes = {}
+    for name in sources:
+        with open(os.path.join(HERE, name), 'rb') as f:
+            hashes[name] = content_hash(f.read())
+    return hashes
+
+
+def collect_templates():
+    """Return {path: content} for every template defined in Code.py."""
+    import Code
+    return Code.collect_templates()
+
+
+def collect_fixes():
+    """Return {path: content} for every fixed file defined in filler1.py."""
+    import filler1
+    return filler1.collect_fixes()
+
+
+def build_pack(files, pack_path=DEFAULT_PACK, sources=None, level=9):
+    """Write files ({path: str or bytes}) to a pack at pack_path."""
+    entries = []
+    blobs = []
+    offset = 0
+    for path, content in files.items():
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        blob = zlib.compress(data, level)
+        entries.append([path, offset, len(blob), len(data), content_hash(data)])
+        blobs.append(blob)
+        offset += len(blob)
+    index = json.dumps({'sources': sources or {}, 'files': entries},
+                       separators=(',', ':')).encode('utf-8')
+    write_atomic(pack_path, b''.join([MAGIC, struct.pack('>I', len(index)), index] + blobs))
+
+
+class TemplatePack:
+    """Read-only, memory-mapped view of a template pack."""
+
+    def __init__(self, pack_path=DEFAULT_PACK):
+        self.path = pack_path
+        with open(pack_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{pack_path} is not a template pack")
+        start = len(MAGIC)
+        (index_len,) = struct.unpack('>I', self._map[start:start + 4])
+        index = json.loads(self._map[start + 4:start + 4 + index_len])
+        self._data_start = start + 4 + index_len
+        self.sources = index['sources']
+        # path -> (offset, length, size, sha256), in the order the templates were defined
+        self.index = {entry[0]: tuple(entry[1:]) for entry in index['files']}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, path):
+        return path in self.index
+
+    def close(self):
+        self._map.close()
+
+    def paths(self):
+        """Return all template paths in definition order."""
+        return list(self.index)
+
+    def size(self, path):
+        """Return the uncompressed size of path."""
+        return self.index[path][2]
+
+    def sha256(self, path):
+        """Return the hex SHA-256 of path's uncompressed content."""
+        return self.index[path][3]
+
+    def read(self, path):
+        """Decompress and return the bytes of a single template."""
+        offset, length, size, digest = self.index[path]
+        start = self._data_start + offset
+        data = zlib.decompress(self._map[start:start + length])
+        if len(data) != size or content_hash(data) != digest:
+            raise ValueError(f"corrupt template {path!r} in {self.path}")
+        return data
+
+    def is_current(self, sources=SOURCES):
+        """True if the pack was built from the current source files."""
+        return self.sources == source_hashes(sources)
+
+
+def load_pack(pack_path=DEFAULT_PACK, collect=collect_templates, rebuild=False, sources=SOURCES):
+    """Open a template pack, (re)building it first if missing or stale."""
+    if not rebuild and os.path.exists(pack_path):
+        pack = TemplatePack(pack_path)
+        if pack.is_current(sources):
+            return pack
+        pack.close()
+    build_pack(collect(), pack_path, sources=source_hashes(sources))
+    return TemplatePack(pack_path)
+
+
+def load_fixes_pack(collect=collect_fixes, rebuild=False):
+    """Open the pack of filler1.py fixes, (re)building it if needed."""
+    return load_pack(FIXES_PACK, collect, rebuild, FIXES_SOURCES)
+
+
+def open_templates(fixes=False, collect=collect_templates):
+    """Return an Overlay of the template pack, topped with filler1.py's fixes if asked.
+
+    collect is used to rebuild a stale template pack; Code.py passes its own
+    collect_templates so running it as a script never imports it twice.
+    """
+    layers = [('base', load_pack(collect=collect))]
+    if fixes:
+        layers.append(('fixes', load_fixes_pack()))
+    return Overlay(layers)
+
+
+if __name__ == "__main__":
+    rebuild = '--rebuild' in sys.argv[1:]
+    for pack in (load_pack(rebuild=rebuild), load_fixes_pack(rebuild=rebuild)):
+        with pack:
+            compressed = sum(entry[1] for entry in pack.index.values())
+            original = sum(entry[2] for entry in pack.index.values())
+            print(f"{pack.path}: {len(pack.index)} templates, {original} bytes -> {compressed} bytes compressed")
@@ -0,0 +1,113 @@
+"""
+Parameterized rendering of the project templates.
+
+The templates are plain text with one set of deployment values hard-coded:
+the site name (README, index.html, manifest.json, header, footer, home page,
+site settings) and the .env credentials. A template is compiled once into
+a Plan: the literal chunks between occurrences of those values, plus the
+parameter filling each gap. Rendering a variant is then a single join over
+precomputed chunks, so thousands of variants stay linear in output size.
+"""
+
+import html
+import json
+import os
+import re
+
+SITE_NAME = 'React Academy'
+# Parameter -> .env variable holding the template's default value
+ENV_PARAMS = {
+    'supabase_url': 'VITE_SUPABASE_URL',
+    'supabase_anon_key': 'VITE_SUPABASE_ANON_KEY',
+    'paymob_api_key': 'VITE_PAYMOB_API_KEY',
+    'paymob_iframe_id': 'VITE_PAYMOB_IFRAME_ID',
+}
+PARAMS = ('site_name',) + tuple(ENV_PARAMS)
+
+
+def _json_string(value):
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+def _js_string(value):
+    # The site name in TSX sits in a single-quoted string literal, in code or in a JSX {'...'}
+    return _json_string(value).replace("'", "\\'")
+
+
+def _sql_json_string(value):
+    # The site name in SQL sits in a JSON document inside a quoted string literal
+    return _json_string(value).replace("'", "''")
+
+
+# Values are escaped for the file they land in; other files get them verbatim
+ESCAPERS = {
+    '.json': _json_string,
+    '.html': html.escape,
+    '.tsx': _js_string,
+    '.sql': _sql_json_string,
+}
+
+
+def template_defaults(templates):
+    """Return {param: value} for the values hard-coded in the templates."""
+    env = {}
+    for line in templates.read('.env').decode('utf-8').splitlines():
+        if '=' in line:
+            key, value = line.split('=', 1)
+            env[key] = value
+    defaults = {'site_name': SITE_NAME}
+    defaults.update({param: env[var] for param, var in ENV_PARAMS.items()})
+    return defaults
+
+
+class Plan:
+    """A template split into literal chunks and the parameter slots between them."""
+
+    __slots__ = ('chunks', 'slots', 'escape')
+
+    def __init__(self, chunks, slots, escape=None):
+        # len(chunks) == len(slots) + 1
+        self.chunks = chunks
+        self.slots = slots
+        self.escape = escape
+
+    def render(self, values):
+        """Render with values ({param: str}); every slot must have a value."""
+        if not self.slots:
+            return self.chunks[0]
+        escape = self.escape
+        parts = [None] * (2 * len(self.slots) + 1)
+        parts[::2] = self.chunks
+        parts[1::2] = [escape(values[slot]) if escape else values[slot] for slot in self.slots]
+        return ''.join(parts)
+
+
+class Compiler:
+    """Compile templates into Plans for a fixed set of default values."""
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+        self.by_value = {value: param for param, value in defaults.items()}
+        # Longest first, so a value that contains another one wins
+        values = sorted(self.by_value, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(value) for value in values))
+
+    def compile(self, path, content):
+        """Return the Plan for content, or None if it holds no parameter."""
+        chunks = []
+        slots = []
+        pos = 0
+        for match in self.pattern.finditer(content):
+            chunks.append(content[pos:match.start()])
+            slots.append(self.by_value[match.group()])
+            pos = match.end()
+        if not slots:
+            return None
+        chunks.append(content[pos:])
+        return Plan(chunks, slots, ESCAPERS.get(os.path.splitext(path)[1]))
+
+    def values(self, params):
+        """Merge params over the defaults, ignoring empty values."""
+        values = dict(self.defaults)
+        values.update({key: value for key, value in params.items() if key in values and value})
+        return values
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Generate one academy workspace per tenant in a single run.
+
+Each tenant gets its own site name, Supabase project and Paymob account
+(see templating.PARAMS). Templates that contain none of these values are
+shared: they are read from the pack once and handed to every tenant
+unchanged. The parameterized ones are compiled once into substitution
+plans and rendered per tenant. Tenants are spread across a process pool.
+
+    python tenants.py tenants.csv --out workspaces --processes 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from scaffold import Emitter
+from templatepack import open_templates
+from templating import PARAMS, Compiler, template_defaults
+
+TENANT_ID = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+
+
+def load_tenants(path):
+    """Read tenants from a CSV file with a header row or a JSON list of objects.
+
+    Every tenant needs an 'id', used as its directory name; any of PARAMS
+    left out or empty keeps the template's value.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            tenants = json.load(f)
+        else:
+            tenants = list(csv.DictReader(f))
+    seen = set()
+    for tenant in tenants:
+        tenant_id = tenant.get('id') or ''
+        if not TENANT_ID.match(tenant_id):
+            raise ValueError(f"invalid tenant id {tenant_id!r} in {path}")
+        if tenant_id in seen:
+            raise ValueError(f"duplicate tenant id {tenant_id!r} in {path}")
+        seen.add(tenant_id)
+    return tenants
+
+
+def compile_templates(templates, compiler, paths):
+    """Split paths into shared {path: (bytes, sha256)} and parameterized {path: Plan}."""
+    shared = {}
+    plans = {}
+    for path in paths:
+        data = templates.read(path)
+        plan = compiler.compile(path, data.decode('utf-8'))
+        if plan is None:
+            shared[path] = (data, templates.sha256(path))
+        else:
+            plans[path] = plan
+    return shared, plans
+
+
+# Per-worker state, set once by _init_worker rather than pickled with every tenant
+_shared = _plans = _compiler = None
+
+
+def _init_worker(shared, plans, compiler):
+    global _shared, _plans, _compiler
+    _shared, _plans, _compiler = shared, plans, compiler
+
+
+def _generate_tenant(tenant, out_dir, incremental):
+    emitter = Emitter(root=os.path.join(out_dir, tenant['id']), incremental=incremental)
+    for path, (data, digest) in _shared.items():
+        emitter.emit(path, data, digest=digest)
+    values = _compiler.values(tenant)
+    for path, plan in _plans.items():
+        emitter.emit(path, plan.render(values))
+    return tenant['id'], emitter.close()
+
+
+def generate_tenants(tenants, out_dir, processes=None, fixes=False, incremental=False):
+    """Generate a workspace under out_dir for every tenant.
+
+    Yields (tenant id, emitter stats) in tenant order.
+    """
+    with open_templates(fixes) as templates:
+        compiler = Compiler(template_defaults(templates))
+        shared, plans = compile_templates(templates, compiler, templates.paths())
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(shared, plans, compiler)) as pool:
+        futures = [pool.submit(_generate_tenant, tenant, out_dir, incremental) for tenant in tenants]
+        for future in futures:
+            yield future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate one academy workspace per tenant.')
+    parser.add_argument('tenants', help='CSV (with header) or JSON file of tenants; columns: id, '
+                                        + ', '.join(PARAMS))
+    parser.add_argument('--out', default='workspaces', help='output directory (default: workspaces)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--with-fixes', action='store_true',
+                        help="layer filler1.py's fixes over the templates")
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip files whose content hash is unchanged since the last run')
+    args = parser.parse_args(argv)
+
+    tenants = load_tenants(args.tenants)
+    for tenant_id, stats in generate_tenants(tenants, args.out, args.processes,
+                                             args.with_fixes, args.incremental):
+        print(f"{tenant_id}: written {stats['written']}, skipped {stats['skipped']}, "
+              f"removed {stats['removed']}")
+    print(f"\nGenerated {len(tenants)} workspaces in {args.out}")
+
+
+if __name__ == "__main__":
+    main()